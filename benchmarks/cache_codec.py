@@ -0,0 +1,108 @@
+"""Encode/decode time and size of cache values of every key family by codec.
+
+Needs neither DB nor Redis, values are generated in memory:
+
+    python -m benchmarks.cache_codec --rounds 2000
+
+Sizes include the format header. Page families hold `PAGE_LIMIT` items,
+`all data` is the tree of `--menus` menus with `--submenus` submenus and
+`--dishes` dishes per submenu.
+"""
+import argparse
+import decimal
+import time
+import uuid
+from typing import Any
+
+from src.cache.codec import CODECS, Codec, decode, encode
+from src.config import settings
+from src.db.dto import DishDTO, MenuDTO, MenuTreeDTO, SubmenuDTO, SubmenuTreeDTO
+
+
+def menu(n: int = 1) -> MenuDTO:
+    return MenuDTO(uuid.uuid4(), f'My menu {n}', f'My menu description {n}', 10, 200)
+
+
+def submenu(n: int = 1) -> SubmenuDTO:
+    return SubmenuDTO(uuid.uuid4(), f'My submenu {n}', f'My submenu description {n}', uuid.uuid4(), 20)
+
+
+def dish(n: int = 1) -> DishDTO:
+    return DishDTO(
+        uuid.uuid4(), f'My dish {n}', f'My dish description {n}', uuid.uuid4(), decimal.Decimal(f'{n}.50'),
+    )
+
+
+def tree(menus: int, submenus: int, dishes: int) -> list[MenuTreeDTO]:
+    """Tree of all data, strings differ as in a real catalog."""
+
+    return [
+        MenuTreeDTO(
+            uuid.uuid4(), f'My menu {m}', f'My menu description {m}',
+            [
+                SubmenuTreeDTO(
+                    uuid.uuid4(), f'My submenu {m}.{s}', f'My submenu description {m}.{s}',
+                    [dish(d) for d in range(dishes)],
+                )
+                for s in range(submenus)
+            ],
+        )
+        for m in range(menus)
+    ]
+
+
+def families(menus: int, submenus: int, dishes: int) -> dict[str, Any]:
+    """Typical value of every cache key family."""
+
+    limit = settings.PAGE_LIMIT
+
+    return {
+        'menu detail': menu(),
+        'menus page': [menu(n) for n in range(limit)],
+        'submenu detail': submenu(),
+        'submenus page': [submenu(n) for n in range(limit)],
+        'dish detail': dish(),
+        'dishes page': [dish(n) for n in range(limit)],
+        'all data': tree(menus, submenus, dishes),
+        'discount': '25',
+    }
+
+
+def measure(codec: Codec, value: Any, rounds: int) -> tuple[float, float, int]:
+    """Average encode and decode microseconds and encoded size in bytes."""
+
+    data = encode(value, codec)
+    assert decode(data) == value
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode(value, codec)
+    encoded = time.perf_counter()
+    for _ in range(rounds):
+        decode(data)
+    decoded = time.perf_counter()
+
+    return (
+        (encoded - started) / rounds * 1_000_000,
+        (decoded - encoded) / rounds * 1_000_000,
+        len(data),
+    )
+
+
+def main(menus: int, submenus: int, dishes: int, rounds: int) -> None:
+    print(f'{"family":<16} {"codec":<8} {"encode":>12} {"decode":>12} {"size":>10}')
+    for family, value in families(menus, submenus, dishes).items():
+        for name, codec in CODECS.items():
+            encode_time, decode_time, size = measure(codec, value, rounds)
+            print(f'{family:<16} {name:<8} {encode_time:>10.1f}us {decode_time:>10.1f}us {size:>9}B')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--menus', type=int, default=10)
+    parser.add_argument('--submenus', type=int, default=5, help='submenus per menu')
+    parser.add_argument('--dishes', type=int, default=10, help='dishes per submenu')
+    parser.add_argument('--rounds', type=int, default=1000)
+    args = parser.parse_args()
+
+    main(args.menus, args.submenus, args.dishes, args.rounds)
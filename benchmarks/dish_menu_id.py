@@ -0,0 +1,134 @@
+"""Dish reads with the EXISTS subquery on submenus vs denormalized `menu_id`.
+
+Seeds about a million dishes into the DB configured in the environment (see
+`.env.example`). All tables are truncated, so use a disposable database:
+
+    python -m benchmarks.dish_menu_id --menus 10000 --rounds 500
+
+`exists` is the old filter, `submenu.has(menu_id=...)`, which makes Postgres
+probe submenus for every dish of the submenu. `menu_id` is the current
+repository statement, served from the dishes index alone.
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.api.repositories.dish import DishRepository
+from src.config import settings
+from src.db import models
+from src.db.core import engine
+
+SEED = """
+    INSERT INTO menus (id, title, description)
+    SELECT gen_random_uuid(), 'menu ' || m, 'menu'
+    FROM generate_series(1, :menus) AS m;
+
+    INSERT INTO submenus (id, title, description, menu_id)
+    SELECT gen_random_uuid(), 'submenu ' || s, 'submenu', menus.id
+    FROM menus, generate_series(1, :submenus) AS s;
+
+    INSERT INTO dishes (id, title, description, price, submenu_id, menu_id)
+    SELECT gen_random_uuid(), 'dish ' || d, 'dish', 10.50, submenus.id, submenus.menu_id
+    FROM submenus, generate_series(1, :dishes) AS d;
+"""
+
+
+def exists_statements() -> dict:
+    """Dish statements as they were built before `dishes.menu_id`."""
+
+    list_statement = select(
+        models.Dish.id,
+        models.Dish.title,
+        models.Dish.description,
+        models.Dish.price,
+        models.Dish.submenu_id,
+    ).where(
+        models.Dish.submenu.has(menu_id=bindparam('menu_id')),
+        models.Dish.submenu_id == bindparam('submenu_id'),
+    )
+
+    return {
+        'list': list_statement.order_by(models.Dish.id).limit(bindparam('limit')),
+        'detail': list_statement.where(models.Dish.id == bindparam('dish_id')),
+    }
+
+
+def menu_id_statements() -> dict:
+    """Current repository statements."""
+
+    return {
+        'list': DishRepository.list_statement,
+        'detail': DishRepository.detail_statement,
+    }
+
+
+async def seed(conn: AsyncConnection, menus: int, submenus: int, dishes: int) -> None:
+    """Fill DB with generated data, counters are not needed here."""
+
+    await conn.execute(text('TRUNCATE menus, submenus, dishes, menu_tree'))
+    await conn.execute(text('ALTER TABLE submenus DISABLE TRIGGER USER'))
+    await conn.execute(text('ALTER TABLE dishes DISABLE TRIGGER USER'))
+    for statement in SEED.split(';'):
+        if statement.strip():
+            await conn.execute(
+                text(statement).bindparams(menus=menus, submenus=submenus, dishes=dishes),
+            )
+    await conn.execute(text('ALTER TABLE submenus ENABLE TRIGGER USER'))
+    await conn.execute(text('ALTER TABLE dishes ENABLE TRIGGER USER'))
+
+
+async def measure(conn: AsyncConnection, statement, params: list[dict]) -> float:
+    """Average milliseconds per query over the given parameter sets."""
+
+    await conn.execute(statement, params[0])
+
+    started = time.perf_counter()
+    for values in params:
+        (await conn.execute(statement, values)).all()
+    return (time.perf_counter() - started) / len(params) * 1000
+
+
+async def main(menus: int, submenus: int, dishes: int, rounds: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        await seed(conn, menus, submenus, dishes)
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level='AUTOCOMMIT')
+        await conn.execute(text('ANALYZE menus, submenus, dishes'))
+
+        rows = await conn.execute(
+            text('SELECT menu_id, submenu_id, id FROM dishes TABLESAMPLE SYSTEM (1) LIMIT :rounds'),
+            {'rounds': rounds},
+        )
+        params = [
+            {'menu_id': menu_id, 'submenu_id': submenu_id, 'dish_id': dish_id, 'limit': settings.PAGE_LIMIT}
+            for menu_id, submenu_id, dish_id in rows
+        ]
+
+        old, new = exists_statements(), menu_id_statements()
+
+        print(f'{menus * submenus * dishes} dishes, {len(params)} queries per statement')
+        print(f'{"query":<8} {"exists":>10} {"menu_id":>10}')
+        for name in old:
+            print(
+                f'{name:<8}'
+                f' {await measure(conn, old[name], params):>8.3f}ms'
+                f' {await measure(conn, new[name], params):>8.3f}ms'
+            )
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--menus', type=int, default=10000)
+    parser.add_argument('--submenus', type=int, default=10, help='submenus per menu')
+    parser.add_argument('--dishes', type=int, default=10, help='dishes per submenu')
+    parser.add_argument('--rounds', type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.menus, args.submenus, args.dishes, args.rounds))
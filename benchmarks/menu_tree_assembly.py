@@ -0,0 +1,69 @@
+"""Time of building the whole menu tree by every tree assembler.
+
+Seeds a synthetic catalog into the DB configured in the environment (see
+`.env.example`). All tables are truncated, so use a disposable database:
+
+    python -m benchmarks.menu_tree_assembly --menus 1000 --submenus 10 --dishes 20
+
+`joinedload` is the old menus x submenus x dishes eager load rebuilt by
+`Menu.as_dict`, `flat` stitches three flat queries, `json_agg` builds the
+document in Postgres and `materialized` reads the prebuilt read model. The
+fastest one can be set as `MENU_TREE_ASSEMBLER`.
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from benchmarks.dish_menu_id import seed
+from src.db import models
+from src.db.core import async_session, engine
+from src.db.read_models import MENU_TREE_QUERY
+from src.db.tree import TREE_ASSEMBLERS, get_tree_assembler
+
+
+async def measure(name: str, rounds: int) -> tuple[float, int]:
+    """Average milliseconds per assembled tree and number of menus."""
+
+    assembler = get_tree_assembler(name)
+
+    async with async_session() as session:
+        tree = await assembler.assemble(session)
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await assembler.assemble(session)
+
+    return (time.perf_counter() - started) / rounds * 1000, len(tree)
+
+
+async def main(menus: int, submenus: int, dishes: int, rounds: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        await seed(conn, menus, submenus, dishes)
+        await conn.execute(text(f'INSERT INTO menu_tree (id, document) {MENU_TREE_QUERY}'))
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level='AUTOCOMMIT')
+        await conn.execute(text('ANALYZE menus, submenus, dishes, menu_tree'))
+
+    print(f'{menus} menus, {menus * submenus} submenus, {menus * submenus * dishes} dishes')
+    print(f'{"assembler":<14} {"time":>12}')
+    for name in TREE_ASSEMBLERS:
+        elapsed, size = await measure(name, rounds)
+        assert size == menus
+        print(f'{name:<14} {elapsed:>10.1f}ms')
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--menus', type=int, default=1000)
+    parser.add_argument('--submenus', type=int, default=10, help='submenus per menu')
+    parser.add_argument('--dishes', type=int, default=20, help='dishes per submenu')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.menus, args.submenus, args.dishes, args.rounds))
@@ -0,0 +1,118 @@
+"""Cache-miss reads through the ORM result path vs the raw asyncpg path.
+
+Seeds a catalog into the DB configured in the environment (see
+`.env.example`). All tables are truncated, so use a disposable database:
+
+    python -m benchmarks.raw_reads --rounds 2000
+
+Every request is a repository read plus serialization with the endpoint
+response model, i.e. the work of a request that missed the cache. `orm`
+is the default path, `raw` is the one enabled by `DB_RAW_READS`. Latency
+is wall time, CPU is process time spent per request.
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from benchmarks.dish_menu_id import seed
+from src.api.repositories.dish import DishRepository
+from src.api.repositories.menu import MenuRepository
+from src.api.repositories.submenu import SubmenuRepository
+from src.api.schemas import DishResponse, MenuResponse, SubmenuResponse
+from src.config import settings
+from src.db import models
+from src.db.core import async_session, engine
+
+
+def requests(ids: dict) -> dict[str, tuple[Callable[..., Awaitable], TypeAdapter]]:
+    """Repository reads of list and detail endpoints with response models."""
+
+    limit = settings.PAGE_LIMIT
+
+    return {
+        'menus list': (
+            lambda session: MenuRepository(session).get_list(limit=limit),
+            TypeAdapter(list[MenuResponse]),
+        ),
+        'menu detail': (
+            lambda session: MenuRepository(session).get_detail(ids['menu_id']),
+            TypeAdapter(MenuResponse),
+        ),
+        'submenus list': (
+            lambda session: SubmenuRepository(session).get_list(menu_id=ids['menu_id'], limit=limit),
+            TypeAdapter(list[SubmenuResponse]),
+        ),
+        'submenu detail': (
+            lambda session: SubmenuRepository(session).get_detail(
+                menu_id=ids['menu_id'], submenu_id=ids['submenu_id'],
+            ),
+            TypeAdapter(SubmenuResponse),
+        ),
+        'dishes list': (
+            lambda session: DishRepository(session).get_list(
+                menu_id=ids['menu_id'], submenu_id=ids['submenu_id'], limit=limit,
+            ),
+            TypeAdapter(list[DishResponse]),
+        ),
+        'dish detail': (
+            lambda session: DishRepository(session).get_detail(
+                menu_id=ids['menu_id'], submenu_id=ids['submenu_id'], dish_id=ids['dish_id'],
+            ),
+            TypeAdapter(DishResponse),
+        ),
+    }
+
+
+async def measure(read: Callable[..., Awaitable], adapter: TypeAdapter, rounds: int) -> tuple[float, float]:
+    """Average wall and CPU milliseconds per request."""
+
+    async with async_session() as session:
+        adapter.dump_json(await read(session))
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(rounds):
+        async with async_session() as session:
+            adapter.dump_json(await read(session))
+
+    return (
+        (time.perf_counter() - wall) / rounds * 1000,
+        (time.process_time() - cpu) / rounds * 1000,
+    )
+
+
+async def main(menus: int, submenus: int, dishes: int, rounds: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        await seed(conn, menus, submenus, dishes)
+        row = (await conn.execute(text('SELECT menu_id, submenu_id, id FROM dishes LIMIT 1'))).one()
+
+    ids = {'menu_id': row.menu_id, 'submenu_id': row.submenu_id, 'dish_id': row.id}
+
+    print(f'{"request":<16} {"orm wall":>10} {"orm cpu":>10} {"raw wall":>10} {"raw cpu":>10}')
+    for name, (read, adapter) in requests(ids).items():
+        settings.DB_RAW_READS = False
+        orm_wall, orm_cpu = await measure(read, adapter, rounds)
+        settings.DB_RAW_READS = True
+        raw_wall, raw_cpu = await measure(read, adapter, rounds)
+        print(
+            f'{name:<16}'
+            f' {orm_wall:>8.3f}ms {orm_cpu:>8.3f}ms'
+            f' {raw_wall:>8.3f}ms {raw_cpu:>8.3f}ms'
+        )
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--menus', type=int, default=200)
+    parser.add_argument('--submenus', type=int, default=10, help='submenus per menu')
+    parser.add_argument('--dishes', type=int, default=100, help='dishes per submenu')
+    parser.add_argument('--rounds', type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.menus, args.submenus, args.dishes, args.rounds))
@@ -0,0 +1,91 @@
+"""Throughput of the API as the number of in-flight requests grows.
+
+Runs against the ASGI app in-process with the DB and cache configured in the
+environment (see `.env.example`). The cache is flushed, so use a disposable
+environment, e.g.:
+
+    python -m benchmarks.session_concurrency --path /api/v1/menus --requests 2000
+
+Every level is measured twice: with a warm cache (requests served from the
+local cache) and with Redis and the local cache flushed before every request
+batch (every request queries the DB). Pool checkouts per request are reported
+to show that cache hits never acquire a DB connection.
+"""
+import argparse
+import asyncio
+import time
+
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from src.api.app import app
+from src.cache.cache import get_redis
+from src.cache.local import local_cache
+from src.db.core import engine
+
+
+class CheckoutCounter:
+    """Count connections checked out of the engine pool."""
+
+    def __init__(self):
+        self.value = 0
+        event.listen(engine.sync_engine, 'checkout', self._on_checkout)
+
+    def _on_checkout(self, *args) -> None:
+        self.value += 1
+
+
+async def run_level(
+        client: AsyncClient,
+        path: str,
+        concurrency: int,
+        total: int,
+        flush: bool,
+) -> tuple[float, int]:
+    """Send `total` requests keeping `concurrency` of them in flight."""
+
+    cache = await get_redis()
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            if flush:
+                await cache.flush_all()
+                local_cache.clear()
+            response = await client.get(path)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return total / (time.perf_counter() - started), total
+
+
+async def main(path: str, total: int, levels: list[int]) -> None:
+    counter = CheckoutCounter()
+
+    async with AsyncClient(app=app, base_url='http://bench') as client:
+        await client.get(path)
+
+        print(f'{"in-flight":>10} {"mode":>6} {"req/s":>10} {"checkouts/req":>14}')
+        for concurrency in levels:
+            for flush in (False, True):
+                counter.value = 0
+                rps, done = await run_level(client, path, concurrency, total, flush)
+                mode = 'miss' if flush else 'hit'
+                print(f'{concurrency:>10} {mode:>6} {rps:>10.1f} {counter.value / done:>14.2f}')
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--path', default='/api/v1/menus')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path, args.requests, args.levels))
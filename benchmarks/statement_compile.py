@@ -0,0 +1,134 @@
+"""Statement build and compile overhead per request, before and after caching.
+
+Does not need a DB, only the postgresql+asyncpg dialect:
+
+    python -m benchmarks.statement_compile --rounds 5000
+
+`rebuilt` is the old path: a new select() with literal ids on every call,
+in the old shape with joins and GROUP BY counts, which SQLAlchemy has to
+traverse for its cache key and, on a cache miss, compile. `cached` is the shared statement object with bind parameters.
+"""
+import argparse
+import time
+import uuid
+from typing import Callable
+
+from sqlalchemy import Select, distinct, func, select
+from sqlalchemy.dialects import postgresql
+
+from src.api.repositories.dish import DishRepository
+from src.api.repositories.menu import MenuRepository
+from src.api.repositories.submenu import SubmenuRepository
+from src.db import models
+
+dialect = postgresql.asyncpg.dialect()
+
+
+def old_menu_statement() -> Select:
+    """Menu statement as it was before counters were kept on rows."""
+
+    return select(
+        models.Menu.id,
+        models.Menu.title,
+        models.Menu.description,
+        func.count(distinct(models.Submenu.id)).label('submenus_count'),
+        func.count(models.Submenu.dishes).label('dishes_count'),
+    ).join(
+        models.Submenu,
+        models.Menu.id == models.Submenu.menu_id,
+        isouter=True
+    ).join(
+        models.Dish,
+        models.Submenu.id == models.Dish.submenu_id,
+        isouter=True
+    ).group_by(
+        models.Menu.id
+    )
+
+
+def old_submenu_statement(menu_id: uuid.UUID) -> Select:
+    """Submenu statement as it was before counters were kept on rows."""
+
+    return select(
+        models.Submenu.id,
+        models.Submenu.title,
+        models.Submenu.description,
+        models.Submenu.menu_id,
+        func.count(models.Submenu.dishes).label('dishes_count'),
+    ).join(
+        models.Dish,
+        models.Submenu.id == models.Dish.submenu_id,
+        isouter=True
+    ).group_by(
+        models.Submenu.id
+    ).where(models.Submenu.menu_id == menu_id)
+
+
+def old_dish_statement(menu_id: uuid.UUID, submenu_id: uuid.UUID) -> Select:
+    """Dish statement as it was before caching."""
+
+    return select(
+        models.Dish.id,
+        models.Dish.title,
+        models.Dish.description,
+        models.Dish.submenu_id,
+        models.Dish.price,
+    ).where(
+        models.Dish.submenu.has(menu_id=menu_id),
+        models.Dish.submenu_id == submenu_id,
+    )
+
+
+def rebuilt_queries() -> dict[str, Callable]:
+    """Per-request statements as they were built before caching."""
+
+    menu_id, submenu_id, dish_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    return {
+        'menu detail': lambda: old_menu_statement().where(models.Menu.id == menu_id),
+        'submenu list': lambda: old_submenu_statement(menu_id),
+        'dish detail': lambda: old_dish_statement(menu_id, submenu_id).where(models.Dish.id == dish_id),
+    }
+
+
+def cached_queries() -> dict[str, Callable]:
+    """Statements shared by all requests."""
+
+    return {
+        'menu detail': lambda: MenuRepository.detail_statement,
+        'submenu list': lambda: SubmenuRepository.list_statement,
+        'dish detail': lambda: DishRepository.detail_statement,
+    }
+
+
+def measure(build: Callable, rounds: int, compile_: bool) -> float:
+    """Average microseconds for statement build, cache key and compile."""
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        statement = build()
+        statement._generate_cache_key()
+        if compile_:
+            statement.compile(dialect=dialect)
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def main(rounds: int) -> None:
+    rebuilt, cached = rebuilt_queries(), cached_queries()
+
+    print(f'{"query":<14} {"rebuilt":>10} {"rebuilt+compile":>16} {"cached":>10}')
+    for name in rebuilt:
+        print(
+            f'{name:<14}'
+            f' {measure(rebuilt[name], rounds, False):>8.1f}us'
+            f' {measure(rebuilt[name], rounds, True):>14.1f}us'
+            f' {measure(cached[name], rounds, False):>8.1f}us'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.rounds)
@@ -0,0 +1,106 @@
+"""menu and submenu counters
+
+Revision ID: 4060d15bfe37
+Revises: b5600c8f337c
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4060d15bfe37'
+down_revision = 'b5600c8f337c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('menus', sa.Column('submenus_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('menus', sa.Column('dishes_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('submenus', sa.Column('dishes_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION submenus_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.menu_id = NEW.menu_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE menus
+                SET submenus_count = submenus_count + 1,
+                    dishes_count = dishes_count + NEW.dishes_count
+                WHERE id = NEW.menu_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE menus
+                SET submenus_count = submenus_count - 1,
+                    dishes_count = dishes_count - OLD.dishes_count
+                WHERE id = OLD.menu_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION dishes_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.submenu_id = NEW.submenu_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE submenus
+                SET dishes_count = dishes_count + 1
+                WHERE id = NEW.submenu_id;
+                UPDATE menus
+                SET dishes_count = menus.dishes_count + 1
+                FROM submenus
+                WHERE submenus.id = NEW.submenu_id AND menus.id = submenus.menu_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE submenus
+                SET dishes_count = dishes_count - 1
+                WHERE id = OLD.submenu_id;
+                UPDATE menus
+                SET dishes_count = menus.dishes_count - 1
+                FROM submenus
+                WHERE submenus.id = OLD.submenu_id AND menus.id = submenus.menu_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute('LOCK TABLE menus, submenus, dishes IN SHARE ROW EXCLUSIVE MODE')
+    op.execute("""
+        CREATE TRIGGER submenus_counters
+        AFTER INSERT OR DELETE OR UPDATE OF menu_id ON submenus
+        FOR EACH ROW EXECUTE FUNCTION submenus_counters()
+    """)
+    op.execute("""
+        CREATE TRIGGER dishes_counters
+        AFTER INSERT OR DELETE OR UPDATE OF submenu_id ON dishes
+        FOR EACH ROW EXECUTE FUNCTION dishes_counters()
+    """)
+    op.execute("""
+        UPDATE submenus
+        SET dishes_count = (SELECT count(*) FROM dishes WHERE dishes.submenu_id = submenus.id)
+    """)
+    op.execute("""
+        UPDATE menus
+        SET submenus_count = (SELECT count(*) FROM submenus WHERE submenus.menu_id = menus.id),
+            dishes_count = (
+                SELECT coalesce(sum(submenus.dishes_count), 0) FROM submenus WHERE submenus.menu_id = menus.id
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS dishes_counters ON dishes')
+    op.execute('DROP TRIGGER IF EXISTS submenus_counters ON submenus')
+    op.execute('DROP FUNCTION IF EXISTS dishes_counters()')
+    op.execute('DROP FUNCTION IF EXISTS submenus_counters()')
+    op.drop_column('submenus', 'dishes_count')
+    op.drop_column('menus', 'dishes_count')
+    op.drop_column('menus', 'submenus_count')
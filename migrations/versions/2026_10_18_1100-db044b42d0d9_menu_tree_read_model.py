@@ -0,0 +1,62 @@
+"""menu tree read model
+
+Revision ID: db044b42d0d9
+Revises: 4060d15bfe37
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa  # noqa 401
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'db044b42d0d9'
+down_revision = '4060d15bfe37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Documents are rebuilt per written menu by the app, here they are filled once.
+    op.create_table(
+        'menu_tree',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('document', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.ForeignKeyConstraint(['id'], ['menus.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    # dishes.menu_id is added by a later revision, so dishes are found by submenu_id only.
+    op.execute("""
+        INSERT INTO menu_tree (id, document)
+        SELECT menus.id,
+               jsonb_build_object(
+                   'id', menus.id,
+                   'title', menus.title,
+                   'description', menus.description,
+                   'submenus', coalesce((
+                       SELECT jsonb_agg(jsonb_build_object(
+                           'id', submenus.id,
+                           'title', submenus.title,
+                           'description', submenus.description,
+                           'dishes', coalesce((
+                               SELECT jsonb_agg(jsonb_build_object(
+                                   'id', dishes.id,
+                                   'title', dishes.title,
+                                   'description', dishes.description,
+                                   'price', dishes.price::text
+                               ))
+                               FROM dishes
+                               WHERE dishes.submenu_id = submenus.id
+                           ), '[]'::jsonb)
+                       ))
+                       FROM submenus
+                       WHERE submenus.menu_id = menus.id
+                   ), '[]'::jsonb)
+               ) AS document
+        FROM menus
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('menu_tree')
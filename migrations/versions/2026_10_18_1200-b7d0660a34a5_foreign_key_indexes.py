@@ -0,0 +1,40 @@
+"""foreign key indexes
+
+Revision ID: b7d0660a34a5
+Revises: db044b42d0d9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa  # noqa 401
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d0660a34a5'
+down_revision = 'db044b42d0d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_submenus_menu_id_id',
+            'submenus',
+            ['menu_id', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_dishes_submenu_id_id',
+            'dishes',
+            ['submenu_id', 'id'],
+            postgresql_include=['title', 'description', 'price'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dishes_submenu_id_id', 'dishes', postgresql_concurrently=True)
+        op.drop_index('ix_submenus_menu_id_id', 'submenus', postgresql_concurrently=True)
@@ -0,0 +1,107 @@
+"""dishes menu_id
+
+Revision ID: 5c1e9a7d2f40
+Revises: b7d0660a34a5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa  # noqa 401
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e9a7d2f40'
+down_revision = 'b7d0660a34a5'
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_BATCH = 5000
+
+
+def upgrade() -> None:
+    # Dishes written by the previous app version have no menu_id, so writes of dishes
+    # (dish endpoints and the sync task) must be stopped until the new version is
+    # deployed. Reads keep working, no statement below scans a table under ACCESS EXCLUSIVE.
+    op.add_column('dishes', sa.Column('menu_id', sa.Uuid(), nullable=True))
+
+    # Backfilled in batches, each one committed, so row locks are held shortly.
+    with op.get_context().autocommit_block():
+        while op.get_bind().execute(
+            sa.text(
+                'UPDATE dishes SET menu_id = submenus.menu_id '
+                'FROM submenus WHERE submenus.id = dishes.submenu_id '
+                'AND dishes.id IN (SELECT id FROM dishes WHERE menu_id IS NULL LIMIT :batch)'
+            ),
+            {'batch': BACKFILL_BATCH},
+        ).rowcount:
+            pass
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_submenus_menu_id_id',
+            'submenus',
+            ['menu_id', 'id'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.execute(
+            'ALTER TABLE submenus ADD CONSTRAINT uq_submenus_menu_id_id '
+            'UNIQUE USING INDEX uq_submenus_menu_id_id'
+        )
+        op.drop_index('ix_submenus_menu_id_id', 'submenus', postgresql_concurrently=True)
+        op.create_index(
+            'ix_dishes_menu_id_submenu_id_id',
+            'dishes',
+            ['menu_id', 'submenu_id', 'id'],
+            postgresql_include=['title', 'description', 'price'],
+            postgresql_concurrently=True,
+        )
+
+    # Added NOT VALID and validated in their own transaction, so existing rows
+    # are checked under a lock that doesn't block writes.
+    op.execute('ALTER TABLE dishes ADD CONSTRAINT ck_dishes_menu_id_not_null CHECK (menu_id IS NOT NULL) NOT VALID')
+    op.execute(
+        'ALTER TABLE dishes ADD CONSTRAINT fk_dishes_submenu_id_menu_id '
+        'FOREIGN KEY (submenu_id, menu_id) REFERENCES submenus (id, menu_id) '
+        'ON UPDATE CASCADE NOT VALID'
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute('ALTER TABLE dishes VALIDATE CONSTRAINT ck_dishes_menu_id_not_null')
+        op.execute('ALTER TABLE dishes VALIDATE CONSTRAINT fk_dishes_submenu_id_menu_id')
+
+    # The validated check proves the column has no NULLs, so SET NOT NULL skips the scan.
+    op.alter_column('dishes', 'menu_id', nullable=False)
+    op.drop_constraint('ck_dishes_menu_id_not_null', 'dishes', type_='check')
+    op.drop_constraint('dishes_submenu_id_fkey', 'dishes', type_='foreignkey')
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dishes_submenu_id_id', 'dishes', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_dishes_submenu_id_id',
+            'dishes',
+            ['submenu_id', 'id'],
+            postgresql_include=['title', 'description', 'price'],
+            postgresql_concurrently=True,
+        )
+
+    op.create_foreign_key('dishes_submenu_id_fkey', 'dishes', 'submenus', ['submenu_id'], ['id'])
+    op.drop_constraint('fk_dishes_submenu_id_menu_id', 'dishes', type_='foreignkey')
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dishes_menu_id_submenu_id_id', 'dishes', postgresql_concurrently=True)
+        op.create_index(
+            'ix_submenus_menu_id_id',
+            'submenus',
+            ['menu_id', 'id'],
+            postgresql_concurrently=True,
+        )
+
+    op.drop_constraint('uq_submenus_menu_id_id', 'submenus', type_='unique')
+    op.drop_column('dishes', 'menu_id')
@@ -0,0 +1,52 @@
+"""cascade deletes
+
+Revision ID: 8d3b6f0e9a12
+Revises: 5c1e9a7d2f40
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa  # noqa 401
+
+
+# revision identifiers, used by Alembic.
+revision = '8d3b6f0e9a12'
+down_revision = '5c1e9a7d2f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keys are swapped NOT VALID, new rows are checked at once.
+    op.drop_constraint('submenus_menu_id_fkey', 'submenus', type_='foreignkey')
+    op.execute(
+        'ALTER TABLE submenus ADD CONSTRAINT submenus_menu_id_fkey '
+        'FOREIGN KEY (menu_id) REFERENCES menus (id) '
+        'ON DELETE CASCADE NOT VALID'
+    )
+    op.drop_constraint('fk_dishes_submenu_id_menu_id', 'dishes', type_='foreignkey')
+    op.execute(
+        'ALTER TABLE dishes ADD CONSTRAINT fk_dishes_submenu_id_menu_id '
+        'FOREIGN KEY (submenu_id, menu_id) REFERENCES submenus (id, menu_id) '
+        'ON DELETE CASCADE ON UPDATE CASCADE NOT VALID'
+    )
+
+    # Existing rows are checked after the swap is committed, VALIDATE doesn't block writes
+    # as long as it runs in its own transaction.
+    with op.get_context().autocommit_block():
+        op.execute('ALTER TABLE submenus VALIDATE CONSTRAINT submenus_menu_id_fkey')
+        op.execute('ALTER TABLE dishes VALIDATE CONSTRAINT fk_dishes_submenu_id_menu_id')
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_dishes_submenu_id_menu_id', 'dishes', type_='foreignkey')
+    op.create_foreign_key(
+        'fk_dishes_submenu_id_menu_id',
+        'dishes',
+        'submenus',
+        ['submenu_id', 'menu_id'],
+        ['id', 'menu_id'],
+        onupdate='CASCADE',
+    )
+    op.drop_constraint('submenus_menu_id_fkey', 'submenus', type_='foreignkey')
+    op.create_foreign_key('submenus_menu_id_fkey', 'submenus', 'menus', ['menu_id'], ['id'])
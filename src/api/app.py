@@ -1,16 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import APIRouter, FastAPI
 
-from src.api.endpoints import dish_route, menu_route, submenu_route
+from src.api.endpoints import dish_route, internal_route, menu_route, submenu_route
+from src.cache.core import close_redis_instance, get_redis_instance
+from src.cache.invalidation import InvalidationListener
+from src.cache.local import local_cache
+from src.config import settings
 
 __all__ = (
     'app',
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared Redis pool and listen for invalidations of local cache while app runs."""
+
+    listener = InvalidationListener(local_cache)
+    listener.start(await get_redis_instance())
+    yield
+    await listener.stop()
+    await close_redis_instance()
+
+
 app = FastAPI(
     title='Restaurant menu API',
     description='FastAPI project',
     version='0.1.1',
     docs_url='/api/v1/docs',
+    lifespan=lifespan,
 )
 
 main_route = APIRouter(
@@ -31,4 +50,11 @@ main_route.include_router(
     prefix='/menus/{menu_id}/submenus/{submenu_id}',
     tags=['dishes'],
 )
+if settings.INTERNAL_API_TOKEN:
+    main_route.include_router(
+        internal_route,
+        prefix='/internal',
+        tags=['internal'],
+        include_in_schema=False,
+    )
 app.include_router(main_route)
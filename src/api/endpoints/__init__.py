@@ -1,4 +1,5 @@
 from .dish import dish_route
+from .internal import internal_route
 from .menu import menu_route
 from .submenu import submenu_route
 
@@ -6,4 +7,5 @@ __all__ = (
     'menu_route',
     'submenu_route',
     'dish_route',
+    'internal_route',
 )
@@ -1,30 +1,43 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Response, status
 
+from src.api.keys_for_cache_invalidation import DETAIL_DISH, DISHES_LIST
+from src.api.pagination import Pagination, get_page_key, get_pagination, set_next_cursor
+from src.api.response_cache import CachedResponseRoute, cached_response
 from src.api.schemas import DishCreate, DishResponse, DishUpdate, Status
 from src.api.services.dish import DishService
 from src.dependencies import get_dish_service
 
-dish_route = APIRouter()
+dish_route = APIRouter(route_class=CachedResponseRoute)
 
 
 @dish_route.get(
     '/dishes',
     summary='Get list',
-    description='Get list of dishes',
+    description='Get page of dishes, cursor of the next page is in `X-Next-Cursor` header',
     response_model=list[DishResponse],
     status_code=status.HTTP_200_OK,
 )
+@cached_response(
+    key=lambda menu_id, submenu_id, pagination, **_: get_page_key(DISHES_LIST.format(menu_id, submenu_id), pagination),
+    group=lambda menu_id, submenu_id, **_: DISHES_LIST.format(menu_id, submenu_id),
+)
 async def get_list_dish(
         menu_id: uuid.UUID,
         submenu_id: uuid.UUID,
+        response: Response,
+        pagination: Pagination = Depends(get_pagination),
         dish_service: DishService = Depends(get_dish_service),
 ):
-    return await dish_service.get_list(
+    dishes = await dish_service.get_list(
         menu_id=menu_id,
         submenu_id=submenu_id,
+        pagination=pagination,
     )
+    set_next_cursor(response, dishes, pagination)
+
+    return dishes
 
 
 @dish_route.post(
@@ -49,6 +62,28 @@ async def create_dish(
     )
 
 
+@dish_route.post(
+    '/dishes/batch',
+    summary='Create dishes',
+    description='Create several dishes at once',
+    response_model=list[DishResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_dishes_batch(
+        menu_id: uuid.UUID,
+        submenu_id: uuid.UUID,
+        background_tasks: BackgroundTasks,
+        data: list[DishCreate] = Body(min_length=1, max_length=1000),
+        dish_service: DishService = Depends(get_dish_service),
+):
+    return await dish_service.create_many(
+        menu_id=menu_id,
+        submenu_id=submenu_id,
+        data=data,
+        background_tasks=background_tasks,
+    )
+
+
 @dish_route.get(
     '/dishes/{dish_id}',
     summary='get detail',
@@ -56,6 +91,7 @@ async def create_dish(
     response_model=DishResponse,
     status_code=status.HTTP_200_OK,
 )
+@cached_response(key=lambda menu_id, submenu_id, dish_id, **_: DETAIL_DISH.format(menu_id, submenu_id, dish_id))
 async def get_detail_dish(
         menu_id: uuid.UUID,
         submenu_id: uuid.UUID,
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, status
+
+from src.api.schemas import CacheStats, DBPoolStats, RedisPoolStats
+from src.cache.core import get_redis_instance
+from src.cache.local import local_cache, redis_stats
+from src.db.core import engine, replica_engine
+from src.dependencies import verify_internal_token
+
+internal_route = APIRouter(dependencies=[Depends(verify_internal_token)])
+
+
+@internal_route.get(
+    '/db-pool',
+    summary='DB pool statistics',
+    description='Get checked out, idle and overflow connections and wait times of primary and replica DB pools',
+    response_model=DBPoolStats,
+    status_code=status.HTTP_200_OK,
+)
+async def get_db_pool_stats():
+    return {
+        'primary': engine.pool.stats(),
+        'replica': replica_engine.pool.stats() if replica_engine is not None else None,
+    }
+
+
+@internal_route.get(
+    '/redis-pool',
+    summary='Redis pool statistics',
+    description='Get created, in use and idle connections and wait times of Redis pool',
+    response_model=RedisPoolStats,
+    status_code=status.HTTP_200_OK,
+)
+async def get_redis_pool_stats():
+    return (await get_redis_instance()).connection_pool.stats()
+
+
+@internal_route.get(
+    '/cache',
+    summary='Cache statistics',
+    description='Get hits, misses and hit ratio of local and Redis cache tiers',
+    response_model=CacheStats,
+    status_code=status.HTTP_200_OK,
+)
+async def get_cache_stats():
+    return {
+        'local': local_cache.stats(),
+        'redis': redis_stats.stats(),
+    }
@@ -1,12 +1,18 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Response, status
+from fastapi.responses import StreamingResponse
 
+from src.api.keys_for_cache_invalidation import ALL_DATA, DETAIL_MENU, MENUS_LIST
+from src.api.pagination import Pagination, get_page_key, get_pagination, set_next_cursor
+from src.api.response_cache import CachedResponseRoute, cached_response
 from src.api.schemas import MenuCreate, MenuInDB, MenuResponse, MenuUpdate, Status
 from src.api.services.menu import MenuService
 from src.dependencies import get_menu_service
 
-menu_route = APIRouter()
+menu_route = APIRouter(route_class=CachedResponseRoute)
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
 
 
 @menu_route.get(
@@ -14,19 +20,50 @@ menu_route = APIRouter()
     status_code=status.HTTP_200_OK,
     response_model=list[MenuInDB]
 )
+@cached_response(key=lambda **_: ALL_DATA)
 async def get_all_detail_data(service: MenuService = Depends(get_menu_service)):
     return await service.get_all_detail_data()
 
 
+@menu_route.get(
+    '/get_all/stream',
+    status_code=status.HTTP_200_OK,
+    response_model=list[MenuInDB],
+    response_class=StreamingResponse,
+    description=f'Stream all data as JSON array or as NDJSON with `Accept: {NDJSON_MEDIA_TYPE}`',
+)
+async def stream_all_detail_data(
+        accept: str | None = Header(default=None),
+        service: MenuService = Depends(get_menu_service),
+):
+    ndjson = NDJSON_MEDIA_TYPE in (accept or '')
+
+    return StreamingResponse(
+        await service.stream_all_detail_data(ndjson=ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else 'application/json',
+    )
+
+
 @menu_route.get(
     '/menus',
     summary='Get only list of menus',
-    description='Get list of menus',
+    description='Get page of menus, cursor of the next page is in `X-Next-Cursor` header',
     response_model=list[MenuResponse],
     status_code=status.HTTP_200_OK,
 )
-async def get_list_menu(menu_service: MenuService = Depends(get_menu_service)):
-    return await menu_service.get_list()
+@cached_response(
+    key=lambda pagination, **_: get_page_key(MENUS_LIST, pagination),
+    group=lambda **_: MENUS_LIST,
+)
+async def get_list_menu(
+        response: Response,
+        pagination: Pagination = Depends(get_pagination),
+        menu_service: MenuService = Depends(get_menu_service),
+):
+    menus = await menu_service.get_list(pagination=pagination)
+    set_next_cursor(response, menus, pagination)
+
+    return menus
 
 
 @menu_route.post(
@@ -54,6 +91,7 @@ async def create_menu(
     response_model=MenuResponse,
     status_code=status.HTTP_200_OK,
 )
+@cached_response(key=lambda menu_id, **_: DETAIL_MENU.format(menu_id))
 async def get_detail_menu(
         menu_id: uuid.UUID,
         menu_service: MenuService = Depends(get_menu_service),
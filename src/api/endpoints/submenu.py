@@ -1,26 +1,38 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
 
+from src.api.keys_for_cache_invalidation import DETAIL_SUBMENU, SUBMENUS_LIST
+from src.api.pagination import Pagination, get_page_key, get_pagination, set_next_cursor
+from src.api.response_cache import CachedResponseRoute, cached_response
 from src.api.schemas import Status, SubmenuCreate, SubmenuResponse, SubmenuUpdate
 from src.api.services.submenu import SubmenuService
 from src.dependencies import get_submenu_service
 
-submenu_route = APIRouter()
+submenu_route = APIRouter(route_class=CachedResponseRoute)
 
 
 @submenu_route.get(
     '/submenus',
     summary='Get list',
-    description='Get list of submenus',
+    description='Get page of submenus, cursor of the next page is in `X-Next-Cursor` header',
     response_model=list[SubmenuResponse],
     status_code=status.HTTP_200_OK,
 )
+@cached_response(
+    key=lambda menu_id, pagination, **_: get_page_key(SUBMENUS_LIST.format(menu_id), pagination),
+    group=lambda menu_id, **_: SUBMENUS_LIST.format(menu_id),
+)
 async def get_list_submenu(
         menu_id: uuid.UUID,
+        response: Response,
+        pagination: Pagination = Depends(get_pagination),
         submenu_service: SubmenuService = Depends(get_submenu_service),
 ):
-    return await submenu_service.get_list(menu_id=menu_id)
+    submenus = await submenu_service.get_list(menu_id=menu_id, pagination=pagination)
+    set_next_cursor(response, submenus, pagination)
+
+    return submenus
 
 
 @submenu_route.post(
@@ -50,6 +62,7 @@ async def create_submenu(
     response_model=SubmenuResponse,
     status_code=status.HTTP_200_OK,
 )
+@cached_response(key=lambda menu_id, submenu_id, **_: DETAIL_SUBMENU.format(menu_id, submenu_id))
 async def get_detail_submenu(
         menu_id: uuid.UUID,
         submenu_id: uuid.UUID,
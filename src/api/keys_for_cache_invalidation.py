@@ -1,3 +1,8 @@
+import re
+from typing import NamedTuple
+
+from src.config import settings
+
 ALL_DATA = 'all_data_for_db'
 
 DETAIL_MENU = 'menu:{}'
@@ -8,3 +13,71 @@ SUBMENUS_LIST = 'menu:{}:list_of_submenus'
 
 DETAIL_DISH = 'menu:{0}:submenu:{1}:dish:{2}'
 DISHES_LIST = 'menu:{0}:submenu:{1}:list_of_dishes'
+
+DISCOUNTS = 'discounts'
+
+LIST_PAGE = '{0}:page:{1}:{2}'
+LIST_PAGES = '{}:pages'
+RESPONSE = '{}:response'
+LOCK = '{}:lock'
+RECENT_WRITE = 'db:recent_write'
+
+MENU_TAG = 'tag:menu:{}'
+SUBMENU_TAG = 'tag:submenu:{}'
+TAG_PREFIX = 'tag:'
+
+INVALIDATION_CHANNEL = 'cache:invalidation'
+
+# families of keys by name of their `CACHE_TTLS` setting
+KEY_FAMILIES = {
+    'all_data': ALL_DATA,
+    'menu': DETAIL_MENU,
+    'menus': MENUS_LIST,
+    'submenu': DETAIL_SUBMENU,
+    'submenus': SUBMENUS_LIST,
+    'dish': DETAIL_DISH,
+    'dishes': DISHES_LIST,
+}
+
+_TAGGED_ID = re.compile(r'(?:^|:)(menu|submenu):([0-9a-f-]{36})')
+
+
+def get_tags(key: str) -> list[str]:
+    """Tags of menu and submenu whose ids are in the key."""
+
+    if key.startswith(TAG_PREFIX):
+        return []
+
+    return [f'{TAG_PREFIX}{entity}:{uid}' for entity, uid in _TAGGED_ID.findall(key)]
+
+
+class TTL(NamedTuple):
+    """Seconds cached value is fresh (soft) and is kept stale (hard)."""
+    soft: int
+    hard: int
+
+
+def _family_pattern(template: str) -> re.Pattern:
+    """Pattern of keys built from template and of pages of the list."""
+
+    return re.compile(re.sub(r'\\{\d*\\}', '[^:]+', re.escape(template)) + r'(?::page:[^:]*:[^:]*)?')
+
+
+_FAMILY_PATTERNS = [(family, _family_pattern(template)) for family, template in KEY_FAMILIES.items()]
+
+
+def get_ttl(key: str) -> TTL:
+    """Soft and hard TTL of the key family.
+
+    Families missing in `CACHE_TTLS` are fresh for `REDIS_CACHE_EXPIRE`
+    and stale for `CACHE_STALE_TTL` more. Responses are kept while the
+    data they are built from is fresh, as they are not refreshed.
+    """
+    data_key = key.removesuffix(RESPONSE.format(''))
+    ttl = next(
+        (settings.CACHE_TTLS.get(family) for family, pattern in _FAMILY_PATTERNS if pattern.fullmatch(data_key)),
+        None,
+    )
+    soft, hard = ttl or (settings.REDIS_CACHE_EXPIRE, settings.REDIS_CACHE_EXPIRE + settings.CACHE_STALE_TTL)
+
+    return TTL(soft, soft if data_key != key else hard)
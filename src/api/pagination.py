@@ -0,0 +1,77 @@
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass
+from typing import Sequence
+
+from fastapi import HTTPException, Query, Response, status
+
+from src.api.keys_for_cache_invalidation import LIST_PAGE
+from src.config import settings
+
+__all__ = (
+    'NEXT_CURSOR_HEADER',
+    'Pagination',
+    'get_pagination',
+    'get_page_key',
+    'set_next_cursor',
+)
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """Page of a list ordered by id."""
+    limit: int
+    after: uuid.UUID | None = None
+
+
+def encode_cursor(uid: uuid.UUID) -> str:
+    """Get opaque cursor of the last item of a page."""
+
+    return base64.urlsafe_b64encode(uid.bytes).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> uuid.UUID:
+    """Get id of the last item of previous page from cursor."""
+
+    try:
+        return uuid.UUID(bytes=base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='invalid cursor'
+        )
+
+
+def get_pagination(
+        limit: int = Query(default=settings.PAGE_LIMIT, ge=1, le=settings.PAGE_LIMIT_MAX),
+        after: str | None = Query(default=None, description=f'Cursor from `{NEXT_CURSOR_HEADER}` header'),
+) -> Pagination:
+    """Page parameters of list endpoints."""
+
+    return Pagination(
+        limit=limit,
+        after=decode_cursor(after) if after else None,
+    )
+
+
+def get_page_key(list_key: str, pagination: Pagination) -> str:
+    """Cache key of page of the list."""
+
+    return LIST_PAGE.format(list_key, pagination.limit, pagination.after or '')
+
+
+def set_next_cursor(response: Response, items: Sequence, pagination: Pagination) -> None:
+    """Set cursor of the next page header if the page is full.
+
+    Items may be reordered after the query (discounted dishes), so the
+    cursor is taken from the greatest id of the page.
+    """
+
+    if len(items) < pagination.limit:
+        return None
+
+    last_id = max(item.id for item in items)
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_id)
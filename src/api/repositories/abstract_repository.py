@@ -1,15 +1,85 @@
+import uuid
 from abc import ABC, abstractmethod
+from typing import Any, Generic, Sequence, TypeVar
 
+from sqlalchemy import Executable, Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.db.dto import DTO
+from src.db.raw import fetch_raw
+from src.db.read_models import refresh_menu_tree
+
 __all__ = (
     'AbstractRepository',
+    'DTOType',
+    'cached_statement',
 )
 
+DTOType = TypeVar('DTOType', bound=DTO)
+
+
+class cached_statement:
+    """Build statement once per process and share it between repositories.
+
+    The same statement object keeps its memoized cache key, so SQLAlchemy
+    compiles it once and later executions only bind new parameters.
+    """
+
+    def __init__(self, builder):
+        self.builder = builder
+        self.statement = None
+        self.__doc__ = builder.__doc__
 
-class AbstractRepository(ABC):
-    """Abstract repository."""
+    def __get__(self, instance, owner):
+        if self.statement is None:
+            self.statement = self.builder(owner)
+        return self.statement
+
+
+class AbstractRepository(ABC, Generic[DTOType]):
+    """Abstract repository, reads rows as DTOs of `dto` type."""
     session: AsyncSession
+    dto: type[DTOType]
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _read(self, statement: Executable, params: dict | None = None) -> Result:
+        """Execute read-only statement on the replica if it is configured."""
+
+        return await self.session.execute(
+            statement,
+            params,
+            bind_arguments={'replica': True},
+        )
+
+    async def _fetch_all(self, statement: Executable, params: dict | None = None) -> list[DTOType]:
+        """Get rows of read-only statement as DTOs of the repository.
+
+        With `DB_RAW_READS` the statement runs directly on the asyncpg
+        connection, skipping SQLAlchemy result processing.
+        """
+
+        rows: Sequence[Any]
+        if settings.DB_RAW_READS:
+            rows = await fetch_raw(self.session, statement, params)
+        else:
+            rows = (await self._read(statement, params)).all()
+
+        return [self.dto(*row) for row in rows]
+
+    async def _fetch_one(self, statement: Executable, params: dict | None = None) -> DTOType | None:
+        """Get first row of read-only statement as DTO."""
+
+        rows = await self._fetch_all(statement, params)
+
+        return rows[0] if rows else None
+
+    async def refresh_read_models(self, *menu_ids: uuid.UUID) -> None:
+        """Rebuild read models of the written menus in the current transaction."""
+
+        await refresh_menu_tree(self.session, menu_ids)
 
     @abstractmethod
     async def get_detail(self, *args, **kwargs):
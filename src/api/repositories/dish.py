@@ -1,77 +1,87 @@
 import uuid
+from typing import cast
 
-from sqlalchemy import Select, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import CursorResult, Select, bindparam, delete, insert, select, update
 
-from src.api.repositories.abstract_repository import AbstractRepository
+from src.api.repositories.abstract_repository import AbstractRepository, cached_statement
 from src.db import models
+from src.db.dto import DishDTO
 
 __all__ = (
     'DishRepository',
 )
 
 
-class DishRepository(AbstractRepository):
+class DishRepository(AbstractRepository[DishDTO]):
     """Dish repository."""
+    model = models.Dish
+    dto = DishDTO
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.model = models.Dish
-
-    def get_statement(
-            self,
-            menu_id: uuid.UUID,
-            submenu_id: uuid.UUID,
-    ) -> Select:
-        """Get statement for execute from DB."""
+    @classmethod
+    def get_statement(cls) -> Select:
+        """Get statement of dishes by `menu_id` and `submenu_id` parameters."""
 
         return select(
-            self.model.id,
-            self.model.title,
-            self.model.description,
-            self.model.submenu_id,
-            self.model.price,
+            cls.model.id,
+            cls.model.title,
+            cls.model.description,
+            cls.model.submenu_id,
+            cls.model.price,
         ).where(
-            self.model.submenu.has(menu_id=menu_id),
-            self.model.submenu_id == submenu_id,
+            cls.model.menu_id == bindparam('menu_id'),
+            cls.model.submenu_id == bindparam('submenu_id'),
         )
 
+    @cached_statement
+    def list_statement(cls) -> Select:
+        """Statement of first page of dishes by `limit` parameter."""
+
+        return cls.get_statement().order_by(cls.model.id).limit(bindparam('limit'))
+
+    @cached_statement
+    def list_after_statement(cls) -> Select:
+        """Statement of page of dishes after `after` id."""
+
+        return cls.list_statement.where(cls.model.id > bindparam('after'))
+
+    @cached_statement
+    def detail_statement(cls) -> Select:
+        """Statement of detail of dish by `dish_id` parameter."""
+
+        return cls.get_statement().where(cls.model.id == bindparam('dish_id'))
+
     async def get_detail(
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
             dish_id: uuid.UUID,
-    ) -> dict | None:
+    ) -> DishDTO | None:
         """Get detail of dish from DB."""
 
-        result = await self.session.execute(
-            statement=self.get_statement(
-                menu_id=menu_id,
-                submenu_id=submenu_id,
-            ).where(
-                self.model.id == dish_id
-            )
+        return await self._fetch_one(
+            self.detail_statement,
+            {'menu_id': menu_id, 'submenu_id': submenu_id, 'dish_id': dish_id},
         )
 
-        dish = result.first()
-
-        return dish._asdict() if dish else dish
-
     async def get_list(
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
-    ) -> list[dict]:
-        """Get list of dishes from DB."""
-
-        result = await self.session.execute(
-            statement=self.get_statement(
-                menu_id=menu_id,
-                submenu_id=submenu_id,
+            limit: int,
+            after: uuid.UUID | None = None,
+    ) -> list[DishDTO]:
+        """Get page of dishes ordered by id from DB."""
+
+        if after is None:
+            return await self._fetch_all(
+                self.list_statement,
+                {'menu_id': menu_id, 'submenu_id': submenu_id, 'limit': limit},
             )
-        )
 
-        return [dish._asdict() for dish in result.all()]
+        return await self._fetch_all(
+            self.list_after_statement,
+            {'menu_id': menu_id, 'submenu_id': submenu_id, 'limit': limit, 'after': after},
+        )
 
     async def create(self, data: dict, **kwargs) -> models.Dish:
         """Create new dish."""
@@ -82,28 +92,53 @@ class DishRepository(AbstractRepository):
 
         return new_dish
 
+    async def create_many(self, data: list[dict], **kwargs) -> list[DishDTO]:
+        """Create dishes with one multi-row INSERT."""
+
+        result = await self.session.execute(
+            insert(
+                self.model
+            ).values(
+                [{**item, **kwargs} for item in data]
+            ).returning(
+                *self.detail_statement.selected_columns
+            )
+        )
+
+        return [self.dto(*row) for row in result.all()]
+
     async def update(
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
             dish_id: uuid.UUID,
             data: dict,
-    ) -> models.Dish | None:
-        """Update dish."""
+    ) -> DishDTO | None:
+        """Update dish and return updated row."""
 
-        dish = await self._get_from_db(
-            menu_id=menu_id,
-            submenu_id=submenu_id,
-            dish_id=dish_id,
-        )
+        if not data:
+            result = await self.session.execute(
+                self.detail_statement,
+                {'menu_id': menu_id, 'submenu_id': submenu_id, 'dish_id': dish_id},
+            )
+        else:
+            result = await self.session.execute(
+                update(
+                    self.model
+                ).where(
+                    self.model.menu_id == menu_id,
+                    self.model.submenu_id == submenu_id,
+                    self.model.id == dish_id,
+                ).values(
+                    **data
+                ).returning(
+                    *self.detail_statement.selected_columns
+                )
+            )
 
-        if dish:
-            for key, value in data.items():
-                setattr(dish, key, value)
-            self.session.add(dish)
-            await self.session.commit()
+        row = result.first()
 
-        return dish
+        return self.dto(*row) if row else None
 
     async def delete(
             self,
@@ -113,32 +148,12 @@ class DishRepository(AbstractRepository):
     ) -> bool:
         """Delete dish."""
 
-        dish = await self._get_from_db(
-            menu_id=menu_id,
-            submenu_id=submenu_id,
-            dish_id=dish_id,
-        )
-
-        if dish:
-            await self.session.delete(dish)
-            return True
-
-        return False
-
-    async def _get_from_db(
-            self,
-            menu_id: uuid.UUID,
-            submenu_id: uuid.UUID,
-            dish_id: uuid.UUID,
-    ) -> models.Dish | None:
-        """Get dish for delete/update from DB."""
-
-        result = await self.session.execute(
-            select(self.model).where(
-                self.model.submenu.has(menu_id=menu_id),
+        result = cast(CursorResult, await self.session.execute(
+            delete(self.model).where(
+                self.model.menu_id == menu_id,
                 self.model.submenu_id == submenu_id,
                 self.model.id == dish_id,
             )
-        )
+        ))
 
-        return result.scalar_one_or_none()
+        return result.rowcount > 0
@@ -1,78 +1,94 @@
 import uuid
-from typing import Sequence
+from typing import cast
 
-from sqlalchemy import Row, Select, distinct, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy import CursorResult, Select, bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncScalarResult
 
-from src.api.repositories.abstract_repository import AbstractRepository
+from src.api.repositories.abstract_repository import AbstractRepository, cached_statement
 from src.db import models
+from src.db.dto import MenuDTO, MenuTreeDTO
+from src.db.read_models import menu_tree
+from src.db.tree import get_tree_assembler
 
 __all__ = (
     'MenuRepository',
 )
 
+STREAM_YIELD_PER = 100
 
-class MenuRepository(AbstractRepository):
-    """Menu repository."""
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.model = models.Menu
-        self.submenu_model = models.Submenu
-        self.dish_model = models.Dish
+class MenuRepository(AbstractRepository[MenuDTO]):
+    """Menu repository."""
+    model = models.Menu
+    dto = MenuDTO
 
-    def get_statement(self) -> Select:
+    @classmethod
+    def get_statement(cls) -> Select:
         """Get query for execute from DB."""
 
         return select(
-            self.model.id,
-            self.model.title,
-            self.model.description,
-            func.count(distinct(self.submenu_model.id)).label('submenus_count'),
-            func.count(self.submenu_model.dishes).label('dishes_count'),
-        ).join(
-            self.submenu_model,
-            self.model.id == self.submenu_model.menu_id,
-            isouter=True
-        ).join(
-            self.dish_model,
-            self.submenu_model.id == self.dish_model.submenu_id,
-            isouter=True
-        ).group_by(
-            self.model.id
+            cls.model.id,
+            cls.model.title,
+            cls.model.description,
+            cls.model.submenus_count,
+            cls.model.dishes_count,
         )
 
-    async def get_all_detail_data(self) -> list[dict]:
-        """Get all data."""
+    @cached_statement
+    def list_statement(cls) -> Select:
+        """Statement of first page of menus by `limit` parameter."""
 
-        items = await self.session.execute(
-            select(
-                self.model
-            ).options(
-                joinedload(models.Menu.submenus).joinedload(models.Submenu.dishes)
-            )
-        )
+        return cls.get_statement().order_by(cls.model.id).limit(bindparam('limit'))
 
-        return [item.as_dict() for item in items.scalars().unique().all()]
+    @cached_statement
+    def list_after_statement(cls) -> Select:
+        """Statement of page of menus after `after` id."""
 
-    async def get_detail(self, uid: uuid.UUID) -> Row | None:
-        """Get detail of menu from DB."""
+        return cls.list_statement.where(cls.model.id > bindparam('after'))
+
+    @cached_statement
+    def detail_statement(cls) -> Select:
+        """Statement of detail of menu by `menu_id` parameter."""
+
+        return cls.get_statement().where(cls.model.id == bindparam('menu_id'))
+
+    @cached_statement
+    def all_detail_data_statement(cls) -> Select:
+        """Statement of all menus with submenus and dishes from read model."""
+
+        return select(menu_tree.c.document)
+
+    async def get_all_detail_data(self) -> list[MenuTreeDTO]:
+        """Get all data with the configured tree assembler."""
+
+        return await get_tree_assembler().assemble(self.session, replica=True)
+
+    async def stream_all_detail_data(self) -> AsyncScalarResult:
+        """Get all data with a server-side cursor."""
 
-        result = await self.session.execute(
-            statement=self.get_statement().where(self.model.id == uid)
+        result = await self.session.stream(
+            self.all_detail_data_statement,
+            execution_options={'yield_per': STREAM_YIELD_PER},
+            bind_arguments={'replica': True},
         )
 
-        return result.first()
+        return result.scalars()
 
-    async def get_list(self) -> Sequence[Row]:
-        """Get list method."""
+    async def get_detail(self, uid: uuid.UUID) -> MenuDTO | None:
+        """Get detail of menu from DB."""
 
-        result = await self.session.execute(
-            statement=self.get_statement()
+        return await self._fetch_one(
+            self.detail_statement,
+            {'menu_id': uid},
         )
 
-        return result.all()
+    async def get_list(self, limit: int, after: uuid.UUID | None = None) -> list[MenuDTO]:
+        """Get page of menus ordered by id."""
+
+        if after is None:
+            return await self._fetch_all(self.list_statement, {'limit': limit})
+
+        return await self._fetch_all(self.list_after_statement, {'limit': limit, 'after': after})
 
     async def create(self, data: dict, **kwargs) -> models.Menu:
         """Create new menu."""
@@ -87,37 +103,33 @@ class MenuRepository(AbstractRepository):
             self,
             menu_id: uuid.UUID,
             data: dict,
-    ) -> models.Menu | None:
-        """Update menu."""
-
-        menu = await self._get_from_db(menu_id)
+    ) -> MenuDTO | None:
+        """Update menu and return updated row."""
+
+        if not data:
+            result = await self.session.execute(self.detail_statement, {'menu_id': menu_id})
+        else:
+            result = await self.session.execute(
+                update(
+                    self.model
+                ).where(
+                    self.model.id == menu_id
+                ).values(
+                    **data
+                ).returning(
+                    *self.detail_statement.selected_columns
+                )
+            )
 
-        for key, value in data.items():
-            setattr(menu, key, value)
-        self.session.add(menu)
+        row = result.first()
 
-        return menu
+        return self.dto(*row) if row else None
 
     async def delete(self, menu_id: uuid.UUID) -> bool:
-        """Delete menu."""
-
-        menu = await self._get_from_db(menu_id)
-
-        if menu:
-            await self.session.delete(menu)
-            return True
+        """Delete menu, submenus and dishes are deleted by DB cascade."""
 
-        return False
-
-    async def _get_from_db(self, menu_id: uuid.UUID) -> models.Menu | None:
-        """Get menu from DB for delete/update."""
-
-        result = await self.session.execute(
-            select(
-                self.model,
-            ).options(
-                joinedload(self.model.submenus).joinedload(self.submenu_model.dishes)
-            ).where(self.model.id == menu_id)
-        )
+        result = cast(CursorResult, await self.session.execute(
+            delete(self.model).where(self.model.id == menu_id)
+        ))
 
-        return result.unique().scalar_one_or_none()
+        return result.rowcount > 0
@@ -1,65 +1,83 @@
 import uuid
-from typing import Sequence
+from typing import cast
 
-from sqlalchemy import Row, Select, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy import CursorResult, Select, bindparam, delete, select, update
 
-from src.api.repositories.abstract_repository import AbstractRepository
+from src.api.repositories.abstract_repository import AbstractRepository, cached_statement
 from src.db import models
+from src.db.dto import SubmenuDTO
 
 __all__ = (
     'SubmenuRepository',
 )
 
 
-class SubmenuRepository(AbstractRepository):
+class SubmenuRepository(AbstractRepository[SubmenuDTO]):
     """Submenu repository."""
+    model = models.Submenu
+    dto = SubmenuDTO
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.model = models.Submenu
-        self.dish_model = models.Dish
-
-    def get_statement(self, menu_id: uuid.UUID) -> Select:
-        """Get statement for execute from DB."""
+    @classmethod
+    def get_statement(cls) -> Select:
+        """Get statement of submenus of menu by `menu_id` parameter."""
 
         return select(
-            self.model.id,
-            self.model.title,
-            self.model.description,
-            self.model.menu_id,
-            func.count(self.model.dishes).label('dishes_count'),
-        ).join(
-            self.dish_model,
-            self.model.id == self.dish_model.submenu_id,
-            isouter=True
-        ).group_by(
-            self.model.id
-        ).where(self.model.menu_id == menu_id)
+            cls.model.id,
+            cls.model.title,
+            cls.model.description,
+            cls.model.menu_id,
+            cls.model.dishes_count,
+        ).where(cls.model.menu_id == bindparam('menu_id'))
+
+    @cached_statement
+    def list_statement(cls) -> Select:
+        """Statement of first page of submenus by `limit` parameter."""
+
+        return cls.get_statement().order_by(cls.model.id).limit(bindparam('limit'))
+
+    @cached_statement
+    def list_after_statement(cls) -> Select:
+        """Statement of page of submenus after `after` id."""
+
+        return cls.list_statement.where(cls.model.id > bindparam('after'))
+
+    @cached_statement
+    def detail_statement(cls) -> Select:
+        """Statement of detail of submenu by `submenu_id` parameter."""
+
+        return cls.get_statement().where(cls.model.id == bindparam('submenu_id'))
 
     async def get_detail(
             self,
             submenu_id: uuid.UUID,
             menu_id: uuid.UUID,
-    ) -> Row | None:
+    ) -> SubmenuDTO | None:
         """Get detail of submenu from DB."""
 
-        result = await self.session.execute(
-            statement=self.get_statement(menu_id).where(self.model.id == submenu_id)
+        return await self._fetch_one(
+            self.detail_statement,
+            {'menu_id': menu_id, 'submenu_id': submenu_id},
         )
 
-        return result.first()
-
-    async def get_list(self, menu_id: uuid.UUID) -> Sequence[Row]:
-        """Get list of submenu from DB."""
+    async def get_list(
+            self,
+            menu_id: uuid.UUID,
+            limit: int,
+            after: uuid.UUID | None = None,
+    ) -> list[SubmenuDTO]:
+        """Get page of submenus ordered by id from DB."""
+
+        if after is None:
+            return await self._fetch_all(
+                self.list_statement,
+                {'menu_id': menu_id, 'limit': limit},
+            )
 
-        result = await self.session.execute(
-            statement=self.get_statement(menu_id)
+        return await self._fetch_all(
+            self.list_after_statement,
+            {'menu_id': menu_id, 'limit': limit, 'after': after},
         )
 
-        return result.all()
-
     async def create(self, data: dict, **kwargs) -> models.Submenu:
         """Create new submenu."""
 
@@ -74,54 +92,44 @@ class SubmenuRepository(AbstractRepository):
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
             data: dict,
-    ) -> models.Submenu | None:
-        """Update submenu."""
+    ) -> SubmenuDTO | None:
+        """Update submenu and return updated row."""
 
-        submenu = await self._get_from_db(
-            menu_id=menu_id,
-            submenu_id=submenu_id,
-        )
+        if not data:
+            result = await self.session.execute(
+                self.detail_statement,
+                {'menu_id': menu_id, 'submenu_id': submenu_id},
+            )
+        else:
+            result = await self.session.execute(
+                update(
+                    self.model
+                ).where(
+                    self.model.menu_id == menu_id,
+                    self.model.id == submenu_id,
+                ).values(
+                    **data
+                ).returning(
+                    *self.detail_statement.selected_columns
+                )
+            )
 
-        for key, value in data.items():
-            setattr(submenu, key, value)
-        self.session.add(submenu)
+        row = result.first()
 
-        return submenu
+        return self.dto(*row) if row else None
 
     async def delete(
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
     ) -> bool:
-        """Delete submenu."""
-
-        submenu = await self._get_from_db(
-            menu_id=menu_id,
-            submenu_id=submenu_id,
-        )
+        """Delete submenu, dishes are deleted by DB cascade."""
 
-        if submenu:
-            await self.session.delete(submenu)
-            return True
-
-        return False
-
-    async def _get_from_db(
-            self,
-            menu_id: uuid.UUID,
-            submenu_id: uuid.UUID,
-    ) -> models.Submenu | None:
-        """Get submenu from DB for delete/update."""
-
-        result = await self.session.execute(
-            select(
-                self.model
-            ).options(
-                joinedload(self.model.dishes)
-            ).where(
+        result = cast(CursorResult, await self.session.execute(
+            delete(self.model).where(
                 self.model.menu_id == menu_id,
                 self.model.id == submenu_id,
             )
-        )
+        ))
 
-        return result.unique().scalar_one_or_none()
+        return result.rowcount > 0
@@ -0,0 +1,99 @@
+import inspect
+from functools import wraps
+from typing import Callable
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+
+from src.api.keys_for_cache_invalidation import RESPONSE
+from src.cache.service import CacheService
+from src.dependencies import get_cache_service
+
+__all__ = (
+    'CachedResponseRoute',
+    'cached_response',
+)
+
+# Starlette adds it to the body of every response by itself.
+SKIP_HEADERS = frozenset({'content-length'})
+
+
+class CachedResponseRoute(APIRoute):
+    """Route that stores the encoded body of endpoints marked by `cached_response`."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            target = getattr(request.state, 'response_cache', None)
+
+            if target is not None and response.status_code == 200 and not target[0].served_stale:
+                cache, key, group = target
+                headers = {name: value for name, value in response.headers.items() if name not in SKIP_HEADERS}
+                await cache.set_page_into_cache(group, RESPONSE.format(key), [response.body, headers])
+
+            return response
+
+        return route_handler
+
+
+def cached_response(
+        key: Callable[..., str],
+        group: Callable[..., str] | None = None,
+) -> Callable:
+    """Serve GET endpoint from the cached encoded response.
+
+    `key` builds the cache key of the data from endpoint arguments. The
+    response is stored next to it and registered for invalidation of the
+    `group` key, the data key itself by default, so the invalidation calls
+    of services drop it as well. A hit is returned as it was stored, the
+    endpoint, validation and serialization are skipped. Responses built
+    from stale data are not stored.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+
+        @wraps(endpoint)
+        async def wrapper(
+                *args,
+                response_cache_request: Request,
+                response_cache: CacheService,
+                **kwargs,
+        ):
+            cache_key = key(**kwargs)
+            cached = await response_cache.get_obj_from_cache(RESPONSE.format(cache_key))
+
+            if cached:
+                body, headers = cached
+                return Response(content=body, headers=headers)
+
+            response_cache_request.state.response_cache = (
+                response_cache,
+                cache_key,
+                group(**kwargs) if group else cache_key,
+            )
+
+            return await endpoint(*args, **kwargs)
+
+        setattr(wrapper, '__signature__', signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    'response_cache_request',
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=Request,
+                ),
+                inspect.Parameter(
+                    'response_cache',
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=CacheService,
+                    default=Depends(get_cache_service),
+                ),
+            ]
+        ))
+
+        return wrapper
+
+    return decorator
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from .menu import MenuCreate, MenuUpdate, MenuResponse
 from .submenu import SubmenuCreate, SubmenuUpdate, SubmenuResponse
 from .dish import DishCreate, DishUpdate, DishResponse
+from .internal import CacheStats, CacheTierStats, DBPoolStats, LocalCacheStats, PoolStats, RedisPoolStats
 
 __all__ = (
     'Status',
@@ -18,6 +19,12 @@ __all__ = (
     'DishCreate',
     'DishUpdate',
     'DishResponse',
+    'PoolStats',
+    'DBPoolStats',
+    'RedisPoolStats',
+    'CacheTierStats',
+    'LocalCacheStats',
+    'CacheStats',
 )
 
 
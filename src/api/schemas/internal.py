@@ -0,0 +1,54 @@
+from pydantic import BaseModel
+
+
+class PoolStats(BaseModel):
+    """DB connection pool statistics schema."""
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_total: float
+    wait_avg: float
+    wait_max: float
+
+
+class DBPoolStats(BaseModel):
+    """DB connection pools statistics schema by role, replica is None unless configured."""
+    primary: PoolStats
+    replica: PoolStats | None = None
+
+
+class RedisPoolStats(BaseModel):
+    """Redis connection pool statistics schema."""
+    max_connections: int
+    created: int
+    in_use: int
+    idle: int
+    checkouts: int
+    errors: int
+    wait_total: float
+    wait_avg: float
+    wait_max: float
+
+
+class CacheTierStats(BaseModel):
+    """Cache tier hits statistics schema."""
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class LocalCacheStats(CacheTierStats):
+    """Local cache statistics schema."""
+    max_size: int
+    size: int
+    evictions: int
+
+
+class CacheStats(BaseModel):
+    """Local and Redis cache tiers statistics schema."""
+    local: LocalCacheStats
+    redis: CacheTierStats
@@ -1,16 +1,16 @@
 import uuid
 from functools import partial
-from typing import Sequence
 
 from fastapi import BackgroundTasks, HTTPException, status
-from sqlalchemy import Row
 
 from src.api import keys_for_cache_invalidation
+from src.api.pagination import Pagination, get_page_key
 from src.api.repositories.dish import DishRepository
 from src.api.schemas import DishCreate, DishUpdate, Status
-from src.api.services.utils import set_discount, set_discounts
+from src.api.services.utils import set_discount, set_discounts, with_new_session
 from src.cache.service import CacheService
 from src.db import models
+from src.db.dto import DishDTO
 
 
 class DishService:
@@ -25,16 +25,12 @@ class DishService:
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
             dish_id: uuid.UUID,
-    ) -> Sequence | dict | None:
+    ) -> DishDTO | None:
         """Get detail of dish from cache DB."""
 
-        dish = await self.cache.get_obj_from_cache(
-            keys_for_cache_invalidation.DETAIL_DISH.format(menu_id, submenu_id, dish_id),
-        )
-
-        if not dish:
+        async def load(repo: DishRepository) -> DishDTO | None:
             try:
-                dish = await self.repo.get_detail(
+                dish = await repo.get_detail(
                     menu_id=menu_id,
                     submenu_id=submenu_id,
                     dish_id=dish_id,
@@ -50,16 +46,19 @@ class DishService:
                 if discount:
                     dish = await set_discount(dish, discount)
 
-                await self.cache.set_value_into_cache(
-                    keys_for_cache_invalidation.DETAIL_DISH.format(menu_id, submenu_id, dish_id),
-                    dish,
-                )
+            return dish
 
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail='dish not found'
-                )
+        dish = await self.cache.get_or_load(
+            keys_for_cache_invalidation.DETAIL_DISH.format(menu_id, submenu_id, dish_id),
+            partial(load, self.repo),
+            refresh=with_new_session(self.repo, load),
+        )
+
+        if not dish:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='dish not found'
+            )
 
         return dish
 
@@ -67,18 +66,20 @@ class DishService:
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
-    ) -> Sequence[Row]:
-        """Get list of dishes from cache or DB."""
+            pagination: Pagination,
+    ) -> list[DishDTO]:
+        """Get page of dishes from cache or DB."""
 
-        dishes = await self.cache.get_obj_from_cache(
-            keys_for_cache_invalidation.DISHES_LIST.format(menu_id, submenu_id)
-        )
+        list_key = keys_for_cache_invalidation.DISHES_LIST.format(menu_id, submenu_id)
+        page_key = get_page_key(list_key, pagination)
 
-        if not dishes:
+        async def load(repo: DishRepository) -> list[DishDTO]:
             try:
-                dishes = await self.repo.get_list(
+                dishes = await repo.get_list(
                     menu_id=menu_id,
                     submenu_id=submenu_id,
+                    limit=pagination.limit,
+                    after=pagination.after,
                 )
             except Exception as error:
                 raise HTTPException(
@@ -87,17 +88,18 @@ class DishService:
                 )
 
             if dishes:
-
-                discounts = await self.cache.get_discounts()
+                discounts = await self.cache.get_discounts([dish.id for dish in dishes])
                 if discounts:
                     dishes = await set_discounts(discounts, dishes)
 
-                await self.cache.set_value_into_cache(
-                    keys_for_cache_invalidation.DISHES_LIST.format(menu_id, submenu_id),
-                    dishes,
-                )
+            return dishes
 
-        return dishes
+        return await self.cache.get_or_load(
+            page_key,
+            partial(load, self.repo),
+            list_key=list_key,
+            refresh=with_new_session(self.repo, load),
+        )
 
     async def create(
             self,
@@ -113,7 +115,9 @@ class DishService:
                 new_dish = await self.repo.create(
                     data=data.model_dump(),
                     submenu_id=submenu_id,
+                    menu_id=menu_id,
                 )
+                await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -133,6 +137,42 @@ class DishService:
 
         return new_dish
 
+    async def create_many(
+            self,
+            menu_id: uuid.UUID,
+            submenu_id: uuid.UUID,
+            data: list[DishCreate],
+            background_tasks: BackgroundTasks,
+    ) -> list[DishDTO]:
+        """Create dishes in one transaction and invalidate cache once."""
+
+        try:
+            async with self.repo.session.begin():
+                new_dishes = await self.repo.create_many(
+                    data=[item.model_dump() for item in data],
+                    submenu_id=submenu_id,
+                    menu_id=menu_id,
+                )
+                await self.repo.refresh_read_models(menu_id)
+        except Exception as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=error.args
+            )
+
+        background_tasks.add_task(
+            partial(
+                self.cache.cache_invalidate,
+                keys_for_cache_invalidation.DISHES_LIST.format(menu_id, submenu_id),
+                keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, submenu_id),
+                keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id),
+                keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
+                keys_for_cache_invalidation.MENUS_LIST,
+            )
+        )
+
+        return new_dishes
+
     async def update(
             self,
             menu_id: uuid.UUID,
@@ -140,7 +180,7 @@ class DishService:
             dish_id: uuid.UUID,
             data: DishUpdate,
             background_tasks: BackgroundTasks,
-    ) -> models.Dish | None:
+    ) -> DishDTO | None:
         """Update dish and invalidate cache."""
 
         try:
@@ -151,6 +191,8 @@ class DishService:
                     dish_id=dish_id,
                     data=data.model_dump(exclude_unset=True),
                 )
+                if dish:
+                    await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -189,6 +231,8 @@ class DishService:
                     submenu_id=submenu_id,
                     dish_id=dish_id,
                 )
+                if deleted_dish:
+                    await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
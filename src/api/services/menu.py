@@ -1,16 +1,17 @@
 import uuid
 from functools import partial
-from typing import Sequence
+from typing import AsyncIterator
 
 from fastapi import BackgroundTasks, HTTPException, status
-from sqlalchemy import Row
 
 from src.api import keys_for_cache_invalidation
+from src.api.pagination import Pagination, get_page_key
 from src.api.repositories.menu import MenuRepository
 from src.api.schemas import MenuCreate, MenuUpdate, Status
-from src.api.services.utils import set_discounts
+from src.api.services.utils import dump_json_stream, set_discounts, with_new_session
 from src.cache.service import CacheService
 from src.db import models
+from src.db.dto import MenuDTO, MenuTreeDTO
 
 
 class MenuService:
@@ -23,90 +24,103 @@ class MenuService:
     async def get_detail(
             self,
             menu_id: uuid.UUID,
-    ) -> Row | None:
+    ) -> MenuDTO | None:
         """Get detail of menu from cache or DB."""
 
-        menu = await self.cache.get_obj_from_cache(
+        async def load(repo: MenuRepository) -> MenuDTO | None:
+            try:
+                return await repo.get_detail(menu_id)
+            except Exception as error:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=error.args
+                )
+
+        menu = await self.cache.get_or_load(
             keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
+            partial(load, self.repo),
+            refresh=with_new_session(self.repo, load),
         )
 
         if menu:
             return menu
 
-        try:
-            menu = await self.repo.get_detail(menu_id)
-        except Exception as error:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error.args
-            )
-
-        if menu:
-            await self.cache.set_value_into_cache(
-                keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
-                menu
-            )
-
-            return menu
-
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='menu not found'
         )
 
-    async def get_list(self) -> Sequence[Row]:
-        """Get list of menus from cache or DB."""
-
-        menus = await self.cache.get_obj_from_cache(
-            keys_for_cache_invalidation.MENUS_LIST,
-        )
+    async def get_list(self, pagination: Pagination) -> list[MenuDTO]:
+        """Get page of menus from cache or DB."""
 
-        if menus:
-            return menus
+        page_key = get_page_key(keys_for_cache_invalidation.MENUS_LIST, pagination)
 
-        try:
-            menus = await self.repo.get_list()
-        except Exception as error:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error.args
-            )
-        if menus:
-            await self.cache.set_value_into_cache(
-                keys_for_cache_invalidation.MENUS_LIST,
-                menus,
-            )
+        async def load(repo: MenuRepository) -> list[MenuDTO]:
+            try:
+                return await repo.get_list(limit=pagination.limit, after=pagination.after)
+            except Exception as error:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=error.args
+                )
 
-        return menus
+        return await self.cache.get_or_load(
+            page_key,
+            partial(load, self.repo),
+            list_key=keys_for_cache_invalidation.MENUS_LIST,
+            refresh=with_new_session(self.repo, load),
+        )
 
-    async def get_all_detail_data(self) -> list | Sequence:
+    async def get_all_detail_data(self) -> list[MenuTreeDTO]:
         """Get all data from database."""
-        items = await self.cache.get_obj_from_cache(keys_for_cache_invalidation.ALL_DATA)
-
-        if not items:
 
+        async def load(repo: MenuRepository) -> list[MenuTreeDTO]:
             try:
-                items = await self.repo.get_all_detail_data()
+                items = await repo.get_all_detail_data()
             except Exception as error:
                 raise HTTPException(
                     detail=error.args, status_code=status.HTTP_400_BAD_REQUEST
                 )
 
             if items:
-                for menu in items:
-                    for submenu in menu['submenus']:
-                        if submenu['dishes']:
-                            discounts = await self.cache.get_discounts()
-                            if discounts:
-                                dishes = await set_discounts(discounts, submenu['dishes'])
-                                submenu['dishes'] = dishes
-
-                await self.cache.set_value_into_cache(
-                    key=keys_for_cache_invalidation.ALL_DATA,
-                    value=items
-                )
+                discounts = await self.cache.get_discounts()
+                if discounts:
+                    for menu in items:
+                        for submenu in menu.submenus:
+                            if submenu.dishes:
+                                submenu.dishes = await set_discounts(discounts, submenu.dishes)
+
+            return items
+
+        return await self.cache.get_or_load(
+            keys_for_cache_invalidation.ALL_DATA,
+            partial(load, self.repo),
+            refresh=with_new_session(self.repo, load),
+        )
+
+    async def stream_all_detail_data(self, ndjson: bool = False) -> AsyncIterator[str]:
+        """Stream all data from database without building it in memory."""
+
+        try:
+            menus = await self.repo.stream_all_detail_data()
+        except Exception as error:
+            raise HTTPException(
+                detail=error.args, status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        discounts = await self.cache.get_discounts()
+
+        async def with_discounts():
+            async for menu in menus:
+                if discounts:
+                    menu = MenuTreeDTO.from_document(menu)
+                    for submenu in menu.submenus:
+                        if submenu.dishes:
+                            submenu.dishes = await set_discounts(discounts, submenu.dishes)
+                    menu = menu.as_dict()
+                yield menu
 
-        return items
+        return dump_json_stream(with_discounts(), ndjson=ndjson)
 
     async def create(
             self,
@@ -118,6 +132,8 @@ class MenuService:
         try:
             async with self.repo.session.begin():
                 new_menu = await self.repo.create(data.model_dump())
+                await self.repo.session.flush()
+                await self.repo.refresh_read_models(new_menu.id)
 
         except Exception as error:
             raise HTTPException(
@@ -139,7 +155,7 @@ class MenuService:
             menu_id: uuid.UUID,
             data: MenuUpdate,
             background_tasks: BackgroundTasks,
-    ) -> models.Menu | None:
+    ) -> MenuDTO | None:
         """Update menu and invalidate cache."""
 
         try:
@@ -148,6 +164,8 @@ class MenuService:
                     menu_id=menu_id,
                     data=data.model_dump(exclude_unset=True),
                 )
+                if menu:
+                    await self.repo.refresh_read_models(menu_id)
 
         except Exception as error:
             raise HTTPException(
@@ -180,6 +198,7 @@ class MenuService:
 
         try:
             async with self.repo.session.begin():
+                # The tree document is deleted with the menu.
                 is_deleted = await self.repo.delete(menu_id)
         except Exception as error:
             raise HTTPException(
@@ -193,7 +212,7 @@ class MenuService:
                     self.cache.cache_invalidate,
                     keys_for_cache_invalidation.MENUS_LIST,
                     keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
-                    invalid_key=menu_id,
+                    tags=[keys_for_cache_invalidation.MENU_TAG.format(menu_id)],
                 )
             )
 
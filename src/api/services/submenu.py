@@ -1,15 +1,16 @@
 import uuid
 from functools import partial
-from typing import Sequence
 
 from fastapi import BackgroundTasks, HTTPException, status
-from sqlalchemy import Row
 
 from src.api import keys_for_cache_invalidation
+from src.api.pagination import Pagination, get_page_key
 from src.api.repositories.submenu import SubmenuRepository
 from src.api.schemas import Status, SubmenuCreate, SubmenuUpdate
+from src.api.services.utils import with_new_session
 from src.cache.service import CacheService
 from src.db import models
+from src.db.dto import SubmenuDTO
 
 
 class SubmenuService:
@@ -23,33 +24,28 @@ class SubmenuService:
             self,
             menu_id: uuid.UUID,
             submenu_id: uuid.UUID,
-    ) -> Row | None:
+    ) -> SubmenuDTO | None:
         """Get detail of submenu from cache or DB."""
 
-        submenu = await self.cache.get_obj_from_cache(
-            keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, submenu_id)
-        )
-
-        if submenu:
-            return submenu
+        async def load(repo: SubmenuRepository) -> SubmenuDTO | None:
+            try:
+                return await repo.get_detail(
+                    submenu_id=submenu_id,
+                    menu_id=menu_id,
+                )
+            except Exception as error:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=error.args
+                )
 
-        try:
-            submenu = await self.repo.get_detail(
-                submenu_id=submenu_id,
-                menu_id=menu_id,
-            )
-        except Exception as error:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error.args
-            )
+        submenu = await self.cache.get_or_load(
+            keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, submenu_id),
+            partial(load, self.repo),
+            refresh=with_new_session(self.repo, load),
+        )
 
         if submenu:
-            await self.cache.set_value_into_cache(
-                keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, submenu_id),
-                submenu,
-            )
-
             return submenu
 
         raise HTTPException(
@@ -60,31 +56,32 @@ class SubmenuService:
     async def get_list(
             self,
             menu_id: uuid.UUID,
-    ) -> Sequence[Row]:
-        """Get list of submenus from cache or DB."""
-
-        submenus = await self.cache.get_obj_from_cache(
-            keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id)
-        )
+            pagination: Pagination,
+    ) -> list[SubmenuDTO]:
+        """Get page of submenus from cache or DB."""
 
-        if submenus:
-            return submenus
-
-        try:
-            submenus = await self.repo.get_list(menu_id=menu_id)
-        except Exception as error:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error.args
-            )
+        list_key = keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id)
+        page_key = get_page_key(list_key, pagination)
 
-        if submenus:
-            await self.cache.set_value_into_cache(
-                keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id),
-                submenus,
-            )
+        async def load(repo: SubmenuRepository) -> list[SubmenuDTO]:
+            try:
+                return await repo.get_list(
+                    menu_id=menu_id,
+                    limit=pagination.limit,
+                    after=pagination.after,
+                )
+            except Exception as error:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=error.args
+                )
 
-        return submenus
+        return await self.cache.get_or_load(
+            page_key,
+            partial(load, self.repo),
+            list_key=list_key,
+            refresh=with_new_session(self.repo, load),
+        )
 
     async def create(
             self,
@@ -100,6 +97,7 @@ class SubmenuService:
                     data=data.model_dump(),
                     menu_id=menu_id,
                 )
+                await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -122,7 +120,7 @@ class SubmenuService:
             submenu_id: uuid.UUID,
             data: SubmenuUpdate,
             background_tasks: BackgroundTasks,
-    ) -> models.Submenu | None:
+    ) -> SubmenuDTO | None:
         """Update submenu and invalidate cache."""
 
         try:
@@ -132,6 +130,8 @@ class SubmenuService:
                     submenu_id=submenu_id,
                     data=data.model_dump(exclude_unset=True),
                 )
+                if submenu:
+                    await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -168,6 +168,8 @@ class SubmenuService:
                     menu_id=menu_id,
                     submenu_id=submenu_id,
                 )
+                if deleted_submenu:
+                    await self.repo.refresh_read_models(menu_id)
         except Exception as error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -182,7 +184,7 @@ class SubmenuService:
                     keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id),
                     keys_for_cache_invalidation.MENUS_LIST,
                     keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
-                    invalid_key=submenu_id,
+                    tags=[keys_for_cache_invalidation.SUBMENU_TAG.format(submenu_id)],
                 )
             )
 
@@ -1,16 +1,62 @@
-async def set_discount(dish: dict, discount: str) -> dict:
-    dish['price'] = discount
+import decimal
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, TypeVar
+
+from src.api.repositories.abstract_repository import AbstractRepository
+from src.db.core import async_session
+from src.db.dto import DishDTO
+
+Repository = TypeVar('Repository', bound=AbstractRepository)
+
+
+async def set_discount(dish: DishDTO, discount: decimal.Decimal) -> DishDTO:
+    dish.price = discount
 
     return dish
 
 
-async def set_discounts(discounts: dict, dishes: list) -> list:
+async def set_discounts(discounts: dict[str, decimal.Decimal], dishes: list[DishDTO]) -> list[DishDTO]:
     for i in range(len(dishes) - 1, -1, -1):
         dish = dishes[i]
-        discount = discounts.get(f'discount:{dish["id"]}')
+        discount = discounts.get(str(dish.id))
         if discount is not None:
             del dishes[i]
-            dish['price'] = discount
+            dish.price = discount
             dishes.append(dish)
 
     return dishes
+
+
+async def dump_json_stream(items: AsyncIterable[dict], ndjson: bool = False) -> AsyncIterator[str]:
+    """Serialize items one by one as JSON array or NDJSON."""
+
+    if not ndjson:
+        yield '['
+
+    separator = ''
+    async for item in items:
+        if ndjson:
+            yield f'{json.dumps(item, default=str)}\n'
+        else:
+            yield f'{separator}{json.dumps(item, default=str)}'
+            separator = ','
+
+    if not ndjson:
+        yield ']'
+
+
+def with_new_session(
+        repo: Repository,
+        load: Callable[[Repository], Awaitable[Any]],
+) -> Callable[[], Awaitable[Any]]:
+    """Loader calling `load` with repository of the same type on its own DB session.
+
+    It does not depend on the request session, so it can run after the
+    request, e.g. to refresh stale cache.
+    """
+
+    async def loader() -> Any:
+        async with async_session() as session:
+            return await load(type(repo)(session=session))
+
+    return loader
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Sequence
 
 from aioredis import Redis
 
@@ -10,6 +11,24 @@ __all__ = (
     'get_redis',
 )
 
+# deletes the lock only if it was not expired and taken by another holder
+RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# adds member to set, whose expiration is only ever extended, so keys
+# registered for a shorter time don't expire the set before longer ones
+ADD_TO_SET = """
+redis.call('sadd', KEYS[1], ARGV[1])
+if redis.call('ttl', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('expire', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
 
 class AbstractCache(ABC):
 
@@ -40,26 +59,148 @@ class RedisCache(AbstractCache):
     def __init__(self, cache: Redis):
         self.cache = cache
 
-    async def get_keys_by_pattern(self, pattern: str = '*') -> list[bytes]:
-        """Get keys from cache by pattern."""
-        return await self.cache.keys(pattern)
-
     async def get(self, key: str) -> bytes | None:
         """Get data from cache by key."""
         return await self.cache.get(key)
 
-    async def set(self, key: str, value: bytes, ex: int) -> None:
-        """Set data into cache."""
-        await self.cache.set(
-            name=key,
-            value=value,
-            ex=ex,
-        )
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        """Get data and milliseconds to its expiration in one round trip."""
+
+        async with self.cache.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            value, ttl = await pipe.execute()
+
+        return value, ttl
+
+    async def scan_keys(self, pattern: str = '*', count: int = 1000) -> AsyncIterator[bytes]:
+        """Iterate over keys by pattern with SCAN, without blocking Redis."""
+
+        async for key in self.cache.scan_iter(match=pattern, count=count):
+            yield key
+
+    async def get_ttl(self, key: str) -> int:
+        """Get seconds to expiration of key."""
+
+        return await self.cache.ttl(key)
+
+    async def set(self, key: str, value: bytes, ex: int, tags: Sequence[str] = ()) -> None:
+        """Set data into cache and add its key to tag sets."""
+
+        if not tags:
+            await self.cache.set(
+                name=key,
+                value=value,
+                ex=ex,
+            )
+            return None
+
+        await self.set_many([(key, value, ex, tags)])
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get data by keys with one MGET, missing ones are None."""
+
+        if not keys:
+            return []
+
+        return await self.cache.mget(keys)
+
+    async def set_many(self, items: Sequence[tuple[str, bytes, int, Sequence[str]]]) -> None:
+        """Set data by keys for their seconds and add keys to their tag sets in one pipeline.
+
+        Expiration of tag sets is extended to the longest one of their keys, never shortened.
+        """
+
+        async with self.cache.pipeline(transaction=False) as pipe:
+            for key, value, ex, tags in items:
+                pipe.set(name=key, value=value, ex=ex)
+                for tag in tags:
+                    pipe.eval(ADD_TO_SET, 1, tag, key, ex)
+            await pipe.execute()
+
+    async def get_ttls(self, keys: Sequence[str]) -> list[int]:
+        """Get seconds to expiration of keys in one pipeline."""
+
+        async with self.cache.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            return await pipe.execute()
+
+    async def get_hash(self, key: str) -> dict[bytes, bytes]:
+        """Get all fields of hash."""
+
+        return await self.cache.hgetall(key)
+
+    async def get_hash_fields(self, key: str, fields: Sequence[str]) -> list[bytes | None]:
+        """Get values of hash fields, missing ones are None."""
+
+        return await self.cache.hmget(key, fields)
+
+    async def update_hash(self, key: str, mapping: dict[str, str], removed: Sequence[str], ex: int) -> None:
+        """Set and delete hash fields and refresh its expiration in one transaction."""
+
+        async with self.cache.pipeline(transaction=True) as pipe:
+            if mapping:
+                pipe.hset(key, mapping=mapping)
+            if removed:
+                pipe.hdel(key, *removed)
+            pipe.expire(key, ex)
+            await pipe.execute()
+
+    async def add_to_set(self, key: str, member: str, ex: int) -> None:
+        """Add member to set and extend its expiration."""
+
+        await self.add_to_sets([(key, member, ex)])
+
+    async def add_to_sets(self, members: Sequence[tuple[str, str, int]]) -> None:
+        """Add members to sets in one pipeline, expiration of a set is extended to `ex`, never shortened."""
+
+        async with self.cache.pipeline(transaction=False) as pipe:
+            for key, member, ex in members:
+                pipe.eval(ADD_TO_SET, 1, key, member, ex)
+            await pipe.execute()
+
+    async def get_union(self, keys: list[str]) -> list[bytes]:
+        """Get members of all sets by keys."""
+
+        return list(await self.cache.sunion(keys))
+
+    async def delete(self, keys: Sequence[str], batch: int = 1000) -> None:
+        """Remove data from cache by keys, with UNLINK of `batch` keys each sent in one pipeline."""
+
+        if len(keys) <= batch:
+            await self.cache.unlink(*keys)
+            return None
+
+        async with self.cache.pipeline(transaction=False) as pipe:
+            for start in range(0, len(keys), batch):
+                pipe.unlink(*keys[start:start + batch])
+            await pipe.execute()
+
+    async def exists(self, key: str) -> bool:
+        """Check that key exists."""
+
+        return bool(await self.cache.exists(key))
+
+    async def mark(self, key: str, timeout: float) -> None:
+        """Set flag key which expires after timeout seconds."""
+
+        await self.cache.set(key, 1, px=int(timeout * 1000))
+
+    async def acquire_lock(self, key: str, token: str, timeout: float) -> bool:
+        """Set lock key with token if it is not set, it expires after timeout seconds."""
+
+        return bool(await self.cache.set(key, token, px=int(timeout * 1000), nx=True))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Delete lock key if it is still held with token."""
+
+        await self.cache.eval(RELEASE_LOCK, 1, key, token)
 
-    async def delete(self, keys: list[str]) -> None:
-        """Remove data from cache by keys."""
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish message to subscribers of channel."""
 
-        await self.cache.unlink(*keys)
+        await self.cache.publish(channel, message)
 
     async def flush_all(self) -> None:
         """Remove all data from cache."""
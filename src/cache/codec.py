@@ -0,0 +1,171 @@
+import decimal
+import pickle
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any
+
+import msgpack  # type: ignore[import]
+
+from src.config import settings
+from src.db.dto import DTO, DishDTO, MenuDTO, MenuTreeDTO, SubmenuDTO, SubmenuTreeDTO
+
+__all__ = (
+    'Codec',
+    'PickleCodec',
+    'MsgpackCodec',
+    'CODECS',
+    'get_codec',
+    'encode',
+    'decode',
+)
+
+# 0xc1 is never used by msgpack and no pickle starts with it, so values
+# written before the header existed are never taken for a known format.
+HEADER = 0xc1
+
+
+class Codec(ABC):
+    """Serializer of cache values, identified by format id in the header."""
+    format_id: int
+    # raised by `loads` for corrupted data
+    errors: tuple[type[Exception], ...]
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Abstract dumps method require for implementation."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Abstract loads method require for implementation."""
+        pass
+
+
+class PickleCodec(Codec):
+    """Pickle of any Python object."""
+    format_id = 1
+    errors = (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError)
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+def _uuid_from_bytes(
+        data: bytes,
+        new=object.__new__,
+        set_attr=object.__setattr__,
+        from_bytes=int.from_bytes,
+) -> uuid.UUID:
+    """`uuid.UUID(bytes=data)` without validation of arguments, packed UUIDs are valid."""
+
+    value = new(uuid.UUID)
+    set_attr(value, 'int', from_bytes(data, 'big'))
+    set_attr(value, 'is_safe', uuid.SafeUUID.unknown)
+    return value
+
+
+class _DTOType:
+    """Unpacked marker of DTO class at the head of its values."""
+    __slots__ = ('dto',)
+
+    def __init__(self, dto: type[DTO]):
+        self.dto = dto
+
+
+class MsgpackCodec(Codec):
+    """Msgpack with extension types for UUID, Decimal and DTOs.
+
+    A DTO is packed as an array of its values headed by an empty
+    extension marker of its class, so nested DTOs are packed in one pass.
+    Codes must not change, add a new format instead.
+    """
+    format_id = 2
+    errors = (msgpack.UnpackException, ValueError, TypeError, decimal.InvalidOperation)
+
+    UUID_CODE = 1
+    DECIMAL_CODE = 2
+    DTO_CODES: dict[type[DTO], int] = {
+        MenuDTO: 16,
+        SubmenuDTO: 17,
+        DishDTO: 18,
+        MenuTreeDTO: 19,
+        SubmenuTreeDTO: 20,
+    }
+
+    def __init__(self):
+        self.packer = msgpack.Packer(default=self._default)
+        self.markers = {dto: msgpack.ExtType(code, b'') for dto, code in self.DTO_CODES.items()}
+        self.dto_types = {code: _DTOType(dto) for dto, code in self.DTO_CODES.items()}
+
+    def dumps(self, value: Any) -> bytes:
+        return self.packer.pack(value)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, list_hook=self._list_hook)
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, uuid.UUID):
+            return msgpack.ExtType(self.UUID_CODE, value.bytes)
+        if isinstance(value, decimal.Decimal):
+            return msgpack.ExtType(self.DECIMAL_CODE, str(value).encode())
+        if type(value) in self.markers:
+            return [self.markers[type(value)], *(getattr(value, name) for name in value.__slots__)]
+
+        raise TypeError(f'can not serialize {type(value).__name__!r} object')
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == self.UUID_CODE:
+            return _uuid_from_bytes(data)
+        if code == self.DECIMAL_CODE:
+            return decimal.Decimal(data.decode())
+        if code in self.dto_types:
+            return self.dto_types[code]
+
+        return msgpack.ExtType(code, data)
+
+    @staticmethod
+    def _list_hook(items: list) -> Any:
+        if items and type(items[0]) is _DTOType:
+            return items[0].dto(*items[1:])
+
+        return items
+
+
+CODECS: dict[str, Codec] = {
+    'pickle': PickleCodec(),
+    'msgpack': MsgpackCodec(),
+}
+
+FORMATS: dict[int, Codec] = {codec.format_id: codec for codec in CODECS.values()}
+
+
+def get_codec(name: str | None = None) -> Codec:
+    """Get codec by name, `CACHE_CODEC` setting by default."""
+
+    return CODECS[name or settings.CACHE_CODEC]
+
+
+def encode(value: Any, codec: Codec) -> bytes:
+    """Serialize value with codec behind the format header."""
+
+    return bytes((HEADER, codec.format_id)) + codec.dumps(value)
+
+
+def decode(data: bytes) -> Any:
+    """Deserialize value by the codec of its header.
+
+    Values without a known header or corrupted ones are `None`, the same
+    as a cache miss, so the codec can be switched without flushing the cache.
+    """
+
+    if len(data) < 2 or data[0] != HEADER or data[1] not in FORMATS:
+        return None
+
+    codec = FORMATS[data[1]]
+    try:
+        return codec.loads(data[2:])
+    except codec.errors:
+        return None
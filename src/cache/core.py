@@ -1,12 +1,52 @@
 from aioredis import Redis
 
+from src.cache.pool import MonitoredRedisPool
 from src.config import settings
 
+__all__ = (
+    'create_redis_instance',
+    'get_redis_instance',
+    'close_redis_instance',
+)
+
+_redis: Redis | None = None
+
+
+def create_redis_instance() -> Redis:
+    """Redis client on a bounded connection pool."""
 
-async def get_redis_instance() -> Redis:
-    """Redis cache configurate instance."""
     return Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=settings.REDIS_DB,
+        connection_pool=MonitoredRedisPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        ),
     )
+
+
+async def get_redis_instance() -> Redis:
+    """Shared Redis client of the process.
+
+    It is opened in the app lifespan, processes without one (Celery,
+    tests, benchmarks) get it created on first use.
+    """
+    global _redis
+
+    if _redis is None:
+        _redis = create_redis_instance()
+
+    return _redis
+
+
+async def close_redis_instance() -> None:
+    """Close shared Redis client and disconnect its pool."""
+    global _redis
+
+    if _redis is not None:
+        redis, _redis = _redis, None
+        await redis.close()
+        await redis.connection_pool.disconnect()
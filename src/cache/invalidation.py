@@ -0,0 +1,60 @@
+import asyncio
+import contextlib
+
+from aioredis import Redis, exceptions
+from loguru import logger
+
+from src.api.keys_for_cache_invalidation import INVALIDATION_CHANNEL
+from src.cache.local import LocalCache
+
+__all__ = (
+    'InvalidationListener',
+)
+
+
+class InvalidationListener:
+    """Drop keys invalidated by any process from the local cache.
+
+    The subscription holds one connection of the Redis pool while the
+    listener runs. Messages published while it is not subscribed are lost,
+    so the local cache is cleared on every (re)subscription.
+    """
+
+    def __init__(self, local: LocalCache, poll_timeout: float = 1.0, retry_delay: float = 1.0):
+        self.local = local
+        self.poll_timeout = poll_timeout
+        self.retry_delay = retry_delay
+        self.task: asyncio.Task | None = None
+
+    def start(self, redis: Redis) -> None:
+        """Start listening in background task."""
+
+        self.task = asyncio.create_task(self.listen(redis))
+
+    async def stop(self) -> None:
+        """Cancel listening task and wait for it."""
+
+        if self.task is not None:
+            task, self.task = self.task, None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def listen(self, redis: Redis) -> None:
+        """Subscribe to invalidation channel and drop published keys, resubscribe on errors."""
+
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.local.clear()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.poll_timeout)
+                    if message is not None:
+                        self.local.delete(message['data'].decode('utf-8').split('\n'))
+            except exceptions.RedisError as error:
+                logger.error(error)
+                await asyncio.sleep(self.retry_delay)
+            finally:
+                await pubsub.reset()
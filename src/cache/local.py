@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+
+from src.config import settings
+
+__all__ = (
+    'HitStats',
+    'LocalCache',
+    'local_cache',
+    'redis_stats',
+)
+
+
+class HitStats:
+    """Hits and misses of a cache tier."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        """Count lookup as hit or miss."""
+
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        """Accumulated hits, misses and hit ratio."""
+
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class LocalCache(HitStats):
+    """Bounded in-process LRU cache with TTL in front of Redis.
+
+    Values are kept decoded and shared between requests, so they must not
+    be changed after they are cached. The TTL bounds how long an entry can
+    outlive its Redis key when an invalidation message is lost. A cache
+    with zero `max_size` keeps nothing.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.evictions = 0
+        self.data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value by key, expired entry is dropped and is a miss."""
+
+        item = self.data.get(key)
+        if item is not None and item[0] <= self.clock():
+            del self.data[key]
+            item = None
+
+        self.record(item is not None)
+        if item is None:
+            return default
+
+        self.data.move_to_end(key)
+
+        return item[1]
+
+    def set(self, key: str, value: Any, ex: float | None = None) -> None:
+        """Set value for `ex` seconds at most, least recently used entries are evicted."""
+
+        if self.max_size <= 0:
+            return None
+
+        ttl = self.ttl if ex is None else min(self.ttl, ex)
+        self.data[key] = (self.clock() + ttl, value)
+        self.data.move_to_end(key)
+
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Drop entries by keys."""
+
+        for key in keys:
+            self.data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+
+        self.data.clear()
+
+    def stats(self) -> dict:
+        """Size, evictions, hits, misses and hit ratio."""
+
+        return {
+            **super().stats(),
+            'max_size': self.max_size,
+            'size': len(self.data),
+            'evictions': self.evictions,
+        }
+
+
+local_cache = LocalCache(settings.CACHE_LOCAL_MAX_SIZE, settings.CACHE_LOCAL_TTL)
+redis_stats = HitStats()
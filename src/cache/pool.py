@@ -0,0 +1,53 @@
+import time
+
+from aioredis import BlockingConnectionPool
+from aioredis.exceptions import ConnectionError
+
+__all__ = (
+    'MonitoredRedisPool',
+)
+
+
+class MonitoredRedisPool(BlockingConnectionPool):
+    """Blocking Redis pool which records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.errors = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def get_connection(self, *args, **kwargs):
+        """Get connection from the pool and record the time it took, failed waits are counted apart."""
+
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except ConnectionError:
+            self.errors += 1
+            raise
+
+        wait = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+        return connection
+
+    def stats(self) -> dict:
+        """Current pool usage and accumulated wait times."""
+
+        in_use = self.max_connections - self.pool.qsize()
+
+        return {
+            'max_connections': self.max_connections,
+            'created': len(self._connections),
+            'in_use': in_use,
+            'idle': len(self._connections) - in_use,
+            'checkouts': self.checkouts,
+            'errors': self.errors,
+            'wait_total': self.wait_total,
+            'wait_avg': self.wait_total / self.checkouts if self.checkouts else 0.0,
+            'wait_max': self.wait_max,
+        }
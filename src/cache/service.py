@@ -1,16 +1,29 @@
+import asyncio
 import decimal
-import pickle
+import time
 import uuid
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Awaitable, Callable, Sequence
 
 from aioredis import exceptions
 from loguru import logger
-from sqlalchemy import Row
 
-from src.api.keys_for_cache_invalidation import ALL_DATA
+from src.api.keys_for_cache_invalidation import (
+    ALL_DATA,
+    DISCOUNTS,
+    INVALIDATION_CHANNEL,
+    LIST_PAGES,
+    LOCK,
+    RECENT_WRITE,
+    get_tags,
+    get_ttl,
+)
 from src.cache.cache import RedisCache, get_redis
+from src.cache.codec import Codec, decode, encode, get_codec
+from src.cache.local import LocalCache, local_cache, redis_stats
 from src.config import settings
+from src.db.core import primary_reads
 
 log_path = Path(f'{settings.BASE_DIR}/logs/cache')
 log_path.mkdir(parents=True, exist_ok=True)
@@ -20,77 +33,444 @@ logger.add(f'{log_path}/cache_error.log', level='ERROR',
            compression='zip')
 
 
+_MISSING = object()
+
+# futures of keys being loaded by this process
+_loading: dict[str, asyncio.Future] = {}
+# tasks of keys being refreshed by this process
+_refreshing: dict[str, asyncio.Task] = {}
+
+
 class CacheService:
 
-    def __init__(self, cache: RedisCache):
+    def __init__(self, cache: RedisCache, codec: Codec | None = None, local: LocalCache | None = None):
         self.cache = cache
+        self.codec = codec or get_codec()
+        self.local = local_cache if local is None else local
+        self.discounts: dict[str, decimal.Decimal] | None = None
+        # whether a stale value was returned, so what is built from it is not cached
+        self.served_stale = False
+
+    async def get_discount(self, dish_id: str | uuid.UUID) -> decimal.Decimal | None:
+        """Get discount price of dish."""
+
+        discounts = await self.get_discounts([dish_id])
+
+        return discounts.get(str(dish_id))
+
+    async def get_discounts(self, dish_ids: Sequence[str | uuid.UUID] | None = None) -> dict[str, decimal.Decimal]:
+        """Get discount prices by dish id from the discounts hash.
 
-    async def get_keys_by_pattern(self, key: str) -> list:
-        """Get keys from cache by pattern."""
+        All discounts are read once per service, i.e. once per request,
+        and reused after that. Discounts of given dishes only are read
+        with HMGET until then.
+        """
+        if self.discounts is not None:
+            return self.discounts
 
-        return [key.decode('utf-8') for key in await self.cache.get_keys_by_pattern(rf'*{key}*')]
+        try:
+            if dish_ids is not None:
+                fields = [str(dish_id) for dish_id in dish_ids]
+                found = zip(fields, await self.cache.get_hash_fields(DISCOUNTS, fields))
+
+                return {field: decimal.Decimal(value.decode()) for field, value in found if value is not None}
 
-    async def get_discount(self, key: str | uuid.UUID) -> str | None:
-        """Get discount by key."""
+            values = await self.cache.get_hash(DISCOUNTS)
+        except exceptions.RedisError as error:
+            logger.error(error)
+            return {}
 
-        key = f'discount:{key}'
+        self.discounts = {field.decode(): decimal.Decimal(value.decode()) for field, value in values.items()}
+
+        return self.discounts
+
+    async def update_discounts(
+            self,
+            discounts: dict[str, decimal.Decimal],
+            removed: Sequence[str] = (),
+            ex: int | None = None,
+    ) -> None:
+        """Set and delete discount prices of dishes in the discounts hash."""
+        if ex is None:
+            ex = settings.REDIS_CACHE_EXPIRE
+        try:
+            await self.cache.update_hash(
+                DISCOUNTS,
+                {dish_id: str(price) for dish_id, price in discounts.items()},
+                removed,
+                ex=ex,
+            )
+        except exceptions.RedisError as error:
+            logger.error(error)
 
-        discounts = await self.get_discounts()
+        self.discounts = None
 
-        return discounts.get(key)
+    async def get_obj_from_cache(self, key: str) -> Any:
+        """Get object from local cache or Redis, value of unknown format is a miss."""
+        value, _ = await self._get(key)
 
-    async def get_discounts(self) -> dict:
-        """Get all discount objects."""
-        discounts = {}
-        pattern = r'*discount*'
+        return value
 
-        keys = await self.get_keys_by_pattern(pattern)
+    async def _get(self, key: str) -> tuple[Any, bool]:
+        """Get object and whether it is stale from local cache or Redis."""
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, False
 
-        for key in keys:
-            value = await self.get_obj_from_cache(key)
-            discounts[key] = value
+        return await self._get_from_redis(key)
 
-        return discounts
+    async def _get_from_redis(self, key: str, record: bool = True) -> tuple[Any, bool]:
+        """Get object and whether it is stale from Redis, fresh one is kept in local cache.
 
-    async def get_obj_from_cache(self, key: str) -> Sequence | Row | None:
-        """Get object from cache method."""
+        Value is stale for the last `hard - soft` seconds of its TTL. The
+        read is counted in Redis stats unless `record` is false.
+        """
         try:
-            value = await self.cache.get(key)
+            data, expire = await self.cache.get_with_ttl(key)
         except exceptions.RedisError:
-            value = None
+            data, expire = None, -2
 
-        return pickle.loads(value) if value else value
+        value = decode(data) if data else None
+        if record:
+            redis_stats.record(value is not None)
+        if value is None:
+            return None, False
+
+        ttl = get_ttl(key)
+        fresh = expire / 1000 - (ttl.hard - ttl.soft) if expire >= 0 else ttl.soft
+        if fresh > 0:
+            self.local.set(key, value, fresh)
+
+        return value, fresh <= 0
 
     async def set_value_into_cache(
             self,
             key: str,
-            value: Sequence | Row | decimal.Decimal,
+            value: Any,
             ex: int | None = None,
     ) -> None:
-        """Set data into cache method."""
+        """Set data into cache method, key is added to tags of its menu and submenu.
+
+        The key expires after `ex` seconds, hard TTL of its family by default.
+        """
+        ttl = get_ttl(key)
         if ex is None:
-            ex = settings.REDIS_CACHE_EXPIRE
+            ex = ttl.hard
         try:
-            value = pickle.dumps(value)
-            await self.cache.set(key, value, ex=ex)
+            await self.cache.set(key, encode(value, self.codec), ex=ex, tags=get_tags(key))
+        except exceptions.RedisError as error:
+            logger.error(error)
+        else:
+            self.local.set(key, value, ex - (ttl.hard - ttl.soft))
+
+    async def set_page_into_cache(
+            self,
+            list_key: str,
+            page_key: str,
+            value: Sequence,
+            ex: int | None = None,
+    ) -> None:
+        """Set page of list into cache and register it for list invalidation."""
+        ttl = get_ttl(page_key)
+        if ex is None:
+            ex = ttl.hard
+        try:
+            await self.cache.set(page_key, encode(value, self.codec), ex=ex, tags=get_tags(page_key))
+            await self.cache.add_to_set(LIST_PAGES.format(list_key), page_key, ex=ex)
+        except exceptions.RedisError as error:
+            logger.error(error)
+        else:
+            self.local.set(page_key, value, ex - (ttl.hard - ttl.soft))
+
+    async def get_objs_from_cache(self, keys: Sequence[str]) -> list[Any]:
+        """Get objects by keys, from local cache and the rest with one MGET, misses are None.
+
+        Objects read with MGET are not kept in local cache, as their TTL is unknown.
+        """
+        values: list[Any] = [self.local.get(key, _MISSING) for key in keys]
+        missed = [key for key, value in zip(keys, values) if value is _MISSING]
+
+        try:
+            found = iter(await self.cache.get_many(missed))
+        except exceptions.RedisError as error:
+            logger.error(error)
+            found = iter([None] * len(missed))
+
+        for i, value in enumerate(values):
+            if value is _MISSING:
+                data = next(found)
+                values[i] = decode(data) if data else None
+                redis_stats.record(values[i] is not None)
+
+        return values
+
+    async def set_values_into_cache(self, items: dict[str, Any]) -> None:
+        """Set objects by keys in one pipeline, each expires after hard TTL of its family."""
+        ttls = {key: get_ttl(key) for key in items}
+        try:
+            await self.cache.set_many(
+                [(key, encode(value, self.codec), ttls[key].hard, get_tags(key)) for key, value in items.items()]
+            )
+        except exceptions.RedisError as error:
+            logger.error(error)
+        else:
+            for key, value in items.items():
+                self.local.set(key, value, ttls[key].soft)
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            list_key: str | None = None,
+            ex: int | None = None,
+            refresh: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """Get object from cache or load it once for all concurrent misses.
+
+        Concurrent misses of the process await one load. Across processes
+        the loader holds a short Redis lock, the others poll the cache
+        until it is filled, the lock is released or the wait is over, and
+        load by themselves after that. Empty result is not cached. With
+        `list_key` the value is cached as its page.
+
+        Stale value is returned as it is and reloaded by `refresh` in
+        background. It must not depend on the request, e.g. on its DB
+        session. Without `refresh` stale value is a miss.
+        """
+        value, stale = await self._get(key)
+        if value is not None and not stale:
+            return value
+        if value is not None and refresh is not None:
+            self.served_stale = True
+            self._schedule_refresh(key, refresh, list_key, ex)
+            return value
+
+        future = _loading.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the load was cancelled, not the waiter
+                return await self.get_or_load(key, loader, list_key, ex, refresh)
+
+        future = asyncio.get_running_loop().create_future()
+        _loading[key] = future
+        try:
+            value = await self._load(key, loader, list_key, ex)
+        except Exception as error:
+            future.set_exception(error)
+            # retrieved, so the exception is not logged when nobody waits
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if not future.done():
+                future.cancel()
+            del _loading[key]
+
+        return value
+
+    async def _load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            list_key: str | None,
+            ex: int | None,
+    ) -> Any:
+        """Load object under Redis lock of key and cache it."""
+        lock = LOCK.format(key)
+        token = uuid.uuid4().hex
+
+        try:
+            locked = await self.cache.acquire_lock(lock, token, settings.CACHE_LOCK_TIMEOUT)
+        except exceptions.RedisError as error:
+            logger.error(error)
+            locked = False
+        else:
+            if not locked:
+                value = await self._wait_for_load(key, lock)
+                if value is not None:
+                    return value
+
+        try:
+            with await self._reads_after_write():
+                value = await loader()
+            await self._store(key, value, list_key, ex)
+        finally:
+            if locked:
+                await self._release_lock(lock, token)
+
+        return value
+
+    async def _wait_for_load(self, key: str, lock: str) -> Any:
+        """Poll Redis for object loaded by another process while it holds the lock.
+
+        The miss is counted once before the wait, so polls are not counted.
+        """
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(settings.CACHE_LOCK_POLL)
+
+                value, _ = await self._get_from_redis(key, record=False)
+                if value is not None:
+                    return value
+                if not await self.cache.exists(lock):
+                    # the key could be set right before the lock was released
+                    value, _ = await self._get_from_redis(key, record=False)
+                    return value
+        except exceptions.RedisError as error:
+            logger.error(error)
+
+        return None
+
+    def _schedule_refresh(
+            self,
+            key: str,
+            refresh: Callable[[], Awaitable[Any]],
+            list_key: str | None,
+            ex: int | None,
+    ) -> None:
+        """Start refresh of key in background unless it is refreshed by this process already."""
+        if key in _refreshing:
+            return None
+
+        task = asyncio.create_task(self._refresh(key, refresh, list_key, ex))
+        _refreshing[key] = task
+        task.add_done_callback(lambda _: _refreshing.pop(key, None))
+
+    async def _refresh(
+            self,
+            key: str,
+            refresh: Callable[[], Awaitable[Any]],
+            list_key: str | None,
+            ex: int | None,
+    ) -> None:
+        """Reload stale object and cache it, skipped while another process holds the lock of key."""
+        lock = LOCK.format(key)
+        token = uuid.uuid4().hex
+
+        try:
+            if not await self.cache.acquire_lock(lock, token, settings.CACHE_LOCK_TIMEOUT):
+                return None
+            try:
+                with await self._reads_after_write():
+                    value = await refresh()
+                if value:
+                    await self._store(key, value, list_key, ex)
+                else:
+                    # the data is gone, its stale value must not be served till the hard TTL
+                    await self._drop(key)
+            finally:
+                await self._release_lock(lock, token)
+        except Exception as error:
+            logger.error(error)
+
+    async def _reads_after_write(self) -> AbstractContextManager:
+        """Context of loads, reads go to the primary within the replica lag after the last write.
+
+        Otherwise a lagging replica could fill just invalidated keys with
+        rows from before the write.
+        """
+        if not settings.DB_REPLICA_DSN:
+            return nullcontext()
+
+        try:
+            written = await self.cache.exists(RECENT_WRITE)
+        except exceptions.RedisError as error:
+            logger.error(error)
+            written = True
+
+        return primary_reads() if written else nullcontext()
+
+    async def _store(self, key: str, value: Any, list_key: str | None, ex: int | None) -> None:
+        """Cache loaded object, as page of list with `list_key`."""
+        if not value:
+            return None
+
+        if list_key is None:
+            await self.set_value_into_cache(key, value, ex)
+        else:
+            await self.set_page_into_cache(list_key, key, value, ex)
+
+    async def _drop(self, key: str) -> None:
+        """Delete key from Redis and from local caches of all processes."""
+        self.local.delete([key])
+        await self.cache.delete([key])
+        await self.cache.publish(INVALIDATION_CHANNEL, key)
+
+    async def _release_lock(self, lock: str, token: str) -> None:
+        """Release lock of key taken with token."""
+        try:
+            await self.cache.release_lock(lock, token)
         except exceptions.RedisError as error:
             logger.error(error)
 
     async def cache_invalidate(
             self, *args,
-            invalid_key: uuid.UUID | None = None,
+            tags: Sequence[str] = (),
     ) -> None:
-        """Delete data from cache method by keys."""
-        keys = list(args) + [ALL_DATA]
+        """Delete data from cache method by keys and all keys of tags."""
+        keys = list(dict.fromkeys([*args, ALL_DATA]))
+        sets = list(dict.fromkeys([*(LIST_PAGES.format(key) for key in keys), *tags]))
 
         try:
-            if invalid_key:
-                cache_keys = await self.get_keys_by_pattern(rf'*{str(invalid_key)}*')
-                keys.extend(cache_keys)
+            members = [key.decode('utf-8') for key in await self.cache.get_union(sets)]
+            keys = list(dict.fromkeys([*keys, *members, *sets]))
 
             await self.cache.delete(keys)
+            await self.cache.publish(INVALIDATION_CHANNEL, '\n'.join(keys))
+            if settings.DB_REPLICA_DSN:
+                await self.cache.mark(RECENT_WRITE, settings.DB_REPLICA_LAG)
         except exceptions.RedisError as error:
             logger.error(error)
+            # keys of tags are unknown
+            self.local.clear()
+        else:
+            self.local.delete(keys)
+
+    async def backfill_tags(self, pattern: str = '*menu:*', batch: int = 1000) -> int:
+        """Add keys written before tags to their tag sets, return number of keys.
+
+        Keys are walked with SCAN, so Redis keeps serving other clients, and
+        registered by `batch` keys with two pipelines each.
+        """
+        registered = 0
+        keys: list[str] = []
+
+        async for found in self.cache.scan_keys(pattern, count=batch):
+            key = found.decode('utf-8')
+            if get_tags(key):
+                keys.append(key)
+            if len(keys) >= batch:
+                registered += await self._register_in_tags(keys)
+                keys = []
+
+        if keys:
+            registered += await self._register_in_tags(keys)
+
+        return registered
+
+    async def _register_in_tags(self, keys: list[str]) -> int:
+        """Add existing keys to their tag sets, return number of added keys."""
+        members: list[tuple[str, str, int]] = []
+        registered = 0
+
+        for key, ttl in zip(keys, await self.cache.get_ttls(keys)):
+            if ttl == -2:
+                continue
+
+            members.extend((tag, key, max(ttl, settings.REDIS_CACHE_EXPIRE)) for tag in get_tags(key))
+            registered += 1
+
+        if members:
+            await self.cache.add_to_sets(members)
+
+        return registered
 
 
 async def get_cache():
@@ -1,23 +1,26 @@
 import asyncio
 
+from loguru import logger
+
 from src.cache.service import get_cache
 from src.celery.app import app
 from src.celery.parser import Parser
 from src.celery.utils import Synchronizer
 from src.config import settings
-from src.db.core import session as async_session
+from src.db.core import async_session
+from src.db.counters import recalculate_counters
 
 
 async def run_synchronize():
     """Run synchronization."""
 
-    session = async_session
     cache = await get_cache()
     parse_data = Parser(mode=settings.FILE_READ_MODE).get_data
 
-    synchronizer = Synchronizer(session=session, excel_data=parse_data, cache=cache)
+    async with async_session() as session:
+        synchronizer = Synchronizer(session=session, excel_data=parse_data, cache=cache)
 
-    await synchronizer.setup()
+        await synchronizer.setup()
 
 
 @app.task
@@ -29,9 +32,46 @@ def synchronize_db():
     loop.run_until_complete(task)
 
 
+async def run_repair_counters():
+    """Run recalculation of submenus/dishes counters."""
+
+    async with async_session() as session:
+        await recalculate_counters(session)
+
+
+@app.task
+def repair_counters():
+    """Counters repair task."""
+
+    loop = asyncio.get_event_loop()
+    task = loop.create_task(run_repair_counters())
+    loop.run_until_complete(task)
+
+
+async def run_backfill_cache_tags():
+    """Run registration of cache keys written before tags."""
+
+    cache = await get_cache()
+    registered = await cache.backfill_tags()
+    logger.info(f'{registered} cache keys added to tags')
+
+
+@app.task
+def backfill_cache_tags():
+    """One-off migration task of cache keys to tag sets."""
+
+    loop = asyncio.get_event_loop()
+    task = loop.create_task(run_backfill_cache_tags())
+    loop.run_until_complete(task)
+
+
 app.conf.beat_schedule = {
     'sync-every-15-seconds': {
         'task': 'src.celery.tasks.synchronize_db',
         'schedule': 15.0,
     },
+    'repair-counters-every-hour': {
+        'task': 'src.celery.tasks.repair_counters',
+        'schedule': 3600.0,
+    },
 }
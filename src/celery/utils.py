@@ -1,13 +1,16 @@
-import copy
-from typing import Sequence
+import uuid
+from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from src.api import keys_for_cache_invalidation
 from src.cache.service import CacheService
 from src.db import models
+from src.db.dto import DishDTO, MenuDTO, SubmenuDTO
+from src.db.read_models import refresh_menu_tree
+from src.db.tree import FlatTreeAssembler
 
 
 class Synchronizer:
@@ -17,29 +20,33 @@ class Synchronizer:
         self.excel_data = excel_data
         self.cache = cache
 
-        self.excel_menus: dict[str, dict] = {}
-        self.excel_submenus: dict[str, dict] = {}
-        self.excel_dishes: dict[str, dict] = {}
+        self.excel_menus: dict[uuid.UUID, dict] = {}
+        self.excel_submenus: dict[uuid.UUID, dict] = {}
+        self.excel_dishes: dict[uuid.UUID, dict] = {}
 
-        self.db_menus: dict[str, dict] = {}
-        self.db_submenus: dict[str, dict] = {}
-        self.db_dishes: dict[str, dict] = {}
+        self.db_menus: dict[uuid.UUID, dict] = {}
+        self.db_submenus: dict[uuid.UUID, dict] = {}
+        self.db_dishes: dict[uuid.UUID, dict] = {}
 
         self.menus_for_update: list[dict] = []
         self.submenus_for_update: list[dict] = []
         self.dishes_for_update: list[dict] = []
 
-        self.discount_prices: list[tuple] = []
+        self.discount_prices: dict[str, Decimal] = {}
+        self.discounts_for_delete: list[str] = []
 
-        self.discounts: dict[str, str] = {}
+        self.discounts: dict[str, Decimal] = {}
 
         self.invalidate_keys: list[str] = []
+        self.invalidate_tags: list[str] = []
+
+        self.changed_menus: set[uuid.UUID] = set()
 
     async def setup(self) -> None:
         """Checking data for changes and further synchronizing them."""
 
         async with self.session.begin():
-            db_data = [item.as_dict() for item in await self.db_data()]
+            db_data = await self.db_data()
 
             self.discounts = await self.cache.get_discounts()
 
@@ -52,26 +59,104 @@ class Synchronizer:
             await self.create_items()
             await self.delete_items()
             await self.update_items()
+            await refresh_menu_tree(self.session, self.changed_menus)
+
+        # After commit, so keys are not filled again from the previous data.
+        # Discounts first, so reads after invalidation see the new prices.
+        if self.discount_prices or self.discounts_for_delete:
+            await self.cache.update_discounts(self.discount_prices, self.discounts_for_delete, ex=3600)
+
+        # Keys of all changed items are invalidated at once, in a few round trips.
+        if self.invalidate_keys or self.invalidate_tags:
+            await self.cache.cache_invalidate(*self.invalidate_keys, tags=self.invalidate_tags)
+
+        await self.warm_cache()
+
+    async def warm_cache(self) -> None:
+        """Fill invalidated detail keys of synced items from the DB.
+
+        Items are read with one query per entity. Keys filled again by
+        readers since invalidation are found with one MGET and kept, the
+        rest are set in one pipeline.
+        """
+        invalidated = set(self.invalidate_keys)
+        menu_keys = {
+            menu_id: key for menu_id in self.excel_menus
+            if (key := keys_for_cache_invalidation.DETAIL_MENU.format(menu_id)) in invalidated
+        }
+        submenu_keys = {
+            submenu_id: key for submenu_id, submenu in self.excel_submenus.items()
+            if (key := keys_for_cache_invalidation.DETAIL_SUBMENU.format(submenu['menu_id'], submenu_id)) in invalidated
+        }
+        dish_keys = {
+            dish_id: key for dish_id, dish in self.excel_dishes.items()
+            if (key := keys_for_cache_invalidation.DETAIL_DISH.format(
+                dish['menu_id'], dish['submenu_id'], dish_id
+            )) in invalidated
+        }
+
+        if not menu_keys and not submenu_keys and not dish_keys:
+            return None
 
-            if self.invalidate_keys:
-                await self.cache.cache_invalidate(*self.invalidate_keys)
-
-            if self.discount_prices:
-                for discount in self.discount_prices:
-                    await self.cache.set_value_into_cache(key=discount[0], value=discount[1], ex=3600)
+        discounts = {**self.discounts, **self.discount_prices}
+        for dish_id in self.discounts_for_delete:
+            discounts.pop(dish_id, None)
 
-    async def db_data(self) -> Sequence:
-        """Get all data."""
+        values: dict[str, Any] = {}
+        async with self.session.begin():
+            if menu_keys:
+                rows = await self.session.execute(
+                    select(
+                        models.Menu.id,
+                        models.Menu.title,
+                        models.Menu.description,
+                        models.Menu.submenus_count,
+                        models.Menu.dishes_count,
+                    ).where(models.Menu.id.in_(menu_keys))
+                )
+                values.update({menu_keys[row.id]: MenuDTO(*row) for row in rows})
+
+            if submenu_keys:
+                rows = await self.session.execute(
+                    select(
+                        models.Submenu.id,
+                        models.Submenu.title,
+                        models.Submenu.description,
+                        models.Submenu.menu_id,
+                        models.Submenu.dishes_count,
+                    ).where(models.Submenu.id.in_(submenu_keys))
+                )
+                values.update({submenu_keys[row.id]: SubmenuDTO(*row) for row in rows})
+
+            if dish_keys:
+                rows = await self.session.execute(
+                    select(
+                        models.Dish.id,
+                        models.Dish.title,
+                        models.Dish.description,
+                        models.Dish.submenu_id,
+                        models.Dish.price,
+                    ).where(models.Dish.id.in_(dish_keys))
+                )
+                for row in rows:
+                    dish = DishDTO(*row)
+                    # as in the detail endpoint, a zero discount is not applied
+                    if discount := discounts.get(str(dish.id)):
+                        dish.price = discount
+                    values[dish_keys[dish.id]] = dish
+
+        if not values:
+            return None
 
-        items = await self.session.execute(
-            select(
-                models.Menu
-            ).options(
-                joinedload(models.Menu.submenus).joinedload(models.Submenu.dishes)
-            )
+        cached = await self.cache.get_objs_from_cache(list(values))
+        await self.cache.set_values_into_cache(
+            {key: value for (key, value), found in zip(values.items(), cached) if found is None}
         )
 
-        return items.scalars().unique().all()
+    async def db_data(self) -> list[dict]:
+        """Get all data from the primary with Python types to compare with excel data."""
+
+        return [menu.as_dict() for menu in await FlatTreeAssembler().assemble(self.session)]
 
     async def update_items(self) -> None:
         """Update items from excel data."""
@@ -82,6 +167,7 @@ class Synchronizer:
             for menu in self.menus_for_update:
                 stmt = update(models.Menu).where(models.Menu.id == menu['id']).values(**menu)
                 await self.session.execute(stmt)
+                self.changed_menus.add(menu['id'])
                 self.invalidate_keys.extend(
                     [
                         keys_for_cache_invalidation.MENUS_LIST,
@@ -93,6 +179,7 @@ class Synchronizer:
             for submenu in self.submenus_for_update:
                 stmt = update(models.Submenu).where(models.Submenu.id == submenu['id']).values(**submenu)
                 await self.session.execute(stmt)
+                self.changed_menus.add(submenu['menu_id'])
                 self.invalidate_keys.extend(
                     [
                         keys_for_cache_invalidation.DETAIL_SUBMENU.format(submenu['menu_id'], submenu['id']),
@@ -102,9 +189,10 @@ class Synchronizer:
 
         if self.dishes_for_update:
             for dish in self.dishes_for_update:
-                menu_id = dish.pop('menu_id')
+                menu_id = dish['menu_id']
                 stmt = update(models.Dish).where(models.Dish.id == dish['id']).values(**dish)
                 await self.session.execute(stmt)
+                self.changed_menus.add(menu_id)
                 self.invalidate_keys.extend(
                     [
                         keys_for_cache_invalidation.DISHES_LIST.format(menu_id, dish['submenu_id']),
@@ -118,12 +206,14 @@ class Synchronizer:
         for menu in self.excel_menus:
             if menu not in self.db_menus:
                 self.session.add(models.Menu(**self.excel_menus[menu]))
+                self.changed_menus.add(menu)
                 self.invalidate_keys.append(keys_for_cache_invalidation.MENUS_LIST)
 
         for submenu in self.excel_submenus:
             if submenu not in self.db_submenus:
                 menu_id = self.excel_submenus[submenu]['menu_id']
                 self.session.add(models.Submenu(**self.excel_submenus[submenu]))
+                self.changed_menus.add(menu_id)
                 self.invalidate_keys.extend([
                     keys_for_cache_invalidation.MENUS_LIST,
                     keys_for_cache_invalidation.DETAIL_MENU.format(menu_id)]
@@ -131,9 +221,10 @@ class Synchronizer:
 
         for dish in self.excel_dishes:
             if dish not in self.db_dishes:
-                new_dish = copy.deepcopy(self.excel_dishes[dish])
-                menu_id = new_dish.pop('menu_id')
+                new_dish = self.excel_dishes[dish]
+                menu_id = new_dish['menu_id']
                 self.session.add(models.Dish(**new_dish))
+                self.changed_menus.add(menu_id)
                 self.invalidate_keys.extend(
                     [
                         keys_for_cache_invalidation.DISHES_LIST.format(menu_id, new_dish['submenu_id']),
@@ -158,58 +249,54 @@ class Synchronizer:
         )
 
         if menu_for_delete_id:
-            menus = await self.get_objects(menu_for_delete_id, models.Menu)
+            await self.session.execute(
+                delete(models.Menu).where(models.Menu.id.in_(menu_for_delete_id))
+            )
 
-            for menu in menus:
-                await self.session.delete(menu)
-                await self.cache.cache_invalidate(
+            for menu_id in menu_for_delete_id:
+                self.invalidate_keys.extend([
                     keys_for_cache_invalidation.MENUS_LIST,
-                    keys_for_cache_invalidation.DETAIL_MENU.format(menu.id),
-                    invalid_key=menu.id,
-                )
+                    keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
+                ])
+                self.invalidate_tags.append(keys_for_cache_invalidation.MENU_TAG.format(menu_id))
 
             return None
 
         if submenu_for_delete_id:
-            submenus = await self.get_objects(submenu_for_delete_id, models.Submenu)
+            await self.session.execute(
+                delete(models.Submenu).where(models.Submenu.id.in_(submenu_for_delete_id))
+            )
 
-            for submenu in submenus:
-                await self.session.delete(submenu)
-                await self.cache.cache_invalidate(
-                    keys_for_cache_invalidation.DETAIL_SUBMENU.format(submenu.menu_id, submenu.id),
-                    keys_for_cache_invalidation.SUBMENUS_LIST.format(submenu.menu_id),
+            for submenu_id in submenu_for_delete_id:
+                menu_id = self.db_submenus[submenu_id]['menu_id']
+                self.changed_menus.add(menu_id)
+                self.invalidate_keys.extend([
+                    keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, submenu_id),
+                    keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id),
                     keys_for_cache_invalidation.MENUS_LIST,
-                    keys_for_cache_invalidation.DETAIL_MENU.format(submenu.menu_id),
-                    invalid_key=submenu.id,
-                )
+                    keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
+                ])
+                self.invalidate_tags.append(keys_for_cache_invalidation.SUBMENU_TAG.format(submenu_id))
 
             return None
 
         if dish_for_delete_id:
-            dishes = [self.db_dishes[dish_id] for dish_id in dish_for_delete_id]
+            await self.session.execute(
+                delete(models.Dish).where(models.Dish.id.in_(dish_for_delete_id))
+            )
 
-            for dish in dishes:
+            for dish_id in dish_for_delete_id:
+                dish = self.db_dishes[dish_id]
                 menu_id = dish['menu_id']
-                dish_entity: type[models.Dish] | None = await self.session.get(models.Dish, dish['id'])
-
-                await self.session.delete(dish_entity)
-                await self.cache.cache_invalidate(
+                self.changed_menus.add(menu_id)
+                self.invalidate_keys.extend([
                     keys_for_cache_invalidation.DISHES_LIST.format(menu_id, dish['submenu_id']),
-                    keys_for_cache_invalidation.DETAIL_DISH.format(menu_id, dish['submenu_id'], dish['id']),
+                    keys_for_cache_invalidation.DETAIL_DISH.format(menu_id, dish['submenu_id'], dish_id),
                     keys_for_cache_invalidation.DETAIL_SUBMENU.format(menu_id, dish['submenu_id']),
                     keys_for_cache_invalidation.SUBMENUS_LIST.format(menu_id),
                     keys_for_cache_invalidation.DETAIL_MENU.format(menu_id),
                     keys_for_cache_invalidation.MENUS_LIST,
-                )
-
-    async def get_objects(self, ids, model):
-        """Get objects from db by ids."""
-
-        query = await self.session.execute(
-            select(model).filter(model.id.in_(ids))
-        )
-
-        return query.scalars().unique().all()
+                ])
 
     async def parser_data(self, data: list, is_db=False) -> None:
         """Parse data to separation of entities into separate variables."""
@@ -237,13 +324,12 @@ class Synchronizer:
                         self.db_dishes[dish['id']] = dish
                         continue
 
-                    key = f'discount:{dish["id"]}'
-                    inv_keys = await self.cache.get_keys_by_pattern(menu['id'])
+                    dish_id = str(dish['id'])
 
                     if 'discount' in dish:
 
-                        if dish['discount'] != self.discounts.get(key):
-                            self.discount_prices.append((key, dish['discount']))
+                        if dish['discount'] != self.discounts.get(dish_id):
+                            self.discount_prices[dish_id] = dish['discount']
                             self.invalidate_keys.extend([
                                 keys_for_cache_invalidation.DETAIL_DISH.format(
                                     menu['id'], submenu['id'], dish['id']
@@ -251,16 +337,22 @@ class Synchronizer:
                                 keys_for_cache_invalidation.DISHES_LIST.format(
                                     menu['id'], submenu['id']
                                 ),
-                                *inv_keys
                             ])
+                            self.invalidate_tags.append(keys_for_cache_invalidation.MENU_TAG.format(menu['id']))
                         dish.pop('discount')
 
                     else:
-                        if key in self.discounts:
+                        if dish_id in self.discounts:
+                            self.discounts_for_delete.append(dish_id)
                             self.invalidate_keys.extend([
-                                key,
-                                *inv_keys
+                                keys_for_cache_invalidation.DETAIL_DISH.format(
+                                    menu['id'], submenu['id'], dish['id']
+                                ),
+                                keys_for_cache_invalidation.DISHES_LIST.format(
+                                    menu['id'], submenu['id']
+                                ),
                             ])
+                            self.invalidate_tags.append(keys_for_cache_invalidation.MENU_TAG.format(menu['id']))
 
                     self.excel_dishes[dish['id']] = dish
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -18,16 +19,45 @@ class Settings(BaseSettings):
     BASE_DIR: str = Path(__file__).resolve().parent.parent.as_posix()
     ADMIN_FILE_PATH: str = f'{BASE_DIR}/admin/Menu.xlsx'
 
+    PAGE_LIMIT: int = 100
+    PAGE_LIMIT_MAX: int = 1000
+    # internal endpoints are served only when the token is set
+    INTERNAL_API_TOKEN: str | None = None
+
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
     DB_HOST: str
     DB_PORT: int = 5432
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_REPLICA_DSN: str | None = None
+    DB_REPLICA_LAG: float = 1.0
+    DB_RAW_READS: bool = False
+
+    MENU_TREE_ASSEMBLER: Literal['materialized', 'json_agg', 'flat', 'joinedload'] = 'materialized'
 
     REDIS_CACHE_EXPIRE: int
+    CACHE_CODEC: Literal['msgpack', 'pickle'] = 'msgpack'
+    CACHE_STALE_TTL: int = 60
+    CACHE_TTLS: dict[str, tuple[int, int]] = {}
+    CACHE_LOCAL_MAX_SIZE: int = 10000
+    CACHE_LOCAL_TTL: float = 5.0
+    CACHE_LOCK_TIMEOUT: float = 5.0
+    CACHE_LOCK_WAIT: float = 1.0
+    CACHE_LOCK_POLL: float = 0.02
     REDIS_DB: int
     REDIS_HOST: str
     REDIS_PORT: int = 6379
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5.0
+    REDIS_SOCKET_TIMEOUT: float | None = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float | None = 5.0
 
     RABBITMQ_USER: str
     RABBITMQ_PASSWORD: str
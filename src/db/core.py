@@ -1,26 +1,99 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Iterator
+
 from fastapi import Request
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import UpdateBase
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from src.config import settings
+from src.db.pool import MonitoredPool
 
 __all__ = (
     'engine',
-    'session',
+    'replica_engine',
+    'async_session',
     'get_db',
+    'PRIMARY_READS',
+    'PRIMARY_READS_HEADER',
+    'primary_reads',
 )
 
-engine = create_async_engine(
-    url=settings.DATABASE_URL,
-    echo=True,
-    future=True
-)
+PRIMARY_READS = 'primary_reads'
+PRIMARY_READS_HEADER = 'X-Read-Primary'
+
+_primary_reads: ContextVar[bool] = ContextVar(PRIMARY_READS, default=False)
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """Create engine with pool settings."""
+
+    return create_async_engine(
+        url=url,
+        echo=settings.DB_ECHO,
+        future=True,
+        poolclass=MonitoredPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+engine = create_engine(settings.DATABASE_URL)
+
+replica_engine = create_engine(settings.DB_REPLICA_DSN) if settings.DB_REPLICA_DSN else None
+
 
-session = AsyncSession(
-    bind=engine,
-    expire_on_commit=False
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Send reads of every session in the context to the primary."""
+
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class RoutingSession(Session):
+    """Session which sends marked reads to the replica.
+
+    Everything else runs on the primary. After the first write the
+    session pins all following reads to the primary as well, so does
+    `primary_reads` for sessions used in its context.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, replica: bool = False, **kwargs):
+        if replica and replica_engine is not None and not self.info.get(PRIMARY_READS) and not _primary_reads.get():
+            return replica_engine.sync_engine
+
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[PRIMARY_READS] = True
+
+        return engine.sync_engine
+
+
+async_session = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
 )
 
 
-async def get_db(request: Request):
-    """Get DB session."""
-    return request.state.db
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get request-scoped DB session.
+
+    The session checks out a pooled connection only on the first executed
+    query, so requests served from cache never touch the pool. Requests
+    with `X-Read-Primary` header read from the primary only.
+    """
+    async with async_session() as session:
+        if request.headers.get(PRIMARY_READS_HEADER):
+            session.info[PRIMARY_READS] = True
+        yield session
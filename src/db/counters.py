@@ -0,0 +1,80 @@
+import uuid
+
+from loguru import logger
+from sqlalchemy import exc, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import models
+
+__all__ = (
+    'recalculate_counters',
+    'recalculate_menu_counters',
+)
+
+
+async def recalculate_counters(session: AsyncSession) -> None:
+    """Recompute denormalized submenus/dishes counters, one menu per transaction."""
+
+    menu_ids = (await session.scalars(select(models.Menu.id))).all()
+    await session.rollback()
+
+    for menu_id in menu_ids:
+        try:
+            async with session.begin():
+                await recalculate_menu_counters(session, menu_id)
+        except exc.DBAPIError as error:
+            logger.warning(f'counters of menu {menu_id} are not repaired: {error}')
+
+
+async def recalculate_menu_counters(session: AsyncSession, menu_id: uuid.UUID) -> None:
+    """Recompute counters of the menu and its submenus.
+
+    Only the rows of the menu are locked, submenus first and the menu last,
+    in the order the triggers lock them. Writers holding them are waited
+    for, so the counts read after the locks see their dishes and submenus.
+    """
+
+    await session.execute(
+        select(models.Submenu.id).where(
+            models.Submenu.menu_id == menu_id
+        ).order_by(models.Submenu.id).with_for_update()
+    )
+    await session.execute(
+        select(models.Menu.id).where(models.Menu.id == menu_id).with_for_update()
+    )
+
+    dishes_count = select(
+        func.count(models.Dish.id)
+    ).where(
+        models.Dish.submenu_id == models.Submenu.id
+    ).scalar_subquery()
+
+    await session.execute(
+        update(models.Submenu).values(
+            dishes_count=dishes_count
+        ).where(
+            models.Submenu.menu_id == menu_id,
+            models.Submenu.dishes_count != dishes_count,
+        ).execution_options(synchronize_session=False)
+    )
+
+    submenus_count = select(
+        func.count(models.Submenu.id)
+    ).where(
+        models.Submenu.menu_id == models.Menu.id
+    ).scalar_subquery()
+    menu_dishes_count = select(
+        func.coalesce(func.sum(models.Submenu.dishes_count), 0)
+    ).where(
+        models.Submenu.menu_id == models.Menu.id
+    ).scalar_subquery()
+
+    await session.execute(
+        update(models.Menu).values(
+            submenus_count=submenus_count,
+            dishes_count=menu_dishes_count,
+        ).where(
+            models.Menu.id == menu_id,
+            (models.Menu.submenus_count != submenus_count) | (models.Menu.dishes_count != menu_dishes_count),
+        ).execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,144 @@
+import decimal
+import uuid
+
+__all__ = (
+    'DTO',
+    'MenuDTO',
+    'SubmenuDTO',
+    'DishDTO',
+    'MenuTreeDTO',
+    'SubmenuTreeDTO',
+)
+
+
+class DTO:
+    """Read result with fixed attributes.
+
+    Built positionally from a row, so the order of `__slots__` must
+    match the columns of the statement. Pickled as the class and a tuple
+    of values.
+    """
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+
+class MenuDTO(DTO):
+    """Menu with counters."""
+    __slots__ = ('id', 'title', 'description', 'submenus_count', 'dishes_count')
+
+    id: uuid.UUID
+    title: str
+    description: str | None
+    submenus_count: int
+    dishes_count: int
+
+
+class SubmenuDTO(DTO):
+    """Submenu with counter."""
+    __slots__ = ('id', 'title', 'description', 'menu_id', 'dishes_count')
+
+    id: uuid.UUID
+    title: str
+    description: str | None
+    menu_id: uuid.UUID
+    dishes_count: int
+
+
+class DishDTO(DTO):
+    """Dish."""
+    __slots__ = ('id', 'title', 'description', 'submenu_id', 'price')
+
+    id: uuid.UUID
+    title: str
+    description: str | None
+    submenu_id: uuid.UUID
+    price: decimal.Decimal
+
+    def as_dict(self):
+        """DTO to dict convert method."""
+
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'price': self.price,
+        }
+
+
+class SubmenuTreeDTO(DTO):
+    """Submenu with its dishes."""
+    __slots__ = ('id', 'title', 'description', 'dishes')
+
+    id: uuid.UUID
+    title: str
+    description: str | None
+    dishes: list[DishDTO]
+
+    def as_dict(self):
+        """DTO to dict convert method."""
+
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'dishes': [dish.as_dict() for dish in self.dishes],
+        }
+
+
+class MenuTreeDTO(DTO):
+    """Menu with its submenus and dishes."""
+    __slots__ = ('id', 'title', 'description', 'submenus')
+
+    id: uuid.UUID
+    title: str
+    description: str | None
+    submenus: list[SubmenuTreeDTO]
+
+    def as_dict(self):
+        """DTO to dict convert method."""
+
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'submenus': [submenu.as_dict() for submenu in self.submenus],
+        }
+
+    @classmethod
+    def from_document(cls, document: dict) -> 'MenuTreeDTO':
+        """Build tree from JSON document of the read model."""
+
+        return cls(
+            document['id'],
+            document['title'],
+            document['description'],
+            [
+                SubmenuTreeDTO(
+                    submenu['id'],
+                    submenu['title'],
+                    submenu['description'],
+                    [
+                        DishDTO(dish['id'], dish['title'], dish['description'], submenu['id'], dish['price'])
+                        for dish in submenu['dishes']
+                    ],
+                )
+                for submenu in document['submenus']
+            ],
+        )
@@ -1,9 +1,11 @@
 import uuid
 
-from sqlalchemy import DECIMAL, ForeignKey, String
+from sqlalchemy import DECIMAL, ForeignKey, ForeignKeyConstraint, Index, String, UniqueConstraint, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from src.db import triggers
+
 
 class Base(DeclarativeBase):
     """Base model."""
@@ -21,9 +23,11 @@ class Menu(Base):
         String(155), unique=True, nullable=False
     )
     description: Mapped[String | None] = mapped_column(String(500))
+    submenus_count: Mapped[int] = mapped_column(default=0, server_default='0')
+    dishes_count: Mapped[int] = mapped_column(default=0, server_default='0')
 
     submenus: Mapped[list['Submenu']] = relationship(
-        back_populates='menu', cascade='all, delete-orphan'
+        back_populates='menu', cascade='all, delete-orphan', passive_deletes=True
     )
 
     def as_dict(self):
@@ -43,6 +47,9 @@ class Menu(Base):
 class Submenu(Base):
     """Submenu model."""
     __tablename__ = 'submenus'
+    __table_args__ = (
+        UniqueConstraint('menu_id', 'id', name='uq_submenus_menu_id_id'),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -51,11 +58,12 @@ class Submenu(Base):
         String(155), unique=True, nullable=False
     )
     description: Mapped[str | None] = mapped_column(String(500))
-    menu_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('menus.id'))
+    menu_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('menus.id', ondelete='CASCADE'))
+    dishes_count: Mapped[int] = mapped_column(default=0, server_default='0')
 
     menu: Mapped['Menu'] = relationship(back_populates='submenus')
     dishes: Mapped[list['Dish']] = relationship(
-        back_populates='submenu', cascade='all, delete-orphan'
+        back_populates='submenu', cascade='all, delete-orphan', passive_deletes=True
     )
 
     def as_dict(self):
@@ -75,6 +83,19 @@ class Submenu(Base):
 class Dish(Base):
     """Dish model."""
     __tablename__ = 'dishes'
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['submenu_id', 'menu_id'],
+            ['submenus.id', 'submenus.menu_id'],
+            name='fk_dishes_submenu_id_menu_id',
+            onupdate='CASCADE',
+            ondelete='CASCADE',
+        ),
+        Index(
+            'ix_dishes_menu_id_submenu_id_id', 'menu_id', 'submenu_id', 'id',
+            postgresql_include=['title', 'description', 'price'],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -84,7 +105,8 @@ class Dish(Base):
     )
     description: Mapped[str | None] = mapped_column(String(500))
     price: Mapped[DECIMAL] = mapped_column(DECIMAL(10, 2))
-    submenu_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('submenus.id'))
+    submenu_id: Mapped[uuid.UUID]
+    menu_id: Mapped[uuid.UUID]
 
     submenu: Mapped['Submenu'] = relationship(back_populates='dishes')
 
@@ -103,4 +125,12 @@ class Dish(Base):
                 f'id={self.id},'
                 f' title={self.title},'
                 f' submenu={self.submenu_id},'
+                f' menu={self.menu_id},'
                 f' price={self.price})')
+
+
+for ddl in triggers.SUBMENUS_COUNTERS:
+    event.listen(Submenu.__table__, 'after_create', ddl)
+
+for ddl in triggers.DISHES_COUNTERS:
+    event.listen(Dish.__table__, 'after_create', ddl)
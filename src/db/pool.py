@@ -0,0 +1,56 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+__all__ = (
+    'MonitoredPool',
+)
+
+
+class MonitoredPool(AsyncAdaptedQueuePool):
+    """Async queue pool which records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        """Get connection from the pool and record the time it took.
+
+        Timed out waits are counted apart from checkouts, so exhaustion of
+        the pool is not hidden in the wait times of successful ones.
+        """
+
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+
+        wait = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+        return connection
+
+    def stats(self) -> dict:
+        """Current pool usage and accumulated wait times."""
+
+        return {
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'idle': self.checkedin(),
+            'overflow': max(self.overflow(), 0),
+            'max_overflow': self._max_overflow,
+            'checkouts': self.checkouts,
+            'timeouts': self.timeouts,
+            'wait_total': self.wait_total,
+            'wait_avg': self.wait_total / self.checkouts if self.checkouts else 0.0,
+            'wait_max': self.wait_max,
+        }
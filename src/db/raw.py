@@ -0,0 +1,56 @@
+from functools import cache
+from typing import NamedTuple, cast
+
+from asyncpg import Connection, Record  # type: ignore[import]
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.core import engine
+
+__all__ = (
+    'RawStatement',
+    'compile_raw',
+    'fetch_raw',
+)
+
+
+class RawStatement(NamedTuple):
+    """Statement compiled for the driver with names of its positional parameters."""
+    sql: str
+    params: tuple[str, ...]
+
+
+@cache
+def compile_raw(statement: ClauseElement) -> RawStatement:
+    """Compile shared statement to asyncpg SQL once per process."""
+
+    compiled = engine.dialect.statement_compiler(engine.dialect, statement)
+
+    return RawStatement(compiled.string, tuple(compiled.positiontup or ()))
+
+
+async def fetch_raw(
+        session: AsyncSession,
+        statement: Executable,
+        params: dict | None = None,
+        replica: bool = True,
+) -> list[Record]:
+    """Run statement directly on the asyncpg connection of the session.
+
+    Records are decoded by asyncpg only, without SQLAlchemy result
+    processing. The connection is taken from the session, so the replica
+    routing and the current transaction still apply.
+    """
+
+    raw = compile_raw(cast(ClauseElement, statement))
+    params = params or {}
+
+    connection = await session.connection(bind_arguments={'replica': replica})
+    driver_connection: Connection = (await connection.get_raw_connection()).driver_connection
+
+    # The asyncpg adapter begins the transaction with its first statement, which
+    # the driver connection doesn't go through.
+    if not driver_connection.is_in_transaction():
+        await connection.exec_driver_sql('SELECT 1')
+
+    return await driver_connection.fetch(raw.sql, *(params[name] for name in raw.params))
@@ -0,0 +1,79 @@
+import uuid
+from typing import Iterable
+
+from sqlalchemy import Column, ForeignKey, Table, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import Base, Menu
+
+__all__ = (
+    'MENU_TREE_QUERY',
+    'menu_tree',
+    'refresh_menu_tree',
+)
+
+menu_tree = Table(
+    'menu_tree',
+    Base.metadata,
+    Column('id', UUID(as_uuid=True), ForeignKey('menus.id', ondelete='CASCADE'), primary_key=True),
+    Column('document', JSONB, nullable=False),
+)
+
+MENU_TREE_QUERY = """
+    SELECT menus.id,
+           jsonb_build_object(
+               'id', menus.id,
+               'title', menus.title,
+               'description', menus.description,
+               'submenus', coalesce((
+                   SELECT jsonb_agg(jsonb_build_object(
+                       'id', submenus.id,
+                       'title', submenus.title,
+                       'description', submenus.description,
+                       'dishes', coalesce((
+                           SELECT jsonb_agg(jsonb_build_object(
+                               'id', dishes.id,
+                               'title', dishes.title,
+                               'description', dishes.description,
+                               'price', dishes.price::text
+                           ))
+                           FROM dishes
+                           WHERE dishes.menu_id = submenus.menu_id
+                             AND dishes.submenu_id = submenus.id
+                       ), '[]'::jsonb)
+                   ))
+                   FROM submenus
+                   WHERE submenus.menu_id = menus.id
+               ), '[]'::jsonb)
+           ) AS document
+    FROM menus
+"""
+
+MENU_TREE_UPSERT = text(
+    f"""
+    INSERT INTO menu_tree (id, document)
+    {MENU_TREE_QUERY}
+    WHERE menus.id = ANY(:menu_ids)
+    ON CONFLICT (id) DO UPDATE SET document = excluded.document
+    """
+).bindparams(bindparam('menu_ids', type_=ARRAY(UUID(as_uuid=True))))
+
+
+async def refresh_menu_tree(session: AsyncSession, menu_ids: Iterable[uuid.UUID]) -> None:
+    """Rebuild documents of the menus in the current transaction.
+
+    Menu rows are locked first, so a concurrent refresh of the same menu
+    waits for this transaction and reads its changes. Documents of deleted
+    menus are deleted with them by the foreign key.
+    """
+
+    menu_ids = sorted(set(menu_ids))
+    if not menu_ids:
+        return None
+
+    await session.flush()
+    await session.execute(
+        select(Menu.id).where(Menu.id.in_(menu_ids)).order_by(Menu.id).with_for_update(key_share=True)
+    )
+    await session.execute(MENU_TREE_UPSERT, {'menu_ids': menu_ids})
@@ -0,0 +1,167 @@
+import uuid
+from abc import ABC, abstractmethod
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from src.config import settings
+from src.db import models
+from src.db.dto import DishDTO, MenuTreeDTO, SubmenuTreeDTO
+from src.db.read_models import MENU_TREE_QUERY, menu_tree
+
+__all__ = (
+    'TreeAssembler',
+    'MaterializedTreeAssembler',
+    'JsonAggTreeAssembler',
+    'FlatTreeAssembler',
+    'JoinedLoadTreeAssembler',
+    'TREE_ASSEMBLERS',
+    'get_tree_assembler',
+)
+
+
+class TreeAssembler(ABC):
+    """Builds the list of all menus with submenus and dishes."""
+
+    @abstractmethod
+    async def assemble(self, session: AsyncSession, replica: bool = False) -> list[MenuTreeDTO]:
+        """Abstract assemble method require for implementation."""
+        pass
+
+    @staticmethod
+    def _bind(replica: bool) -> dict:
+        """Bind arguments of read statements."""
+
+        return {'replica': replica}
+
+
+class MaterializedTreeAssembler(TreeAssembler):
+    """Tree documents from `menu_tree` read model."""
+
+    async def assemble(self, session: AsyncSession, replica: bool = False) -> list[MenuTreeDTO]:
+        result = await session.execute(
+            select(menu_tree.c.document),
+            bind_arguments=self._bind(replica),
+        )
+
+        return [MenuTreeDTO.from_document(document) for document in result.scalars()]
+
+
+class JsonAggTreeAssembler(TreeAssembler):
+    """Tree built by Postgres in a single JSON document."""
+
+    statement = text(
+        f"SELECT coalesce(jsonb_agg(tree.document), '[]'::jsonb) FROM ({MENU_TREE_QUERY}) AS tree"
+    )
+
+    async def assemble(self, session: AsyncSession, replica: bool = False) -> list[MenuTreeDTO]:
+        result = await session.execute(self.statement, bind_arguments=self._bind(replica))
+
+        return [MenuTreeDTO.from_document(document) for document in result.scalar_one()]
+
+
+class FlatTreeAssembler(TreeAssembler):
+    """Tree stitched from three flat queries.
+
+    Unlike the JSON engines ids and prices keep their Python types, the
+    same as `Menu.as_dict`.
+    """
+
+    async def assemble(self, session: AsyncSession, replica: bool = False) -> list[MenuTreeDTO]:
+        bind = self._bind(replica)
+
+        menus = await session.execute(
+            select(models.Menu.id, models.Menu.title, models.Menu.description),
+            bind_arguments=bind,
+        )
+        submenus = await session.execute(
+            select(
+                models.Submenu.id,
+                models.Submenu.title,
+                models.Submenu.description,
+                models.Submenu.menu_id,
+            ),
+            bind_arguments=bind,
+        )
+        dishes = await session.execute(
+            select(
+                models.Dish.id,
+                models.Dish.title,
+                models.Dish.description,
+                models.Dish.submenu_id,
+                models.Dish.price,
+            ),
+            bind_arguments=bind,
+        )
+
+        tree: list[MenuTreeDTO] = []
+        menu_submenus: dict[uuid.UUID, list[SubmenuTreeDTO]] = {}
+        submenu_dishes: dict[uuid.UUID, list[DishDTO]] = {}
+
+        for menu_id, title, description in menus:
+            menu_submenus[menu_id] = []
+            tree.append(MenuTreeDTO(menu_id, title, description, menu_submenus[menu_id]))
+
+        # Rows created between the queries have no parent here and are skipped.
+        for submenu_id, title, description, menu_id in submenus:
+            if menu_id in menu_submenus:
+                submenu_dishes[submenu_id] = []
+                menu_submenus[menu_id].append(
+                    SubmenuTreeDTO(submenu_id, title, description, submenu_dishes[submenu_id])
+                )
+
+        for dish in dishes:
+            if dish.submenu_id in submenu_dishes:
+                submenu_dishes[dish.submenu_id].append(DishDTO(*dish))
+
+        return tree
+
+
+class JoinedLoadTreeAssembler(TreeAssembler):
+    """Tree from ORM objects loaded with joined eager loading."""
+
+    async def assemble(self, session: AsyncSession, replica: bool = False) -> list[MenuTreeDTO]:
+        result = await session.execute(
+            select(
+                models.Menu
+            ).options(
+                joinedload(models.Menu.submenus).joinedload(models.Submenu.dishes)
+            ),
+            bind_arguments=self._bind(replica),
+        )
+
+        return [
+            MenuTreeDTO(
+                menu.id,
+                menu.title,
+                menu.description,
+                [
+                    SubmenuTreeDTO(
+                        submenu.id,
+                        submenu.title,
+                        submenu.description,
+                        [
+                            DishDTO(dish.id, dish.title, dish.description, dish.submenu_id, dish.price)
+                            for dish in submenu.dishes
+                        ],
+                    )
+                    for submenu in menu.submenus
+                ],
+            )
+            for menu in result.scalars().unique().all()
+        ]
+
+
+TREE_ASSEMBLERS: dict[str, type[TreeAssembler]] = {
+    'materialized': MaterializedTreeAssembler,
+    'json_agg': JsonAggTreeAssembler,
+    'flat': FlatTreeAssembler,
+    'joinedload': JoinedLoadTreeAssembler,
+}
+
+
+def get_tree_assembler(name: str | None = None) -> TreeAssembler:
+    """Get tree assembler by name, `MENU_TREE_ASSEMBLER` setting by default."""
+
+    return TREE_ASSEMBLERS[name or settings.MENU_TREE_ASSEMBLER]()
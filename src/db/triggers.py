@@ -0,0 +1,72 @@
+from sqlalchemy import DDL
+
+__all__ = (
+    'SUBMENUS_COUNTERS',
+    'DISHES_COUNTERS',
+)
+
+SUBMENUS_COUNTERS = (
+    DDL("""
+        CREATE OR REPLACE FUNCTION submenus_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.menu_id = NEW.menu_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE menus
+                SET submenus_count = submenus_count + 1,
+                    dishes_count = dishes_count + NEW.dishes_count
+                WHERE id = NEW.menu_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE menus
+                SET submenus_count = submenus_count - 1,
+                    dishes_count = dishes_count - OLD.dishes_count
+                WHERE id = OLD.menu_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+    DDL("""
+        CREATE TRIGGER submenus_counters
+        AFTER INSERT OR DELETE OR UPDATE OF menu_id ON submenus
+        FOR EACH ROW EXECUTE FUNCTION submenus_counters()
+    """),
+)
+
+DISHES_COUNTERS = (
+    DDL("""
+        CREATE OR REPLACE FUNCTION dishes_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.submenu_id = NEW.submenu_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE submenus
+                SET dishes_count = dishes_count + 1
+                WHERE id = NEW.submenu_id;
+                UPDATE menus
+                SET dishes_count = menus.dishes_count + 1
+                FROM submenus
+                WHERE submenus.id = NEW.submenu_id AND menus.id = submenus.menu_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE submenus
+                SET dishes_count = dishes_count - 1
+                WHERE id = OLD.submenu_id;
+                UPDATE menus
+                SET dishes_count = menus.dishes_count - 1
+                FROM submenus
+                WHERE submenus.id = OLD.submenu_id AND menus.id = submenus.menu_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+    DDL("""
+        CREATE TRIGGER dishes_counters
+        AFTER INSERT OR DELETE OR UPDATE OF submenu_id ON dishes
+        FOR EACH ROW EXECUTE FUNCTION dishes_counters()
+    """),
+)
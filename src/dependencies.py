@@ -1,5 +1,7 @@
+import secrets
+
 from aioredis import Redis
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.repositories.dish import DishRepository
@@ -11,6 +13,7 @@ from src.api.services.submenu import SubmenuService
 from src.cache.cache import RedisCache
 from src.cache.core import get_redis_instance
 from src.cache.service import CacheService
+from src.config import settings
 from src.db.core import get_db
 
 __all__ = (
@@ -22,8 +25,12 @@ __all__ = (
     'get_menu_service',
     'get_submenu_service',
     'get_dish_service',
+    'verify_internal_token',
+    'INTERNAL_TOKEN_HEADER',
 )
 
+INTERNAL_TOKEN_HEADER = 'X-Internal-Token'
+
 
 async def get_menu_repo(
         session: AsyncSession = Depends(get_db),
@@ -84,3 +91,15 @@ async def get_dish_service(
     """Instance of DishService."""
 
     return DishService(repo=repo, cache=cache)
+
+
+async def verify_internal_token(
+        token: str | None = Header(default=None, alias=INTERNAL_TOKEN_HEADER),
+) -> None:
+    """Allow internal endpoints to callers with the internal API token only."""
+
+    if not token or not secrets.compare_digest(token, settings.INTERNAL_API_TOKEN or ''):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='invalid internal token'
+        )
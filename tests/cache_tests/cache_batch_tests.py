@@ -0,0 +1,77 @@
+import uuid
+
+import aioredis
+import pytest
+from aioredis.client import Pipeline
+
+from src.api.keys_for_cache_invalidation import DETAIL_MENU, MENU_TAG
+from src.cache.cache import get_redis
+from src.cache.core import get_redis_instance
+from src.cache.service import CacheService
+
+
+def count_round_trips(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every single command and every pipeline sent to Redis."""
+
+    sent: list[str] = []
+    execute_command = aioredis.Redis.execute_command
+    execute = Pipeline.execute
+
+    async def count_command(self, *args, **options):
+        sent.append(args[0])
+        return await execute_command(self, *args, **options)
+
+    async def count_pipeline(self, *args, **kwargs):
+        sent.append('PIPELINE')
+        return await execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(aioredis.Redis, 'execute_command', count_command)
+    monkeypatch.setattr(Pipeline, 'execute', count_pipeline)
+
+    return sent
+
+
+class TestCacheBatch:
+    """Many keys are read, written and deleted in a few round trips."""
+
+    async def test_set_and_get_many(self, redis_cache: CacheService):
+        """Test that values set in one pipeline are read with one MGET, misses are None."""
+
+        menu_ids = [uuid.uuid4() for _ in range(3)]
+        keys = [DETAIL_MENU.format(menu_id) for menu_id in menu_ids]
+
+        await redis_cache.set_values_into_cache({key: [i] for i, key in enumerate(keys)})
+        values = await redis_cache.get_objs_from_cache([*keys, f'batch:{uuid.uuid4()}'])
+
+        assert values == [[0], [1], [2], None]
+        assert await (await get_redis_instance()).sismember(MENU_TAG.format(menu_ids[0]), keys[0])
+
+        await redis_cache.cache_invalidate(*keys)
+
+        assert await redis_cache.get_objs_from_cache(keys) == [None, None, None]
+
+    async def test_set_and_get_many_round_trips(self, redis_cache: CacheService, monkeypatch: pytest.MonkeyPatch):
+        """Test that any number of keys is set in one round trip and read in one more."""
+
+        keys = [DETAIL_MENU.format(uuid.uuid4()) for _ in range(100)]
+        sent = count_round_trips(monkeypatch)
+
+        await redis_cache.set_values_into_cache({key: [i] for i, key in enumerate(keys)})
+        values = await redis_cache.get_objs_from_cache(keys)
+
+        assert values == [[i] for i in range(len(keys))]
+        assert sent == ['PIPELINE', 'MGET']
+
+        await redis_cache.cache_invalidate(*keys)
+
+    async def test_delete_in_batches(self):
+        """Test that keys are deleted when there are more of them than in one UNLINK."""
+
+        keys = [f'batch:{uuid.uuid4()}' for _ in range(5)]
+        redis = await get_redis_instance()
+        for key in keys:
+            await redis.set(key, b'', ex=60)
+
+        await (await get_redis()).delete(keys, batch=2)
+
+        assert await redis.exists(*keys) == 0
@@ -0,0 +1,91 @@
+import decimal
+import pickle
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+
+from src.cache.cache import get_redis
+from src.cache.codec import CODECS, decode, encode, get_codec
+from src.cache.local import LocalCache
+from src.cache.service import CacheService
+from src.db.dto import DishDTO, MenuTreeDTO, SubmenuTreeDTO
+
+
+def make_tree() -> list[MenuTreeDTO]:
+    """Tree with every type packed by the codecs."""
+
+    dish = DishDTO(uuid.uuid4(), 'My dish 1', 'My dish description 1', uuid.uuid4(), decimal.Decimal('12.50'))
+
+    return [
+        MenuTreeDTO(
+            uuid.uuid4(), 'My menu 1', 'My menu description 1',
+            [SubmenuTreeDTO(uuid.uuid4(), 'My submenu 1', 'My submenu description 1', [dish])],
+        )
+    ]
+
+
+class TestCacheCodec:
+    """Cache values keep their types and the format header is respected."""
+
+    @pytest.mark.parametrize('name', CODECS)
+    async def test_codec_round_trip(self, name: str):
+        """Test that the codec restores DTOs, UUIDs and Decimals."""
+
+        tree = make_tree()
+
+        assert decode(encode(tree, get_codec(name))) == tree
+
+    async def test_value_without_header_is_miss(self):
+        """Test that a value written before the header is not decoded."""
+
+        assert decode(pickle.dumps(make_tree())) is None
+
+    @pytest.mark.parametrize('name', CODECS)
+    async def test_corrupted_value_is_miss(self, name: str):
+        """Test that a value with known header and corrupted body is not decoded."""
+
+        data = encode(make_tree(), get_codec(name))
+
+        assert decode(data[:len(data) // 2]) is None
+        assert decode(data[:2] + b'\xff' * 8 + data[10:]) is None
+
+    async def test_codec_switch_without_flush(self):
+        """Test that a value of the previous codec is still read after switch."""
+
+        tree = make_tree()
+        key = f'codec:{uuid.uuid4()}'
+
+        local = LocalCache(max_size=0, ttl=0)
+
+        await CacheService(await get_redis(), codec=get_codec('pickle'), local=local).set_value_into_cache(key, tree)
+        cache = CacheService(await get_redis(), codec=get_codec('msgpack'), local=local)
+
+        assert await cache.get_obj_from_cache(key) == tree
+
+        await cache.cache_invalidate(key)
+
+    async def test_menu_create_for_cache_codec_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of cached reads."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_cached_menu_same_as_first_read(
+            self,
+            get_app: FastAPI,
+            client: AsyncClient,
+            get_menu_id: uuid.UUID,
+    ):
+        """Test that the second read, served from cache, gives the same menu."""
+
+        url = get_app.url_path_for('get_detail_menu', menu_id=get_menu_id)
+
+        first = await client.get(url)
+        second = await client.get(url)
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
@@ -0,0 +1,101 @@
+import uuid
+
+from httpx import Response
+
+from src.api.keys_for_cache_invalidation import DETAIL_SUBMENU, MENU_TAG, SUBMENU_TAG, get_tags
+from src.cache.core import get_redis_instance
+from src.cache.service import get_cache
+
+
+class TestCacheTags:
+    """Cache keys are registered in tags of their menu and submenu."""
+
+    async def test_get_tags_of_keys(self):
+        """Test that tags are taken from ids of menu and submenu in the key."""
+
+        menu_id, submenu_id, dish_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        assert get_tags(f'menu:{menu_id}:submenu:{submenu_id}:dish:{dish_id}') == [
+            MENU_TAG.format(menu_id),
+            SUBMENU_TAG.format(submenu_id),
+        ]
+        assert get_tags(f'menu:{menu_id}:list_of_submenus:page:100:{submenu_id}') == [MENU_TAG.format(menu_id)]
+        assert get_tags(MENU_TAG.format(menu_id)) == []
+
+    async def test_tag_expiration_not_shortened(self):
+        """Test that a key cached for a shorter time doesn't shorten expiration of its tag."""
+
+        menu_id = uuid.uuid4()
+        tag = MENU_TAG.format(menu_id)
+        redis = await get_redis_instance()
+        cache = await get_cache()
+
+        await cache.cache.set(f'menu:{menu_id}:long', b'1', ex=80, tags=[tag])
+        await cache.cache.set(f'menu:{menu_id}:short', b'1', ex=20, tags=[tag])
+
+        assert await redis.ttl(tag) > 20
+
+        await cache.cache_invalidate(tags=[tag])
+
+        assert not await redis.exists(f'menu:{menu_id}:long')
+
+    async def test_menu_create_for_cache_tag_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of cache tags."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_cache_tag_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of cache tags."""
+
+        assert create_submenu_response.status_code == 201
+
+    async def test_cached_submenu_in_tags(
+            self,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+            detail_submenu_response: Response,
+    ):
+        """Test that the cached submenu is in tags of its menu and of itself."""
+
+        redis = await get_redis_instance()
+        key = DETAIL_SUBMENU.format(get_menu_id, get_submenu_id)
+
+        assert detail_submenu_response.status_code == 200
+        assert await redis.sismember(MENU_TAG.format(get_menu_id), key)
+        assert await redis.sismember(SUBMENU_TAG.format(get_submenu_id), key)
+        assert await redis.ttl(SUBMENU_TAG.format(get_submenu_id)) > 0
+
+    async def test_delete_submenu_drops_tagged_keys(
+            self,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+            delete_submenu_response: Response,
+    ):
+        """Test that deleting the submenu drops its keys and its tag."""
+
+        redis = await get_redis_instance()
+
+        assert delete_submenu_response.status_code == 200
+        assert not await redis.exists(DETAIL_SUBMENU.format(get_menu_id, get_submenu_id))
+        assert not await redis.exists(SUBMENU_TAG.format(get_submenu_id))
+
+    async def test_backfill_tags(self):
+        """Test that keys written before tags are added to their tags."""
+
+        redis = await get_redis_instance()
+        menu_id = uuid.uuid4()
+        key = f'menu:{menu_id}'
+
+        await redis.set(key, b'', ex=60)
+        registered = await (await get_cache()).backfill_tags()
+
+        assert registered >= 1
+        assert await redis.sismember(MENU_TAG.format(menu_id), key)
+
+        await redis.unlink(key, MENU_TAG.format(menu_id))
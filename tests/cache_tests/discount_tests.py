@@ -0,0 +1,89 @@
+import decimal
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+
+from src.api.keys_for_cache_invalidation import DETAIL_DISH, DISHES_LIST
+from src.cache.service import get_cache
+
+
+class TestDiscounts:
+    """Discount prices are read from the discounts hash."""
+
+    async def test_menu_create_for_discount_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of discounts."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_discount_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of discounts."""
+
+        assert create_submenu_response.status_code == 201
+
+    @pytest.mark.parametrize(
+        'create_dish_response', [
+            'create_dish_data',
+        ],
+        indirect=['create_dish_response']
+    )
+    async def test_dish_create_for_discount_tests(
+            self,
+            create_dish_response: Response,
+    ):
+        """Test creating a dish for further testing of discounts."""
+
+        assert create_dish_response.status_code == 201
+
+    async def test_dish_with_discount(
+            self,
+            get_app: FastAPI,
+            client: AsyncClient,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+            get_dish_id: uuid.UUID,
+    ):
+        """Test that detail and list of dishes show the discount price."""
+
+        cache = await get_cache()
+        await cache.update_discounts({str(get_dish_id): decimal.Decimal('1.50')}, ex=60)
+        await cache.cache_invalidate(
+            DISHES_LIST.format(get_menu_id, get_submenu_id),
+            DETAIL_DISH.format(get_menu_id, get_submenu_id, get_dish_id),
+        )
+
+        dish = await client.get(
+            get_app.url_path_for('get_detail_dish', menu_id=get_menu_id, submenu_id=get_submenu_id, dish_id=get_dish_id)
+        )
+        dishes = await client.get(
+            get_app.url_path_for('get_list_dish', menu_id=get_menu_id, submenu_id=get_submenu_id)
+        )
+
+        assert decimal.Decimal(dish.json()['price']) == decimal.Decimal('1.50')
+        assert decimal.Decimal(dishes.json()[0]['price']) == decimal.Decimal('1.50')
+
+    async def test_discounts_read_once(self):
+        """Test that all discounts are read once per cache service."""
+
+        cache = await get_cache()
+        discounts = await cache.get_discounts()
+
+        assert await cache.get_discounts() is discounts
+
+    async def test_delete_discount(
+            self,
+            get_dish_id: uuid.UUID,
+    ):
+        """Test that the deleted discount is not read anymore."""
+
+        cache = await get_cache()
+        await cache.update_discounts({}, removed=[str(get_dish_id)], ex=60)
+
+        assert await cache.get_discount(get_dish_id) is None
@@ -0,0 +1,102 @@
+import asyncio
+import uuid
+
+from httpx import Response
+
+from src.api.keys_for_cache_invalidation import DETAIL_MENU, INVALIDATION_CHANNEL
+from src.cache.cache import get_redis
+from src.cache.core import get_redis_instance
+from src.cache.invalidation import InvalidationListener
+from src.cache.local import LocalCache, local_cache
+from src.cache.service import CacheService
+
+
+class Clock:
+    """Clock moved by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache:
+    """Local cache keeps recent values for a short time and drops invalidated ones."""
+
+    async def test_least_recently_used_evicted(self):
+        """Test that the least recently used entry is evicted first."""
+
+        cache = LocalCache(max_size=2, ttl=10)
+        cache.set('first', 1)
+        cache.set('second', 2)
+        cache.get('first')
+        cache.set('third', 3)
+
+        assert cache.get('second') is None
+        assert cache.get('first') == 1
+        assert cache.stats()['evictions'] == 1
+
+    async def test_entry_expires(self):
+        """Test that the entry is a miss after its TTL, the shorter one of cache and value."""
+
+        clock = Clock()
+        cache = LocalCache(max_size=10, ttl=5, clock=clock)
+        cache.set('long', 1)
+        cache.set('short', 2, ex=1)
+        clock.now = 2
+
+        assert cache.get('short') is None
+        assert cache.get('long') == 1
+
+        clock.now = 5
+
+        assert cache.get('long') is None
+        assert cache.stats()['hit_ratio'] == 1 / 3
+
+    async def test_menu_create_for_local_cache_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of the local cache."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_cached_menu_in_local_cache(
+            self,
+            get_menu_id: uuid.UUID,
+            detail_menu_response: Response,
+    ):
+        """Test that the cached menu is kept in the local cache as well."""
+
+        assert detail_menu_response.status_code == 200
+        assert local_cache.get(DETAIL_MENU.format(get_menu_id)) is not None
+
+    async def test_invalidation_reaches_other_processes(
+            self,
+            get_menu_id: uuid.UUID,
+    ):
+        """Test that invalidation drops the local copy of a listening process."""
+
+        key = DETAIL_MENU.format(get_menu_id)
+        redis = await get_redis_instance()
+        other = LocalCache(max_size=10, ttl=60)
+        listener = InvalidationListener(other, poll_timeout=0.1)
+        listener.start(redis)
+
+        try:
+            while not dict(await redis.pubsub_numsub(INVALIDATION_CHANNEL)).get(INVALIDATION_CHANNEL.encode()):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+            other.set(key, b'')
+
+            await CacheService(await get_redis()).cache_invalidate(key)
+            for _ in range(50):
+                if key not in other.data:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert key not in other.data
+            assert local_cache.get(key) is None
+        finally:
+            await listener.stop()
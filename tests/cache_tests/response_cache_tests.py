@@ -0,0 +1,74 @@
+import uuid
+
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+
+from src.api.keys_for_cache_invalidation import DETAIL_MENU, RESPONSE
+from src.cache.core import get_redis_instance
+
+
+class TestResponseCache:
+    """Encoded responses are served from cache and dropped by invalidation."""
+
+    async def test_menu_create_for_response_cache_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of the response cache."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_detail_response_cached(
+            self,
+            get_app: FastAPI,
+            client: AsyncClient,
+            get_menu_id: uuid.UUID,
+    ):
+        """Test that the detail response is stored and served as it was sent."""
+
+        url = get_app.url_path_for('get_detail_menu', menu_id=get_menu_id)
+        redis = await get_redis_instance()
+
+        first = await client.get(url)
+
+        assert await redis.exists(RESPONSE.format(DETAIL_MENU.format(get_menu_id)))
+
+        second = await client.get(url)
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers['content-type'] == first.headers['content-type']
+
+    async def test_detail_response_invalidated_by_update(
+            self,
+            get_app: FastAPI,
+            client: AsyncClient,
+            get_menu_id: uuid.UUID,
+            update_menu_response: Response,
+            update_menu_data: dict[str, str],
+    ):
+        """Test that the update drops the cached detail response."""
+
+        redis = await get_redis_instance()
+
+        assert update_menu_response.status_code == 200
+        assert not await redis.exists(RESPONSE.format(DETAIL_MENU.format(get_menu_id)))
+
+        menu = await client.get(get_app.url_path_for('get_detail_menu', menu_id=get_menu_id))
+
+        assert menu.json()['title'] == update_menu_data['title']
+
+    async def test_list_response_keeps_cursor_header(
+            self,
+            get_app: FastAPI,
+            client: AsyncClient,
+    ):
+        """Test that headers set by the endpoint are served from cache too."""
+
+        url = get_app.url_path_for('get_list_menu')
+
+        first = await client.get(url, params={'limit': 1})
+        second = await client.get(url, params={'limit': 1})
+
+        assert second.content == first.content
+        assert second.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
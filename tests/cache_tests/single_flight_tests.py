@@ -0,0 +1,76 @@
+import asyncio
+import uuid
+
+from src.api.keys_for_cache_invalidation import LOCK
+from src.cache.core import get_redis_instance
+from src.cache.local import redis_stats
+from src.cache.service import CacheService
+
+
+class Loader:
+    """Slow loader counting its calls."""
+
+    def __init__(self, value: list):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self) -> list:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+
+        return self.value
+
+
+class TestSingleFlight:
+    """Concurrent misses of one key are loaded once."""
+
+    async def test_concurrent_misses_loaded_once(self, redis_cache: CacheService):
+        """Test that concurrent misses in the process await one load."""
+
+        key = f'single_flight:{uuid.uuid4()}'
+        loader = Loader([1, 2, 3])
+
+        values = await asyncio.gather(*(redis_cache.get_or_load(key, loader) for _ in range(10)))
+
+        assert loader.calls == 1
+        assert all(value == [1, 2, 3] for value in values)
+        assert not await (await get_redis_instance()).exists(LOCK.format(key))
+
+        await redis_cache.cache_invalidate(key)
+
+    async def test_miss_waits_for_other_process(self, redis_cache: CacheService):
+        """Test that the miss waits for the key loaded under the lock of another process, counted as one miss."""
+
+        key = f'single_flight:{uuid.uuid4()}'
+        loader = Loader([1])
+        redis = await get_redis_instance()
+
+        await redis.set(LOCK.format(key), 'other', ex=5)
+        misses, hits = redis_stats.misses, redis_stats.hits
+
+        async def load_in_other_process():
+            await asyncio.sleep(0.1)
+            await redis_cache.set_value_into_cache(key, [2])
+            await redis.delete(LOCK.format(key))
+
+        _, value = await asyncio.gather(load_in_other_process(), redis_cache.get_or_load(key, loader))
+
+        assert value == [2]
+        assert loader.calls == 0
+        assert (redis_stats.misses - misses, redis_stats.hits - hits) == (1, 0)
+
+        await redis_cache.cache_invalidate(key)
+
+    async def test_failed_load_raised_for_every_miss(self, redis_cache: CacheService):
+        """Test that the error of the load is raised for every waiting miss and is not cached."""
+
+        key = f'single_flight:{uuid.uuid4()}'
+
+        async def loader():
+            await asyncio.sleep(0.05)
+            raise ValueError(key)
+
+        errors = await asyncio.gather(*(redis_cache.get_or_load(key, loader) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert await redis_cache.get_obj_from_cache(key) is None
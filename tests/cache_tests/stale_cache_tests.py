@@ -0,0 +1,87 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.api.keys_for_cache_invalidation import DETAIL_DISH, LIST_PAGE, MENUS_LIST, RESPONSE, TTL, get_ttl
+from src.cache.core import get_redis_instance
+from src.cache.service import CacheService
+from src.config import settings
+
+
+async def set_stale(cache: CacheService, key: str, value: list) -> None:
+    """Cache value with TTL left shorter than its stale part."""
+
+    ttl = get_ttl(key)
+    await cache.set_value_into_cache(key, value, ex=ttl.hard - ttl.soft - 1)
+
+
+class TestStaleCache:
+    """Stale values are served while they are refreshed in background."""
+
+    async def test_ttl_of_key_family(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that TTL is taken by the key family and responses are kept while data is fresh."""
+
+        monkeypatch.setattr(settings, 'CACHE_TTLS', {'menus': (5, 50)})
+        dish_key = DETAIL_DISH.format(uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+        default = settings.REDIS_CACHE_EXPIRE
+
+        assert get_ttl(LIST_PAGE.format(MENUS_LIST, 100, '')) == TTL(5, 50)
+        assert get_ttl(RESPONSE.format(MENUS_LIST)) == TTL(5, 5)
+        assert get_ttl(dish_key) == TTL(default, default + settings.CACHE_STALE_TTL)
+
+    async def test_stale_value_served_and_refreshed(self, redis_cache: CacheService):
+        """Test that the stale value is returned at once and replaced by background refresh."""
+
+        key = f'stale:{uuid.uuid4()}'
+        await set_stale(redis_cache, key, [1])
+
+        async def refresh():
+            return [2]
+
+        value = await redis_cache.get_or_load(key, refresh, refresh=refresh)
+
+        assert value == [1]
+        assert redis_cache.served_stale
+
+        for _ in range(50):
+            if await redis_cache.get_obj_from_cache(key) == [2]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await redis_cache.get_obj_from_cache(key) == [2]
+
+        await redis_cache.cache_invalidate(key)
+
+    async def test_stale_value_dropped_when_refresh_is_empty(self, redis_cache: CacheService):
+        """Test that the stale value is deleted when its data is gone, not kept till the hard TTL."""
+
+        key = f'stale:{uuid.uuid4()}'
+        await set_stale(redis_cache, key, [1])
+
+        async def refresh():
+            return None
+
+        assert await redis_cache.get_or_load(key, refresh, refresh=refresh) == [1]
+
+        for _ in range(50):
+            if not await (await get_redis_instance()).exists(key):
+                break
+            await asyncio.sleep(0.01)
+
+        assert not await (await get_redis_instance()).exists(key)
+        assert await redis_cache.get_obj_from_cache(key) is None
+
+    async def test_stale_value_without_refresh_is_miss(self, redis_cache: CacheService):
+        """Test that the stale value is loaded again when it can not be refreshed in background."""
+
+        key = f'stale:{uuid.uuid4()}'
+        await set_stale(redis_cache, key, [1])
+
+        async def loader():
+            return [2]
+
+        assert await redis_cache.get_or_load(key, loader) == [2]
+        assert not redis_cache.served_stale
+
+        await redis_cache.cache_invalidate(key)
@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from src.api.app import app
 from src.config import settings
@@ -12,14 +12,16 @@ from src.db.models import Base
 pytest_plugins = (
     'tests.fixtures.menu_fixtures,'
     'tests.fixtures.submenu_fixtures,'
-    'tests.fixtures.dish_fixtures'
+    'tests.fixtures.dish_fixtures,'
+    'tests.fixtures.query_plan_fixtures,'
+    'tests.fixtures.cache_fixtures'
 )
 
 async_test_engine = create_async_engine(
     url=settings.DATABASE_URL,
 )
 
-async_test_session = AsyncSession(
+async_test_session = async_sessionmaker(
     bind=async_test_engine,
     expire_on_commit=False
 )
@@ -28,7 +30,7 @@ Base.metadata.bind = async_test_engine
 
 
 async def override_get_db():
-    async with async_test_session as session:
+    async with async_test_session() as session:
         yield session
 
 
@@ -62,3 +64,8 @@ async def client():
 @pytest.fixture
 def get_app():
     return app
+
+
+@pytest.fixture(scope='class')
+def get_engine():
+    return async_test_engine
@@ -0,0 +1,102 @@
+import uuid
+
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.db import models
+from src.db.counters import recalculate_counters
+
+
+class TestDishBatchAPI:
+    """Dish batch API tests."""
+
+    async def test_menu_create_for_dish_batch_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of the dish batch."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_dish_batch_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of the dish batch."""
+
+        assert create_submenu_response.status_code == 201
+
+    async def test_dishes_batch_create_successful(
+            self,
+            create_dishes_batch_response: Response,
+            create_dishes_batch_data: list[dict[str, str]],
+    ):
+        """Test the successful creation of several dishes at once."""
+
+        assert create_dishes_batch_response.status_code == 201
+        assert (
+            create_dishes_batch_response.headers.get(
+                'content-type') == 'application/json'
+        )
+        titles = [dish.get('title') for dish in create_dishes_batch_response.json()]
+
+        assert titles == [dish.get('title') for dish in create_dishes_batch_data]
+
+    async def test_get_list_of_dishes_after_batch_create(
+            self,
+            dish_list_response: Response,
+            create_dishes_batch_data: list[dict[str, str]],
+    ):
+        """Test for getting a list of dishes after batch creation."""
+
+        assert dish_list_response.status_code == 200
+        assert len(dish_list_response.json()) == len(create_dishes_batch_data)
+
+    async def test_get_menu_detail_after_batch_create(
+            self,
+            detail_menu_response: Response,
+            create_dishes_batch_data: list[dict[str, str]],
+    ):
+        """Test of menu counters after batch creation of dishes."""
+
+        assert detail_menu_response.status_code == 200
+        assert detail_menu_response.json().get('dishes_count') == len(create_dishes_batch_data)
+
+    async def test_repair_counters_after_batch_create(
+            self,
+            get_engine: AsyncEngine,
+            get_menu_id: uuid.UUID,
+            create_dishes_batch_data: list[dict[str, str]],
+    ):
+        """Test that repair restores broken counters of the menu and its submenus."""
+
+        async with get_engine.begin() as conn:
+            await conn.execute(update(models.Submenu).values(dishes_count=0))
+            await conn.execute(update(models.Menu).values(submenus_count=0, dishes_count=0))
+
+        async with AsyncSession(bind=get_engine) as session:
+            await recalculate_counters(session)
+            menu = await session.get(models.Menu, get_menu_id)
+
+        assert menu.submenus_count == 1
+        assert menu.dishes_count == len(create_dishes_batch_data)
+
+    async def test_dishes_batch_create_empty(
+            self,
+            client: AsyncClient,
+            get_app: FastAPI,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+    ):
+        """Test that an empty batch is rejected."""
+
+        url = get_app.url_path_for(
+            'create_dishes_batch',
+            menu_id=get_menu_id,
+            submenu_id=get_submenu_id
+        )
+        response = await client.post(url, json=[], follow_redirects=True)
+
+        assert response.status_code == 422
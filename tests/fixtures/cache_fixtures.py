@@ -0,0 +1,12 @@
+import pytest
+
+from src.cache.cache import get_redis
+from src.cache.local import LocalCache
+from src.cache.service import CacheService
+
+
+@pytest.fixture
+async def redis_cache() -> CacheService:
+    """Cache service without local cache, so every read reaches Redis."""
+
+    return CacheService(await get_redis(), local=LocalCache(max_size=0, ttl=0))
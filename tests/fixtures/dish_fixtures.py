@@ -63,6 +63,31 @@ async def create_dish_response(
     return dish
 
 
+@pytest.fixture
+async def create_dishes_batch_response(
+        get_app: FastAPI,
+        client: AsyncClient,
+        get_submenu_id: uuid.UUID,
+        get_menu_id: uuid.UUID,
+        create_dishes_batch_data: list[dict[str, str]],
+) -> Response:
+    """Request to create several dishes at once."""
+
+    url = get_app.url_path_for(
+        'create_dishes_batch',
+        menu_id=get_menu_id,
+        submenu_id=get_submenu_id
+    )
+
+    dishes = await client.post(
+        url,
+        json=create_dishes_batch_data,
+        follow_redirects=True
+    )
+
+    return dishes
+
+
 @pytest.fixture
 async def detail_dish_response(
         client: AsyncClient,
@@ -189,6 +214,20 @@ def create_dish_data_second() -> dict[str, str]:
     }
 
 
+@pytest.fixture
+def create_dishes_batch_data() -> list[dict[str, str]]:
+    """Data for create of several dishes at once."""
+
+    return [
+        {
+            'title': f'My batch dish {number}',
+            'description': f'My batch dish description {number}',
+            'price': '10.50'
+        }
+        for number in range(3)
+    ]
+
+
 @pytest.fixture
 def update_dish_data() -> dict[str, str]:
     """Data for update of dish."""
@@ -18,6 +18,32 @@ async def all_data_response(
     return data
 
 
+@pytest.fixture
+async def all_data_stream_response(
+        get_app: FastAPI,
+        client: AsyncClient
+) -> Response:
+    """Request to stream all data as JSON array."""
+
+    url = get_app.url_path_for('stream_all_detail_data')
+    data = await client.get(url, follow_redirects=True)
+
+    return data
+
+
+@pytest.fixture
+async def all_data_ndjson_response(
+        get_app: FastAPI,
+        client: AsyncClient
+) -> Response:
+    """Request to stream all data as NDJSON."""
+
+    url = get_app.url_path_for('stream_all_detail_data')
+    data = await client.get(url, headers={'Accept': 'application/x-ndjson'}, follow_redirects=True)
+
+    return data
+
+
 @pytest.fixture
 async def menus_list_response(
         get_app: FastAPI,
@@ -123,6 +149,23 @@ async def non_existent_menu_response(
     return menu
 
 
+@pytest.fixture
+async def update_non_existent_menu_response(
+        client: AsyncClient,
+        get_app: FastAPI,
+        update_menu_data: dict[str, str]
+) -> Response:
+    """Request to update a non-existent menu."""
+
+    url = get_app.url_path_for(
+        'update_menu',
+        menu_id='5372d4ba-1e98-4b37-b1fe-000000000000'
+    )
+    menu = await client.patch(url, json=update_menu_data, follow_redirects=True)
+
+    return menu
+
+
 @pytest.fixture
 def response_all_data(
         all_data_response: Response,
@@ -0,0 +1,60 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db import models
+
+MENUS = 2000
+SUBMENUS_PER_MENU = 5
+DISHES_PER_SUBMENU = 4
+
+
+@pytest.fixture(scope='class')
+async def seeded_ids(get_engine: AsyncEngine) -> dict[str, uuid.UUID]:
+    """Fill DB with large dataset and return ids of one dish branch."""
+
+    menus, submenus, dishes = [], [], []
+
+    for menu_number in range(MENUS):
+        menu_id = uuid.uuid4()
+        menus.append({'id': menu_id, 'title': f'menu {menu_number}', 'description': 'menu'})
+
+        for submenu_number in range(SUBMENUS_PER_MENU):
+            submenu_id = uuid.uuid4()
+            submenus.append({
+                'id': submenu_id,
+                'title': f'submenu {menu_number}.{submenu_number}',
+                'description': 'submenu',
+                'menu_id': menu_id,
+            })
+
+            for dish_number in range(DISHES_PER_SUBMENU):
+                dishes.append({
+                    'id': uuid.uuid4(),
+                    'title': f'dish {menu_number}.{submenu_number}.{dish_number}',
+                    'description': 'dish',
+                    'price': Decimal('10.50'),
+                    'submenu_id': submenu_id,
+                    'menu_id': menu_id,
+                })
+
+    async with get_engine.begin() as conn:
+        await conn.execute(text('ALTER TABLE submenus DISABLE TRIGGER USER'))
+        await conn.execute(text('ALTER TABLE dishes DISABLE TRIGGER USER'))
+        await conn.execute(insert(models.Menu), menus)
+        await conn.execute(insert(models.Submenu), submenus)
+        await conn.execute(insert(models.Dish), dishes)
+        await conn.execute(text('ALTER TABLE submenus ENABLE TRIGGER USER'))
+        await conn.execute(text('ALTER TABLE dishes ENABLE TRIGGER USER'))
+
+    async with get_engine.begin() as conn:
+        await conn.execute(text('ANALYZE menus, submenus, dishes'))
+
+    return {
+        'menu_id': submenus[-1]['menu_id'],
+        'submenu_id': submenus[-1]['id'],
+        'dish_id': dishes[-1]['id'],
+    }
@@ -1,3 +1,4 @@
+import json
 import uuid
 
 from httpx import Response
@@ -90,6 +91,30 @@ class TestMenuAPI:
         assert all_data_response.json()[0].get('title') == create_menu_data['title']
         assert all_data_response.json()[0].get('description') == create_menu_data['description']
 
+    async def test_stream_all_data_after_create_menu(
+            self,
+            all_data_response: Response,
+            all_data_stream_response: Response,
+    ):
+        """Test that streamed data is the same as all data."""
+
+        assert all_data_stream_response.status_code == 200
+        assert all_data_stream_response.headers.get('content-type') == 'application/json'
+        assert all_data_stream_response.json() == all_data_response.json()
+
+    async def test_stream_all_data_as_ndjson_after_create_menu(
+            self,
+            all_data_response: Response,
+            all_data_ndjson_response: Response,
+    ):
+        """Test that NDJSON stream has one menu per line."""
+
+        menus = [json.loads(line) for line in all_data_ndjson_response.text.splitlines()]
+
+        assert all_data_ndjson_response.status_code == 200
+        assert all_data_ndjson_response.headers.get('content-type') == 'application/x-ndjson'
+        assert menus == all_data_response.json()
+
     async def test_get_menu_detail_successful(
             self,
             detail_menu_response: Response,
@@ -232,3 +257,12 @@ class TestMenuAPI:
 
         assert non_existent_menu_response.json().get('detail') == 'menu not found'
         assert non_existent_menu_response.status_code == 404
+
+    async def test_update_non_existent_menu(
+            self,
+            update_non_existent_menu_response: Response
+    ):
+        """Test to check updating a non-existent menu."""
+
+        assert update_non_existent_menu_response.json().get('detail') == 'menu not found'
+        assert update_non_existent_menu_response.status_code == 404
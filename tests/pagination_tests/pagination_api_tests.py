@@ -0,0 +1,83 @@
+import uuid
+
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+
+from src.api.pagination import NEXT_CURSOR_HEADER
+
+
+class TestPaginationAPI:
+    """Keyset pagination API tests."""
+
+    async def test_menu_create_for_pagination_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of pagination."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_pagination_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of pagination."""
+
+        assert create_submenu_response.status_code == 201
+
+    async def test_dishes_create_for_pagination_tests(
+            self,
+            create_dishes_batch_response: Response,
+    ):
+        """Test creating several dishes for further testing of pagination."""
+
+        assert create_dishes_batch_response.status_code == 201
+
+    async def test_get_pages_of_dishes(
+            self,
+            client: AsyncClient,
+            get_app: FastAPI,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+            create_dishes_batch_data: list[dict[str, str]],
+    ):
+        """Test for walking through pages of dishes by cursor."""
+
+        url = get_app.url_path_for(
+            'get_list_dish',
+            menu_id=get_menu_id,
+            submenu_id=get_submenu_id
+        )
+        first_page = await client.get(url, params={'limit': 2}, follow_redirects=True)
+        cursor = first_page.headers.get(NEXT_CURSOR_HEADER)
+        second_page = await client.get(url, params={'limit': 2, 'after': cursor}, follow_redirects=True)
+        all_dishes = await client.get(url, follow_redirects=True)
+
+        assert first_page.status_code == 200
+        assert len(first_page.json()) == 2
+        assert cursor
+        assert second_page.status_code == 200
+        assert len(second_page.json()) == len(create_dishes_batch_data) - 2
+        assert NEXT_CURSOR_HEADER not in second_page.headers
+        assert {dish.get('id') for dish in first_page.json() + second_page.json()} == {
+            dish.get('id') for dish in all_dishes.json()
+        }
+
+    async def test_get_dishes_with_invalid_cursor(
+            self,
+            client: AsyncClient,
+            get_app: FastAPI,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+    ):
+        """Test that an invalid cursor is rejected."""
+
+        url = get_app.url_path_for(
+            'get_list_dish',
+            menu_id=get_menu_id,
+            submenu_id=get_submenu_id
+        )
+        response = await client.get(url, params={'after': 'invalid'}, follow_redirects=True)
+
+        assert response.status_code == 400
+        assert response.json().get('detail') == 'invalid cursor'
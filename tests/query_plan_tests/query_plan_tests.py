@@ -0,0 +1,87 @@
+import json
+import uuid
+
+import pytest
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.compiler import compiles
+
+from src.api.repositories.dish import DishRepository
+from src.api.repositories.menu import MenuRepository
+from src.api.repositories.submenu import SubmenuRepository
+from src.config import settings
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN of a statement."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def compile_explain(element, compiler, **kwargs):
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}'
+
+
+def find_seq_scans(plan: dict) -> list[str]:
+    """Get relations scanned sequentially in the plan."""
+
+    scans = [plan['Relation Name']] if plan['Node Type'] == 'Seq Scan' else []
+
+    for subplan in plan.get('Plans', []):
+        scans.extend(find_seq_scans(subplan))
+
+    return scans
+
+
+class TestQueryPlans:
+    """Hot path queries must use indexes on a large dataset."""
+
+    @pytest.mark.parametrize(
+        'statement, params', [
+            (MenuRepository.list_statement, ('limit',)),
+            (MenuRepository.list_after_statement, ('limit', 'after')),
+            (MenuRepository.detail_statement, ('menu_id',)),
+            (SubmenuRepository.list_statement, ('menu_id', 'limit')),
+            (SubmenuRepository.list_after_statement, ('menu_id', 'limit', 'after')),
+            (SubmenuRepository.detail_statement, ('menu_id', 'submenu_id')),
+            (DishRepository.list_statement, ('menu_id', 'submenu_id', 'limit')),
+            (DishRepository.list_after_statement, ('menu_id', 'submenu_id', 'limit', 'after')),
+            (DishRepository.detail_statement, ('menu_id', 'submenu_id', 'dish_id')),
+        ],
+        ids=[
+            'menus list',
+            'menus list after',
+            'menu detail',
+            'submenus list',
+            'submenus list after',
+            'submenu detail',
+            'dishes list',
+            'dishes list after',
+            'dish detail',
+        ]
+    )
+    async def test_no_seq_scan(
+            self,
+            get_engine: AsyncEngine,
+            seeded_ids: dict[str, uuid.UUID],
+            statement: Executable,
+            params: tuple[str],
+    ):
+        """Test that the query plan has no sequential scans."""
+
+        values = {**seeded_ids, 'limit': settings.PAGE_LIMIT, 'after': uuid.UUID(int=0)}
+
+        async with get_engine.connect() as conn:
+            result = await conn.execute(
+                Explain(statement),
+                {param: values[param] for param in params},
+            )
+
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        assert find_seq_scans(plan[0]['Plan']) == []
@@ -0,0 +1,88 @@
+import uuid
+
+import pytest
+from httpx import Response
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.api.repositories.dish import DishRepository
+from src.api.repositories.menu import MenuRepository
+from src.api.repositories.submenu import SubmenuRepository
+from src.config import settings
+from src.db.raw import fetch_raw
+
+
+class TestRawReads:
+    """Raw asyncpg reads return the same data as the ORM path."""
+
+    async def test_menu_create_for_raw_read_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of raw reads."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_raw_read_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of raw reads."""
+
+        assert create_submenu_response.status_code == 201
+
+    @pytest.mark.parametrize(
+        'create_dish_response', [
+            'create_dish_data',
+        ],
+        indirect=['create_dish_response']
+    )
+    async def test_dish_create_for_raw_read_tests(
+            self,
+            create_dish_response: Response,
+    ):
+        """Test creating a dish for further testing of raw reads."""
+
+        assert create_dish_response.status_code == 201
+
+    async def test_raw_reads_same_as_orm(
+            self,
+            get_engine: AsyncEngine,
+            get_menu_id: uuid.UUID,
+            get_submenu_id: uuid.UUID,
+            get_dish_id: uuid.UUID,
+            monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that every list and detail read gives the same rows in both modes."""
+
+        async def read_all(session: AsyncSession) -> list:
+            menu_repo, submenu_repo = MenuRepository(session), SubmenuRepository(session)
+            dish_repo = DishRepository(session)
+
+            return [
+                await menu_repo.get_list(limit=settings.PAGE_LIMIT),
+                await menu_repo.get_detail(get_menu_id),
+                await submenu_repo.get_list(menu_id=get_menu_id, limit=settings.PAGE_LIMIT),
+                await submenu_repo.get_detail(menu_id=get_menu_id, submenu_id=get_submenu_id),
+                await dish_repo.get_list(menu_id=get_menu_id, submenu_id=get_submenu_id, limit=settings.PAGE_LIMIT),
+                await dish_repo.get_detail(menu_id=get_menu_id, submenu_id=get_submenu_id, dish_id=get_dish_id),
+            ]
+
+        async with AsyncSession(bind=get_engine) as session:
+            orm = await read_all(session)
+
+        monkeypatch.setattr(settings, 'DB_RAW_READS', True)
+        async with AsyncSession(bind=get_engine) as session:
+            raw = await read_all(session)
+
+        assert all(orm)
+        assert raw == orm
+
+    async def test_raw_read_in_session_transaction(self, get_engine: AsyncEngine):
+        """Test that a raw read as the first statement runs in the transaction of the session."""
+
+        async with AsyncSession(bind=get_engine) as session:
+            first = await fetch_raw(session, select(text('txid_current()')), replica=False)
+            second = await session.scalar(text('SELECT txid_current()'))
+
+        assert first[0][0] == second
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+from httpx import Response
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.api.schemas import MenuInDB
+from src.db.tree import TREE_ASSEMBLERS, get_tree_assembler
+
+
+def normalize(tree: list) -> list[dict]:
+    """Tree as JSON data in a stable order, assemblers don't sort items."""
+
+    menus = [MenuInDB.model_validate(menu, from_attributes=True).model_dump(mode='json') for menu in tree]
+
+    for menu in menus:
+        for submenu in menu['submenus']:
+            submenu['dishes'].sort(key=lambda dish: dish['id'])
+        menu['submenus'].sort(key=lambda submenu: submenu['id'])
+
+    return sorted(menus, key=lambda menu: menu['id'])
+
+
+class TestTreeAssemblers:
+    """All tree assemblers build the same data."""
+
+    async def test_menu_create_for_tree_tests(
+            self,
+            create_menu_response: Response,
+    ):
+        """Test creating a menu for further testing of tree assemblers."""
+
+        assert create_menu_response.status_code == 201
+
+    async def test_submenu_create_for_tree_tests(
+            self,
+            create_submenu_response: Response,
+    ):
+        """Test creating a submenu for further testing of tree assemblers."""
+
+        assert create_submenu_response.status_code == 201
+
+    @pytest.mark.parametrize(
+        'create_dish_response', [
+            'create_dish_data',
+            'create_dish_data_second',
+        ],
+        indirect=['create_dish_response']
+    )
+    async def test_dish_create_for_tree_tests(
+            self,
+            create_dish_response: Response,
+    ):
+        """Test creating dishes for further testing of tree assemblers."""
+
+        assert create_dish_response.status_code == 201
+
+    @pytest.mark.parametrize('name', TREE_ASSEMBLERS)
+    async def test_assembler_builds_same_tree(
+            self,
+            get_engine: AsyncEngine,
+            all_data_response: Response,
+            name: str,
+    ):
+        """Test that the assembler builds the same tree as /get_all."""
+
+        async with AsyncSession(bind=get_engine) as session:
+            tree = await get_tree_assembler(name).assemble(session)
+
+        assert normalize(tree) == normalize(all_data_response.json())
+
+    async def test_tree_survives_pickle(
+            self,
+            get_engine: AsyncEngine,
+    ):
+        """Test that the tree is the same after the cache round trip."""
+
+        async with AsyncSession(bind=get_engine) as session:
+            tree = await get_tree_assembler('flat').assemble(session)
+
+        assert pickle.loads(pickle.dumps(tree)) == tree